@@ -44,7 +44,21 @@ class Settings(BaseSettings):
     chroma_host: str = "localhost"
     chroma_port: int = 8000
     chroma_persist_dir: str = "/chroma_data"
-    chroma_collection_name: str = "evaluation_memory"
+    # Inner-product space over L2-normalized vectors; the old cosine
+    # collection ("evaluation_memory") is copied over on first use
+    chroma_collection_name: str = "evaluation_memory_ip"
+    chroma_http_max_connections: int = 64
+    chroma_http_max_keepalive_connections: int = 32
+    chroma_http_keepalive_seconds: int = 30
+    # Background memory writer: flush at N queued evaluations or after T ms
+    memory_write_batch_size: int = 128
+    memory_write_max_wait_ms: int = 500
+    # Skip storing evaluations with meta score >= N and |primary gap| < G
+    memory_skip_min_meta_score: int = 4
+    memory_skip_max_primary_gap: float = 0.5
+    # query_past_mistakes diversity: fetch n * factor hits, keep n via MMR
+    memory_mmr_fetch_factor: int = 4
+    memory_mmr_lambda: float = 0.5
 
     # =====================================================
     # Application Settings
@@ -74,8 +88,30 @@ class Settings(BaseSettings):
     k_models: str = "mistralai/mistral-nemo,qwen/qwen-2.5-7b-instruct,deepseek/deepseek-chat,google/gemini-2.0-flash-001,openai/gpt-4o-mini,openai/gpt-3.5-turbo"
     # OpenRouter Configuration
     openrouter_base_url: str = "https://openrouter.ai/api/v1"
-    # Embedding model
+    # Embedding model (used when embedding_backend is "openai")
     embedding_model: str = "text-embedding-3-small"
+    # Vector memory embedder: "minilm" (local all-MiniLM-L6-v2, 384-d) or
+    # "openai" (embedding_model, 1536-d). Dimensions differ, so switching
+    # backends needs a fresh chroma_collection_name.
+    embedding_backend: str = "minilm"
+    # Shared HTTP connection pool for Claude/OpenRouter clients
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_timeout_seconds: int = 60
+
+    # =====================================================
+    # Caching
+    # =====================================================
+    # TTL for the /api/questions/pool/stats aggregate
+    pool_stats_cache_ttl_seconds: int = 30
+    # TTL-LRU for ChromaDB query_past_mistakes results
+    chroma_query_cache_ttl_seconds: int = 300
+    chroma_query_cache_maxsize: int = 512
+    # SHA-256-keyed LRU of text embeddings (shared process-wide)
+    embedding_cache_maxsize: int = 4096
+    # Question pool usage counters: flush every T ms or at N pending questions
+    pool_usage_flush_interval_ms: int = 2000
+    pool_usage_flush_max_pending: int = 256
 
     # =====================================================
     # CORS Settings
@@ -91,6 +127,11 @@ class Settings(BaseSettings):
     max_chat_turns: int = 15
     # Number of recent messages to include in LLM context - AD-4
     chat_history_window: int = 6
+    # Token budget for the chat history in the coach prompt (newest first)
+    chat_history_max_tokens: int = 4000
+    # Coalesce up to N streamed tokens (or max_wait_ms of tokens) per SSE frame
+    coach_stream_batch_size: int = 4
+    coach_stream_max_wait_ms: int = 20
     # Anchor character length for evidence verification - AD-2
     evidence_anchor_len: int = 25
     # Search tolerance window for anchor tail search - AD-2
@@ -129,13 +170,35 @@ class Settings(BaseSettings):
             )
         return v_lower
 
+    @field_validator("embedding_backend")
+    @classmethod
+    def validate_embedding_backend(cls, v: str) -> str:
+        """Validate embedding backend is minilm or openai."""
+        valid_backends = ["minilm", "openai"]
+        v_lower = v.lower()
+        if v_lower not in valid_backends:
+            raise ValueError(
+                f"embedding_backend must be one of {valid_backends}, got '{v}'"
+            )
+        return v_lower
+
     @field_validator("reload")
     @classmethod
     def validate_reload(cls, v: bool) -> bool:
         """Validate reload setting."""
         return v
 
-    @field_validator("max_chat_turns", "chat_history_window", "evidence_anchor_len", "evidence_search_window")
+    @field_validator(
+        "max_chat_turns", "chat_history_window", "chat_history_max_tokens", "evidence_anchor_len", "evidence_search_window",
+        "http_max_connections", "http_max_keepalive_connections", "http_timeout_seconds",
+        "pool_stats_cache_ttl_seconds", "chroma_query_cache_ttl_seconds",
+        "chroma_query_cache_maxsize", "chroma_http_max_connections",
+        "chroma_http_max_keepalive_connections", "chroma_http_keepalive_seconds",
+        "memory_write_batch_size", "memory_write_max_wait_ms",
+        "memory_skip_min_meta_score", "embedding_cache_maxsize",
+        "pool_usage_flush_interval_ms", "pool_usage_flush_max_pending",
+        "memory_mmr_fetch_factor", "coach_stream_batch_size", "coach_stream_max_wait_ms",
+    )
     @classmethod
     def validate_positive_int(cls, v: int) -> int:
         """Validate integer settings are positive."""
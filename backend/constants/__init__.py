@@ -5,19 +5,24 @@ from backend.constants.metrics import (
     SLUG_DISPLAY_MAP,
     ALL_METRIC_SLUGS,
     ALL_METRIC_NAMES,
+    VALID_METRIC_SLUGS,
     display_name_to_slug,
     slug_to_display_name,
     is_valid_slug,
     is_valid_display_name,
 )
+from backend.constants.snapshot import SNAPSHOT_STATUS_VALUES, SnapshotStatus
 
 __all__ = [
     "METRIC_SLUG_MAP",
     "SLUG_DISPLAY_MAP",
     "ALL_METRIC_SLUGS",
     "ALL_METRIC_NAMES",
+    "VALID_METRIC_SLUGS",
     "display_name_to_slug",
     "slug_to_display_name",
     "is_valid_slug",
     "is_valid_display_name",
+    "SnapshotStatus",
+    "SNAPSHOT_STATUS_VALUES",
 ]
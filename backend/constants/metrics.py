@@ -3,7 +3,7 @@
 Reference: AD-6 (Slug-Based Metric Keys) from NEW_FEATURES.md
 """
 
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
 
 # =====================================================
 # Core Mappings
@@ -28,6 +28,7 @@ SLUG_DISPLAY_MAP: Dict[str, str] = {v: k for k, v in METRIC_SLUG_MAP.items()}
 
 ALL_METRIC_SLUGS: List[str] = sorted(METRIC_SLUG_MAP.values())
 ALL_METRIC_NAMES: List[str] = sorted(METRIC_SLUG_MAP.keys())
+VALID_METRIC_SLUGS: FrozenSet[str] = frozenset(METRIC_SLUG_MAP.values())
 
 # =====================================================
 # Helper Functions
@@ -50,7 +51,7 @@ def slug_to_display_name(slug: str) -> str:
 
 def is_valid_slug(slug: str) -> bool:
     """Check if slug is valid."""
-    return slug in METRIC_SLUG_MAP.values()
+    return slug in VALID_METRIC_SLUGS
 
 
 def is_valid_display_name(name: str) -> bool:
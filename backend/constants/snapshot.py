@@ -0,0 +1,23 @@
+"""MentorMind - Snapshot Status Constants
+
+Single source of truth for the snapshot_status PostgreSQL ENUM
+(schemas/00_enums.sql), shared by the ORM model and API schemas.
+"""
+
+from enum import Enum
+from typing import Tuple
+
+# =====================================================
+# Snapshot Status
+# =====================================================
+
+
+class SnapshotStatus(str, Enum):
+    """Snapshot lifecycle status (mirrors the snapshot_status ENUM)."""
+
+    ACTIVE = "active"
+    COMPLETED = "completed"
+    ARCHIVED = "archived"
+
+
+SNAPSHOT_STATUS_VALUES: Tuple[str, ...] = tuple(s.value for s in SnapshotStatus)
@@ -8,15 +8,19 @@ all middleware, routers, and event handlers.
 from contextlib import asynccontextmanager
 import time
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.config.logging_config import setup_logging, get_logger
 from backend.config.settings import settings
 from backend.middleware.logging_middleware import RequestLoggingMiddleware
-from backend.models.database import test_database_connection, engine, get_pool_status
+from backend.models.database import test_database_connection, engine, get_pool_status, dispose_async_engine
 from backend.routers import questions, evaluations, stats, snapshots, coach
-from backend.services.chromadb_service import chromadb_service
+from backend.services.chromadb_service import ChromaDBService, get_chromadb_service
+from backend.services.embeddings import MINILM_MODEL_NAME
+from backend.services.http_client import close_async_http_client
+from backend.tasks.memory_writer import start_memory_writer, stop_memory_writer
+from backend.tasks.pool_usage import start_pool_usage_flusher, stop_pool_usage_flusher
 
 # =====================================================
 # Configure Logging
@@ -37,10 +41,16 @@ async def lifespan(app: FastAPI):
     - Log application start
     - Log environment configuration
     - Test database connection
+    - Start background ChromaDB memory writer
+    - Start question pool usage flusher
 
     Shutdown:
     - Log application shutdown
+    - Flush and stop memory writer
+    - Flush and stop pool usage flusher
+    - Close ChromaDB HTTP clients
     - Close database connections
+    - Close shared HTTP clients
     """
     # Startup
     logger.info("=" * 60)
@@ -61,12 +71,20 @@ async def lifespan(app: FastAPI):
     logger.info(f"K Models: {settings.k_models_list}")
     logger.info("=" * 60)
 
+    start_memory_writer()
+    start_pool_usage_flusher()
+
     yield
 
     # Shutdown
     logger.info("Shutting down MentorMind API...")
+    await stop_memory_writer()
+    await stop_pool_usage_flusher()
+    get_chromadb_service().close()
     engine.dispose()
+    await dispose_async_engine()
     logger.info("Database connections closed")
+    await close_async_http_client()
     logger.info("=" * 60)
 
 
@@ -152,7 +170,9 @@ async def root() -> dict:
 # Health Check Endpoint
 # =====================================================
 @app.get("/health", tags=["Health"])
-async def health_check() -> dict:
+async def health_check(
+    chromadb_service: ChromaDBService = Depends(get_chromadb_service)
+) -> dict:
     """
     Health check endpoint.
 
@@ -160,7 +180,7 @@ async def health_check() -> dict:
     Database and ChromaDB connections are tested on each request.
     """
     db_connected = test_database_connection()
-    chromadb_connected = chromadb_service.test_connection()
+    chromadb_connected = await chromadb_service.atest_connection()
 
     return {
         "status": "healthy" if db_connected and chromadb_connected else "degraded",
@@ -174,7 +194,9 @@ async def health_check() -> dict:
 # Detailed Health Check Endpoint
 # =====================================================
 @app.get("/health/detailed", tags=["Health"])
-async def health_check_detailed() -> dict:
+async def health_check_detailed(
+    chromadb_service: ChromaDBService = Depends(get_chromadb_service)
+) -> dict:
     """
     Detailed health check endpoint.
 
@@ -186,8 +208,8 @@ async def health_check_detailed() -> dict:
     db_latency = (time.time() - start_time) * 1000
 
     # ChromaDB status - direct service call (no database.py dependency)
-    if chromadb_service.test_connection():
-        chroma_count = chromadb_service.get_collection_count()
+    if await chromadb_service.atest_connection():
+        chroma_count = await chromadb_service.aget_collection_count()
         chroma_status = {
             "status": "connected",
             "collection": chromadb_service.collection_name,
@@ -240,7 +262,11 @@ if settings.environment == "development":
                 "claude": settings.claude_model,
                 "judge": settings.judge_model,
                 "k_models": settings.k_models_list,
-                "embedding": settings.embedding_model,
+                "embedding": (
+                    settings.embedding_model
+                    if settings.embedding_backend == "openai"
+                    else MINILM_MODEL_NAME
+                ),
             },
             "cors_origins": settings.cors_origins_list,
             "logging": {
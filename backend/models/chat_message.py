@@ -8,7 +8,7 @@ is_complete enables SSE reconnection with Update-In-Place pattern.
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Text, Integer, Boolean
+from sqlalchemy import String, Text, Integer, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -126,6 +126,20 @@ class ChatMessage(Base):
     created_at: Mapped[datetime] = mapped_column(default=datetime.now)
     """Timestamp when message was created"""
 
+    # =====================================================
+    # Table Indexes (mirror schemas/09_chat_messages.sql)
+    # =====================================================
+
+    __table_args__ = (
+        # Chat history: WHERE snapshot_id = ? ORDER BY created_at LIMIT N
+        # is served by an index range scan instead of a sort
+        Index(
+            "idx_chat_messages_snapshot_created",
+            "snapshot_id",
+            text("created_at DESC"),
+        ),
+    )
+
     # =====================================================
     # Properties
     # =====================================================
@@ -6,11 +6,12 @@ session management, and FastAPI dependency injection.
 """
 
 import logging
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
-from sqlalchemy import create_engine, pool, text
+from sqlalchemy import Engine, create_engine, pool, text
 from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from backend.config.settings import settings
 
@@ -20,7 +21,7 @@ logger = logging.getLogger(__name__)
 # Import Database Configuration
 # =====================================================
 
-from backend.config.database import DATABASE_URL, POOL_SETTINGS, ENGINE_SETTINGS
+from backend.config.database import ASYNC_DATABASE_URL, DATABASE_URL, POOL_SETTINGS, ENGINE_SETTINGS
 
 # =====================================================
 # Database Engine Configuration
@@ -33,6 +34,29 @@ engine = create_engine(
     **ENGINE_SETTINGS,
 )
 
+# =====================================================
+# Script Engine (one-shot CLI workloads)
+# =====================================================
+
+def create_script_engine() -> Engine:
+    """
+    Create a short-lived engine for CLI scripts.
+
+    Uses NullPool (connections close on release, nothing idles in a pool)
+    and skips the pre-ping SELECT 1, which only pays off for long-lived
+    pooled connections. Statement timeout is disabled for migrations.
+
+    Returns:
+        Engine: Unpooled engine; call dispose() when the script is done
+    """
+    return create_engine(
+        DATABASE_URL,
+        poolclass=pool.NullPool,
+        pool_pre_ping=False,
+        connect_args={"options": "-c statement_timeout=0"},
+        **ENGINE_SETTINGS,
+    )
+
 # =====================================================
 # Session Factory
 # =====================================================
@@ -84,6 +108,69 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+
+# =====================================================
+# Async Engine (asyncpg) - Lazy
+# =====================================================
+
+# Created on first use so the sync-only paths (scripts, tests) do not need
+# the asyncpg driver installed.
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get (or lazily create) the asyncpg-backed engine.
+
+    Returns:
+        AsyncEngine sharing the sync engine's pool and engine settings
+    """
+    global _async_engine, _async_session_factory
+
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            ASYNC_DATABASE_URL,
+            **POOL_SETTINGS,
+            **ENGINE_SETTINGS,
+        )
+        _async_session_factory = async_sessionmaker(
+            bind=_async_engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_engine
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for async database sessions.
+
+    Usage in endpoints:
+        @router.get("/pool/stats")
+        async def get_pool_stats(db: AsyncSession = Depends(get_async_db)):
+            rows = (await db.execute(select(Question))).scalars().all()
+    """
+    get_async_engine()
+    async with _async_session_factory() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"Async database transaction failed: {e}", exc_info=True)
+            raise
+
+
+async def dispose_async_engine() -> None:
+    """Dispose the async engine if it was created."""
+    global _async_engine, _async_session_factory
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+
 # =====================================================
 # Database Connection Testing
 # =====================================================
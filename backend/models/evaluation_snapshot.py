@@ -12,6 +12,7 @@ from sqlalchemy import String, Text, Integer, Boolean, Float
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import JSONB, ENUM
 
+from backend.constants.snapshot import SNAPSHOT_STATUS_VALUES
 from backend.models.database import Base
 
 if TYPE_CHECKING:
@@ -222,7 +223,7 @@ class EvaluationSnapshot(Base):
     # =====================================================
 
     status: Mapped[str] = mapped_column(
-        ENUM("active", "completed", "archived", name="snapshot_status", create_type=False)
+        ENUM(*SNAPSHOT_STATUS_VALUES, name="snapshot_status", create_type=False)
     )
     """
     Snapshot status for Coach Chat lifecycle:
@@ -11,7 +11,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
-from backend.constants.metrics import ALL_METRIC_SLUGS, is_valid_slug
+from backend.constants.metrics import ALL_METRIC_SLUGS, VALID_METRIC_SLUGS
+from backend.constants.snapshot import SNAPSHOT_STATUS_VALUES
 
 
 # =====================================================
@@ -436,8 +437,8 @@ class EvidenceByMetric(BaseModel):
 # Snapshot Schemas (Coach Chat & Evidence)
 # =====================================================
 
-VALID_SNAPSHOT_STATUSES = ["active", "completed", "archived"]
-"""Valid snapshot status values"""
+VALID_SNAPSHOT_STATUSES = list(SNAPSHOT_STATUS_VALUES)
+"""Valid snapshot status values (generated from SnapshotStatus)"""
 
 
 class SnapshotBase(BaseModel):
@@ -506,9 +507,20 @@ class SnapshotListResponse(BaseModel):
     """Paginated list of snapshots."""
 
     items: list[SnapshotListItem] = Field(..., description="Snapshot items")
-    total: int = Field(..., description="Total number of snapshots")
+    total: Optional[int] = Field(
+        None,
+        description="Total number of snapshots (None on keyset pages; use the first page's total)"
+    )
     page: int = Field(..., ge=1, description="Current page number")
     per_page: int = Field(..., ge=1, description="Items per page")
+    next_before: Optional[datetime] = Field(
+        None,
+        description="Pass as 'before' to fetch the next page (keyset pagination)"
+    )
+    next_before_id: Optional[str] = Field(
+        None,
+        description="Pass as 'before_id' together with next_before (tiebreak for equal timestamps)"
+    )
 
 
 # =====================================================
@@ -534,11 +546,11 @@ def validate_metric_slugs(v: list[str]) -> list[str]:
     """
     if len(v) > 3:
         raise ValueError("selected_metrics can have at most 3 items")
-    for slug in v:
-        if not is_valid_slug(slug):
-            raise ValueError(
-                f"Invalid metric slug: '{slug}'. Valid slugs: {ALL_METRIC_SLUGS}"
-            )
+    invalid = set(v) - VALID_METRIC_SLUGS
+    if invalid:
+        raise ValueError(
+            f"Invalid metric slug(s): {sorted(invalid)}. Valid slugs: {ALL_METRIC_SLUGS}"
+        )
     return v
 
 
@@ -8,7 +8,7 @@ User's evaluation of model responses.
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Boolean
+from sqlalchemy import String, Boolean, FetchedValue
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -39,11 +39,13 @@ class UserEvaluation(Base):
     __tablename__ = "user_evaluations"
 
     # =====================================================
-    # Primary Key (custom format - service generated)
+    # Primary Key (custom format - database generated)
     # =====================================================
 
-    id: Mapped[str] = mapped_column(String(50), primary_key=True)
-    """Custom ID format: eval_YYYYMMDD_HHMMSS_randomhex"""
+    id: Mapped[str] = mapped_column(
+        String(50), primary_key=True, server_default=FetchedValue()
+    )
+    """Custom ID format: eval_YYYYMMDD_HHMMSS_randomhex (column DEFAULT)"""
 
     # =====================================================
     # Foreign Key (we own this relationship)
@@ -445,19 +445,19 @@ def format_chat_history(
     return "\n\n".join(lines) if lines else "Sohbet geçmişi yok."
 
 
-def render_coach_user_prompt(
+def render_coach_static_context(
     question: str,
     model_answer: str,
     user_scores: dict[str, dict[str, Any]],
     judge_scores: dict[str, dict[str, Any]],
     evidence_json: dict[str, Any] | None,
-    chat_history: list[dict[str, Any]],
-    user_message: str,
     selected_metrics: list[str],
-    history_window: int = 6
-) -> str:
+) -> dict[str, str]:
     """
-    Render coach user prompt with full context for chat turn.
+    Format the snapshot-invariant fields of the coach user prompt.
+
+    Only chat history and the user message change between turns, so the
+    result can be reused for every turn of a conversation.
 
     Args:
         question: Question text
@@ -465,44 +465,101 @@ def render_coach_user_prompt(
         user_scores: User scores by metric slug (from snapshot.user_scores_json)
         judge_scores: Judge scores by metric slug (from snapshot.judge_scores_json)
         evidence_json: Evidence by metric slug (from snapshot.evidence_json)
-        chat_history: Last N messages (role, content)
-        user_message: Current user message to respond to
         selected_metrics: List of metric slugs user selected
-        history_window: Number of messages to include in context
 
     Returns:
-        Rendered prompt string ready for Coach AI
+        Template fields for COACH_USER_PROMPT_TEMPLATE (static part)
     """
     # Convert metric slugs to Turkish display names
     selected_display = [
         slug_to_display_name(slug) for slug in selected_metrics
     ]
-    selected_metrics_display = ", ".join(selected_display)
 
-    # Format scores for selected metrics only
-    user_scores_display = format_scores_display(user_scores, selected_metrics)
-    judge_scores_display = format_scores_display(judge_scores, selected_metrics)
+    return {
+        "selected_metrics_display": ", ".join(selected_display),
+        "question": question,
+        "model_answer": model_answer,
+        # Format scores and evidence for selected metrics only
+        "user_scores_display": format_scores_display(user_scores, selected_metrics),
+        "judge_scores_display": format_scores_display(judge_scores, selected_metrics),
+        "evidence_display": format_evidence_display(evidence_json, selected_metrics),
+    }
 
-    # Format evidence for selected metrics only
-    evidence_display = format_evidence_display(evidence_json, selected_metrics)
 
+def render_coach_user_prompt_with_context(
+    static_context: dict[str, str],
+    chat_history: list[dict[str, Any]],
+    user_message: str,
+    history_window: int = 6
+) -> str:
+    """
+    Render coach user prompt from pre-formatted static context.
+
+    Args:
+        static_context: Output of render_coach_static_context()
+        chat_history: Last N messages (role, content)
+        user_message: Current user message to respond to
+        history_window: Number of messages to include in context
+
+    Returns:
+        Rendered prompt string ready for Coach AI
+    """
     # Format chat history (last N messages)
     recent_history = chat_history[-history_window:] if chat_history else []
     chat_history_display = format_chat_history(recent_history)
 
     return COACH_USER_PROMPT_TEMPLATE.format(
-        selected_metrics_display=selected_metrics_display,
-        question=question,
-        model_answer=model_answer,
-        user_scores_display=user_scores_display,
-        judge_scores_display=judge_scores_display,
-        evidence_display=evidence_display,
+        **static_context,
         chat_history=chat_history_display,
         history_window=history_window,
         user_message=user_message,
     )
 
 
+def render_coach_user_prompt(
+    question: str,
+    model_answer: str,
+    user_scores: dict[str, dict[str, Any]],
+    judge_scores: dict[str, dict[str, Any]],
+    evidence_json: dict[str, Any] | None,
+    chat_history: list[dict[str, Any]],
+    user_message: str,
+    selected_metrics: list[str],
+    history_window: int = 6
+) -> str:
+    """
+    Render coach user prompt with full context for chat turn.
+
+    Args:
+        question: Question text
+        model_answer: Model's response text
+        user_scores: User scores by metric slug (from snapshot.user_scores_json)
+        judge_scores: Judge scores by metric slug (from snapshot.judge_scores_json)
+        evidence_json: Evidence by metric slug (from snapshot.evidence_json)
+        chat_history: Last N messages (role, content)
+        user_message: Current user message to respond to
+        selected_metrics: List of metric slugs user selected
+        history_window: Number of messages to include in context
+
+    Returns:
+        Rendered prompt string ready for Coach AI
+    """
+    static_context = render_coach_static_context(
+        question=question,
+        model_answer=model_answer,
+        user_scores=user_scores,
+        judge_scores=judge_scores,
+        evidence_json=evidence_json,
+        selected_metrics=selected_metrics,
+    )
+    return render_coach_user_prompt_with_context(
+        static_context,
+        chat_history=chat_history,
+        user_message=user_message,
+        history_window=history_window,
+    )
+
+
 def render_coach_init_greeting(
     question: str,
     model_answer: str,
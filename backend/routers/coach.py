@@ -8,9 +8,10 @@ Reference: Task 14.2 - Coach Chat Service Implementation
 """
 
 import asyncio
-import json
+import inspect
 import logging
-from typing import AsyncGenerator
+from functools import wraps
+from typing import AsyncGenerator, Callable
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
@@ -18,6 +19,7 @@ from pydantic import BaseModel, Field, field_validator
 from sqlalchemy.orm import Session
 
 from backend.config.settings import settings
+from backend.constants.metrics import VALID_METRIC_SLUGS
 from backend.models.database import get_db
 from backend.models.schemas import (
     ChatHistoryResponse,
@@ -31,6 +33,7 @@ from backend.services.coach_service import (
     MaxTurnsExceededError,
     SnapshotNotFoundError,
     coach_service,
+    sse_frame,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,6 +45,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["coach"])
 
+# Shared headers for every SSE endpoint; X-Accel-Buffering disables Nginx
+# response buffering so tokens reach the client as they are produced.
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+    "Connection": "keep-alive",
+}
+
 
 # =====================================================
 # Request/Response Schemas
@@ -60,16 +71,12 @@ class InitGreetingRequest(BaseModel):
     @classmethod
     def validate_metrics(cls, v: list[str]) -> list[str]:
         """Validate metric slugs."""
-        valid_metrics = {
-            "truthfulness", "helpfulness", "safety", "bias",
-            "clarity", "consistency", "efficiency", "robustness"
-        }
-        for metric in v:
-            if metric not in valid_metrics:
-                raise ValueError(
-                    f"Invalid metric slug: '{metric}'. "
-                    f"Valid options: {valid_metrics}"
-                )
+        invalid = set(v) - VALID_METRIC_SLUGS
+        if invalid:
+            raise ValueError(
+                f"Invalid metric slug(s): {sorted(invalid)}. "
+                f"Valid options: {sorted(VALID_METRIC_SLUGS)}"
+            )
         return v
 
 
@@ -115,6 +122,64 @@ def map_coach_error_to_http_status(error: Exception) -> tuple[int, str]:
         return status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal server error"
 
 
+def format_sse_error(error: Exception) -> bytes:
+    """
+    Format a coach service error as an SSE error frame.
+
+    Uses the same mapping as the non-streaming path so clients see identical
+    status codes whether the failure happens before or during the stream.
+
+    Args:
+        error: Exception raised while streaming
+
+    Returns:
+        SSE "data:" frame with error detail and status code
+    """
+    status_code, detail = map_coach_error_to_http_status(error)
+    return sse_frame({"error": detail, "status": status_code})
+
+
+def handle_errors(fn: Callable) -> Callable:
+    """
+    Decorator that converts coach service errors into HTTPExceptions.
+
+    HTTPExceptions raised by the handler pass through untouched; any other
+    exception is mapped via map_coach_error_to_http_status. Works for both
+    sync and async handlers (FastAPI keeps running sync ones in the
+    threadpool since the wrapper stays sync).
+
+    Args:
+        fn: Endpoint handler to wrap
+
+    Returns:
+        Wrapped handler with the same signature
+    """
+    if inspect.iscoroutinefunction(fn):
+        @wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                status_code, detail = map_coach_error_to_http_status(e)
+                raise HTTPException(status_code=status_code, detail=detail)
+
+        return async_wrapper
+
+    @wraps(fn)
+    def sync_wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except HTTPException:
+            raise
+        except Exception as e:
+            status_code, detail = map_coach_error_to_http_status(e)
+            raise HTTPException(status_code=status_code, detail=detail)
+
+    return sync_wrapper
+
+
 # =====================================================
 # Endpoints
 # =====================================================
@@ -125,6 +190,7 @@ def map_coach_error_to_http_status(error: Exception) -> tuple[int, str]:
     summary="Get Chat History",
     description="Retrieve chat history for a snapshot's coach conversation."
 )
+@handle_errors
 def get_chat_history(
     snapshot_id: str,
     limit: int = 50,
@@ -135,32 +201,27 @@ def get_chat_history(
 
     Returns recent messages between user and Coach AI.
     """
-    try:
-        # Validate snapshot exists
-        snapshot = coach_service.get_snapshot_context(db, snapshot_id)
-
-        # Get chat history
-        history = coach_service.get_chat_history(
-            db, snapshot_id, limit=min(limit, 100)
-        )
-
-        # Convert to response format using unpacking
-        messages = [
-            ChatMessageResponse(**msg)
-            for msg in history
-        ]
-
-        return ChatHistoryResponse(
-            snapshot_id=snapshot_id,
-            messages=messages,
-            total=len(messages),
-            is_chat_available=snapshot.is_chat_available,
-            turns_remaining=snapshot.max_chat_turns - snapshot.chat_turn_count
-        )
-
-    except Exception as e:
-        status_code, detail = map_coach_error_to_http_status(e)
-        raise HTTPException(status_code=status_code, detail=detail)
+    # Validate snapshot exists
+    snapshot = coach_service.get_snapshot_context(db, snapshot_id)
+
+    # Get chat history
+    history = coach_service.get_chat_history(
+        db, snapshot_id, limit=min(limit, 100)
+    )
+
+    # Convert to response format using unpacking
+    messages = [
+        ChatMessageResponse(**msg)
+        for msg in history
+    ]
+
+    return ChatHistoryResponse(
+        snapshot_id=snapshot_id,
+        messages=messages,
+        total=len(messages),
+        is_chat_available=snapshot.is_chat_available,
+        turns_remaining=snapshot.max_chat_turns - snapshot.chat_turn_count
+    )
 
 
 @router.post(
@@ -168,6 +229,7 @@ def get_chat_history(
     summary="Get Init Greeting",
     description="Get idempotent initial greeting message via SSE streaming."
 )
+@handle_errors
 async def get_init_greeting(
     snapshot_id: str,
     request: InitGreetingRequest,
@@ -180,13 +242,9 @@ async def get_init_greeting(
     Includes selected metrics that are locked for this conversation.
     """
     # Validasyon (Stream öncesi gerçek 404/400 için)
-    try:
-        coach_service.get_snapshot_context(db, snapshot_id)
-    except Exception as e:
-        status_code, detail = map_coach_error_to_http_status(e)
-        raise HTTPException(status_code=status_code, detail=detail)
+    coach_service.check_chat_available(db, snapshot_id)
 
-    async def generate() -> AsyncGenerator[str, None]:
+    async def generate() -> AsyncGenerator[bytes, None]:
         try:
             async for chunk in coach_service.handle_init_greeting(
                 db=db,
@@ -195,17 +253,12 @@ async def get_init_greeting(
             ):
                 yield chunk
         except Exception as e:
-            status_code, detail = map_coach_error_to_http_status(e)
-            yield f"data: {json.dumps({'error': detail, 'status': status_code})}\n\n"
+            yield format_sse_error(e)
 
     return StreamingResponse(
         generate(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-            "Connection": "keep-alive",
-        }
+        headers=SSE_HEADERS
     )
 
 
@@ -214,6 +267,7 @@ async def get_init_greeting(
     summary="Stream Coach Response",
     description="Stream coach response via Server-Sent Events (SSE)."
 )
+@handle_errors
 async def stream_coach_response(
     snapshot_id: str,
     request: ChatRequest,
@@ -235,13 +289,9 @@ async def stream_coach_response(
     """
     # ✅ EARLY VALIDATION: Check snapshot exists BEFORE opening stream
     # This ensures proper 404 response instead of 200 OK with error in stream
-    try:
-        coach_service.get_snapshot_context(db, snapshot_id)
-    except Exception as e:
-        status_code, detail = map_coach_error_to_http_status(e)
-        raise HTTPException(status_code=status_code, detail=detail)
+    coach_service.check_chat_available(db, snapshot_id)
 
-    async def generate() -> AsyncGenerator[str, None]:
+    async def generate() -> AsyncGenerator[bytes, None]:
         """Generator function for SSE streaming."""
         try:
             # Stream response from coach service
@@ -255,22 +305,13 @@ async def stream_coach_response(
                 yield chunk
 
         except Exception as e:
-            status_code, detail = map_coach_error_to_http_status(e)
             # Send error as SSE message
-            error_json = json.dumps({
-                "error": detail,
-                "status": status_code
-            })
-            yield f"data: {error_json}\n\n"
+            yield format_sse_error(e)
 
     return StreamingResponse(
         generate(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",  # Disable Nginx buffering
-            "Connection": "keep-alive",
-        }
+        headers=SSE_HEADERS
     )
 
 
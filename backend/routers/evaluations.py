@@ -6,19 +6,21 @@ Users submit their evaluations of K model responses across 8 metrics.
 """
 
 import logging
-import secrets
-from datetime import datetime
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from sqlalchemy import insert, lambda_stmt, select, update
 from sqlalchemy.orm import Session
 
 from backend.models.database import get_db
+from backend.models.judge_evaluation import JudgeEvaluation
+from backend.models.model_response import ModelResponse
 from backend.models.schemas import (
     AlignmentMetric,
     EvaluationSubmitRequest,
     EvaluationSubmitResponse,
     JudgeFeedbackResponse,
 )
+from backend.models.user_evaluation import UserEvaluation
 from backend.tasks.judge_task import run_judge_evaluation, retry_judge_evaluation
 
 
@@ -64,10 +66,12 @@ async def submit_evaluation(
         evaluations = request.evaluations
 
         # 2. Fetch model response
-        from backend.models.model_response import ModelResponse
-        model_response = db.query(ModelResponse).filter(
-            ModelResponse.id == request.response_id
-        ).first()
+        # lambda_stmt caches the statement construction by code location, so
+        # only the bound response_id changes between submissions.
+        response_id = request.response_id
+        model_response = db.execute(
+            lambda_stmt(lambda: select(ModelResponse).where(ModelResponse.id == response_id))
+        ).scalar_one_or_none()
 
         if not model_response:
             raise HTTPException(
@@ -81,14 +85,7 @@ async def submit_evaluation(
                 detail=f"Response '{request.response_id}' already evaluated"
             )
 
-        # 3. Generate evaluation ID
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        random_hex = secrets.token_hex(3)
-        evaluation_id = f"eval_{timestamp}_{random_hex}"
-
-        # 4. Create UserEvaluation
-        from backend.models.user_evaluation import UserEvaluation
-
+        # 3. Create UserEvaluation
         # Convert MetricEvaluation objects to dict format for JSONB
         evaluations_dict = {
             metric: {
@@ -98,22 +95,30 @@ async def submit_evaluation(
             for metric, eval_data in evaluations.items()
         }
 
-        user_eval = UserEvaluation(
-            id=evaluation_id,
-            response_id=request.response_id,
-            evaluations=evaluations_dict,
-            judged=False
-        )
-
-        db.add(user_eval)
+        # 4. Insert and read back the database-generated ID
+        # (eval_YYYYMMDD_HHMMSS_randomhex, see 04_user_evaluations.sql)
+        evaluation_id = db.execute(
+            insert(UserEvaluation)
+            .values(
+                response_id=request.response_id,
+                evaluations=evaluations_dict,
+                judged=False
+            )
+            .returning(UserEvaluation.id)
+        ).scalar_one()
 
         # 5. Update model_response.evaluated flag
         # NOTE: evaluation_id column was removed due to circular dependency
-        model_response.evaluated = True
+        db.execute(
+            lambda_stmt(
+                lambda: update(ModelResponse)
+                .where(ModelResponse.id == response_id)
+                .values(evaluated=True)
+            )
+        )
 
         try:
             db.commit()
-            db.refresh(user_eval)
         except Exception as e:
             db.rollback()
             logger.error(f"Database error during evaluation submission: {e}")
@@ -126,8 +131,8 @@ async def submit_evaluation(
         background_tasks.add_task(run_judge_evaluation, evaluation_id)
 
         logger.info(
-            f"Created evaluation: {evaluation_id} for response: {request.response_id}. "
-            f"Judge task started in background."
+            "Created evaluation: %s for response: %s. Judge task started in background.",
+            evaluation_id, request.response_id
         )
 
         return EvaluationSubmitResponse(
@@ -176,9 +181,6 @@ async def get_evaluation_feedback(
         HTTPException 404: Evaluation not found
         HTTPException 500: Judge data not found (internal error)
     """
-    from backend.models.judge_evaluation import JudgeEvaluation
-    from backend.models.user_evaluation import UserEvaluation
-
     user_eval = db.query(UserEvaluation).filter(
         UserEvaluation.id == evaluation_id
     ).first()
@@ -272,8 +274,6 @@ async def retry_evaluation(
     Raises:
         HTTPException 404: Evaluation not found
     """
-    from backend.models.user_evaluation import UserEvaluation
-
     user_eval = db.query(UserEvaluation).filter(
         UserEvaluation.id == evaluation_id
     ).first()
@@ -294,7 +294,7 @@ async def retry_evaluation(
     # Add retry task
     background_tasks.add_task(retry_judge_evaluation, evaluation_id)
 
-    logger.info(f"Judge evaluation retry initiated: {evaluation_id}")
+    logger.info("Judge evaluation retry initiated: %s", evaluation_id)
 
     return {
         "evaluation_id": evaluation_id,
@@ -9,16 +9,21 @@ Endpoints:
 - GET /api/questions/pool/stats - Get question pool statistics
 """
 
+import asyncio
 import logging
+import time
 from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from backend.models.database import get_db
+from backend.config.settings import settings
+from backend.models.database import get_async_db, get_db
 from backend.models.schemas import QuestionPoolStats
-from backend.services.claude_service import claude_service
+from backend.services.claude_service import ClaudeService, get_claude_service
 from backend.services.model_service import model_service
 
 logger = logging.getLogger(__name__)
@@ -30,6 +35,13 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Pool stats cache: (expires_at monotonic seconds, stats) or None
+_pool_stats_cache: Optional[tuple[float, QuestionPoolStats]] = None
+
+# Single-flight lock, created inside the running loop (see _get_pool_stats_lock)
+_pool_stats_lock: Optional[asyncio.Lock] = None
+_pool_stats_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
 
 # =====================================================
 # Request/Response Schemas
@@ -54,6 +66,140 @@ class QuestionGenerateResponse(BaseModel):
     question_type: Optional[str] = Field(None, description="Type of question")
 
 
+# =====================================================
+# Helpers
+# =====================================================
+
+def _generate_question_pipeline(
+    request: QuestionGenerateRequest,
+    db: Session,
+    claude_service: ClaudeService
+) -> QuestionGenerateResponse:
+    """
+    Run the blocking generate → select model → answer chain.
+
+    Each step depends on the previous one (model selection needs the
+    question ID), so they run sequentially in the calling thread.
+
+    Args:
+        request: Question generation request
+        db: Database session
+        claude_service: Claude service instance
+
+    Returns:
+        Question and model response data
+
+    Raises:
+        ValueError: If generation or API call fails
+    """
+    # 1. Generate question
+    logger.info(
+        "Generating question for metric=%s, use_pool=%s",
+        request.primary_metric, request.use_pool
+    )
+    question = claude_service.generate_question(
+        primary_metric=request.primary_metric,
+        use_pool=request.use_pool,
+        db=db
+    )
+    invalidate_pool_stats_cache()
+
+    # 2. Select model
+    model_name = model_service.select_model(question.id, db)
+    logger.info("Selected model %s for question %s", model_name, question.id)
+
+    # 3. Get response
+    model_response = model_service.answer_question(
+        question_id=question.id,
+        model_name=model_name,
+        db=db
+    )
+
+    return QuestionGenerateResponse(
+        question_id=question.id,
+        response_id=model_response.id,
+        question=question.question,
+        model_response=model_response.response_text,
+        model_name=model_response.model_name,
+        category=question.category,
+        question_type=question.question_type
+    )
+
+
+async def _compute_pool_stats(db: AsyncSession) -> QuestionPoolStats:
+    """
+    Aggregate question pool statistics.
+
+    Args:
+        db: Async database session
+
+    Returns:
+        Question pool statistics
+    """
+    # One scan with GROUPING SETS instead of five round-trips. GROUPING()
+    # returns a bitmask of the columns rolled up in each row:
+    #   7 = () total, 3 = primary_metric, 5 = category, 6 = difficulty
+    result = await db.execute(text("""
+        SELECT
+            GROUPING(primary_metric, category, difficulty) AS grouping_id,
+            primary_metric,
+            category,
+            difficulty,
+            COUNT(*) AS question_count,
+            AVG(times_used) AS avg_times_used
+        FROM questions
+        GROUP BY GROUPING SETS ((), (primary_metric), (category), (difficulty))
+    """))
+    rows = result.all()
+
+    total = 0
+    avg_times = 0.0
+    by_metric = {}
+    by_category = {}
+    by_difficulty = {}
+
+    for row in rows:
+        if row.grouping_id == 7:
+            total = row.question_count
+            avg_times = row.avg_times_used or 0.0
+        elif row.grouping_id == 3:
+            by_metric[row.primary_metric] = row.question_count
+        elif row.grouping_id == 5:
+            by_category[row.category] = row.question_count
+        elif row.grouping_id == 6:
+            by_difficulty[row.difficulty] = row.question_count
+
+    return QuestionPoolStats(
+        total_questions=total,
+        by_metric=by_metric,
+        by_category=by_category,
+        by_difficulty=by_difficulty,
+        avg_times_used=float(avg_times)
+    )
+
+
+def _get_pool_stats_lock() -> asyncio.Lock:
+    """
+    Return the pool stats lock for the running event loop.
+
+    Created lazily so importing this module needs no event loop, and
+    rebuilt when the loop changes (e.g. one TestClient lifespan per test).
+    """
+    global _pool_stats_lock, _pool_stats_lock_loop
+
+    loop = asyncio.get_running_loop()
+    if _pool_stats_lock is None or _pool_stats_lock_loop is not loop:
+        _pool_stats_lock = asyncio.Lock()
+        _pool_stats_lock_loop = loop
+    return _pool_stats_lock
+
+
+def invalidate_pool_stats_cache() -> None:
+    """Drop cached pool stats so the next request re-aggregates."""
+    global _pool_stats_cache
+    _pool_stats_cache = None
+
+
 # =====================================================
 # Endpoints
 # =====================================================
@@ -61,7 +207,8 @@ class QuestionGenerateResponse(BaseModel):
 @router.post("/generate", response_model=QuestionGenerateResponse)
 async def generate_question(
     request: QuestionGenerateRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    claude_service: ClaudeService = Depends(get_claude_service)
 ):
     """
     Generate a new question or select from pool and get K model response.
@@ -75,6 +222,7 @@ async def generate_question(
     Args:
         request: Question generation request
         db: Database session
+        claude_service: Claude service (injected)
 
     Returns:
         Question and model response data
@@ -83,37 +231,9 @@ async def generate_question(
         HTTPException: If generation or API call fails
     """
     try:
-        # 1. Generate question
-        logger.info(
-            f"Generating question for metric={request.primary_metric}, "
-            f"use_pool={request.use_pool}"
-        )
-        question = claude_service.generate_question(
-            primary_metric=request.primary_metric,
-            use_pool=request.use_pool,
-            db=db
-        )
-
-        # 2. Select model
-        model_name = model_service.select_model(question.id, db)
-        logger.info(f"Selected model {model_name} for question {question.id}")
-
-        # 3. Get response
-        model_response = model_service.answer_question(
-            question_id=question.id,
-            model_name=model_name,
-            db=db
-        )
-
-        return QuestionGenerateResponse(
-            question_id=question.id,
-            response_id=model_response.id,
-            question=question.question,
-            model_response=model_response.response_text,
-            model_name=model_response.model_name,
-            category=question.category,
-            question_type=question.question_type
-        )
+        # Claude/OpenRouter clients and the Session are blocking; run the
+        # dependent chain in a worker thread so the event loop stays free.
+        return await asyncio.to_thread(_generate_question_pipeline, request, db, claude_service)
 
     except ValueError as e:
         logger.error(f"Question generation failed: {e}")
@@ -124,7 +244,7 @@ async def generate_question(
 
 
 @router.get("/pool/stats", response_model=QuestionPoolStats)
-async def get_pool_stats(db: Session = Depends(get_db)):
+async def get_pool_stats(db: AsyncSession = Depends(get_async_db)):
     """
     Get statistics about the question pool.
 
@@ -136,44 +256,26 @@ async def get_pool_stats(db: Session = Depends(get_db)):
     - Average times_used
 
     Args:
-        db: Database session
+        db: Async database session
 
     Returns:
         Question pool statistics
     """
-    from backend.models.question import Question
-    from sqlalchemy import func
-
-    # Total questions
-    total = db.query(Question).count()
-
-    # By metric
-    by_metric = dict(db.query(
-        Question.primary_metric,
-        func.count(Question.id)
-    ).group_by(Question.primary_metric).all())
-
-    # By category
-    by_category = dict(db.query(
-        Question.category,
-        func.count(Question.id)
-    ).group_by(Question.category).all())
-
-    # By difficulty
-    by_difficulty = dict(db.query(
-        Question.difficulty,
-        func.count(Question.id)
-    ).group_by(Question.difficulty).all())
-
-    # Average times_used
-    avg_times = db.query(
-        func.avg(Question.times_used)
-    ).scalar() or 0.0
-
-    return QuestionPoolStats(
-        total_questions=total,
-        by_metric=by_metric,
-        by_category=by_category,
-        by_difficulty=by_difficulty,
-        avg_times_used=float(avg_times)
-    )
+    global _pool_stats_cache
+
+    cached = _pool_stats_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    # Single-flight: concurrent misses wait for one aggregation
+    async with _get_pool_stats_lock():
+        cached = _pool_stats_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        stats = await _compute_pool_stats(db)
+        _pool_stats_cache = (
+            time.monotonic() + settings.pool_stats_cache_ttl_seconds,
+            stats
+        )
+        return stats
@@ -9,9 +9,12 @@ Reference: Task 13.5 - Snapshot Router & Endpoints
 """
 
 import logging
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from backend.models.database import get_db
@@ -32,16 +35,21 @@ from backend.services.snapshot_service import (
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Validates a whole page of ORM rows in one pydantic-core call
+_list_items_adapter = TypeAdapter(list[SnapshotListItem])
+
 
 # =====================================================
 # GET /api/snapshots/ - List Snapshots
 # =====================================================
 
-@router.get("/", response_model=SnapshotListResponse)
+@router.get("/", response_model=SnapshotListResponse, response_class=ORJSONResponse)
 async def list_snapshots_endpoint(
     status: Optional[str] = None,
     limit: int = 20,
     offset: int = 0,
+    before: Optional[datetime] = None,
+    before_id: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """
@@ -54,6 +62,10 @@ async def list_snapshots_endpoint(
         status: Optional filter by snapshot status ("active", "completed", "archived")
         limit: Maximum results per page (default: 20, max: 100)
         offset: Pagination offset (default: 0)
+        before: Keyset cursor; only snapshots created before this timestamp
+            (use next_before from the previous page instead of a deep offset);
+            keyset pages skip the count and return total=None
+        before_id: Keyset cursor tiebreak (next_before_id from the previous page)
 
     Returns:
         SnapshotListResponse with items, total, page, per_page
@@ -92,31 +104,30 @@ async def list_snapshots_endpoint(
         db=db,
         status=status,
         limit=limit,
-        offset=offset
+        offset=offset,
+        before=before,
+        before_id=before_id
     )
 
     # Map ORM objects to schema
-    items = [
-        SnapshotListItem(
-            id=snap.id,
-            created_at=snap.created_at,
-            primary_metric=snap.primary_metric,
-            category=snap.category,
-            judge_meta_score=snap.judge_meta_score,
-            status=snap.status,
-            chat_turn_count=snap.chat_turn_count
-        )
-        for snap in snapshots
-    ]
+    items = _list_items_adapter.validate_python(snapshots, from_attributes=True)
 
     # Calculate page number (1-based)
     page = (offset // limit) + 1 if limit > 0 else 1
 
+    # Keyset cursor for the next page (only when this page is full)
+    next_before = next_before_id = None
+    if len(snapshots) == limit:
+        next_before = snapshots[-1].created_at
+        next_before_id = snapshots[-1].id
+
     return SnapshotListResponse(
         items=items,
         total=total,
         page=page,
-        per_page=limit
+        per_page=limit,
+        next_before=next_before,
+        next_before_id=next_before_id
     )
 
 
@@ -124,7 +135,7 @@ async def list_snapshots_endpoint(
 # GET /api/snapshots/{snapshot_id} - Get Snapshot Detail
 # =====================================================
 
-@router.get("/{snapshot_id}", response_model=SnapshotResponse)
+@router.get("/{snapshot_id}", response_model=SnapshotResponse, response_class=ORJSONResponse)
 async def get_snapshot_endpoint(
     snapshot_id: str,
     db: Session = Depends(get_db)
@@ -156,33 +167,8 @@ async def get_snapshot_endpoint(
             detail=f"Snapshot '{snapshot_id}' not found"
         )
 
-    # Map ORM to response schema
-    return SnapshotResponse(
-        id=snapshot.id,
-        created_at=snapshot.created_at,
-        updated_at=snapshot.updated_at,
-        question_id=snapshot.question_id,
-        question=snapshot.question,
-        model_answer=snapshot.model_answer,
-        model_name=snapshot.model_name,
-        judge_model=snapshot.judge_model,
-        primary_metric=snapshot.primary_metric,
-        bonus_metrics=list(snapshot.bonus_metrics) if snapshot.bonus_metrics else [],
-        category=snapshot.category,
-        user_scores_json=snapshot.user_scores_json,
-        judge_scores_json=snapshot.judge_scores_json,
-        evidence_json=snapshot.evidence_json,
-        judge_meta_score=snapshot.judge_meta_score,
-        weighted_gap=snapshot.weighted_gap,
-        overall_feedback=snapshot.overall_feedback,
-        user_evaluation_id=snapshot.user_evaluation_id,
-        judge_evaluation_id=snapshot.judge_evaluation_id,
-        chat_turn_count=snapshot.chat_turn_count,
-        max_chat_turns=snapshot.max_chat_turns,
-        status=snapshot.status,
-        deleted_at=snapshot.deleted_at,
-        is_chat_available=snapshot.is_chat_available
-    )
+    # Map ORM to response schema (from_attributes reads is_chat_available too)
+    return SnapshotResponse.model_validate(snapshot)
 
 
 # =====================================================
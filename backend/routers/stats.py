@@ -10,7 +10,7 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from backend.models.database import get_db
 from backend.models.schemas import StatsOverview, MetricPerformance
@@ -31,7 +31,8 @@ def _calculate_overall_trend(db: Session) -> str:
     """
     Calculate overall improvement trend based on recent evaluations.
 
-    Compares last 10 evaluations with previous 10 evaluations.
+    Compares last 10 evaluations with previous 10 evaluations. Both
+    averages are computed in SQL over the 20 most recent rows.
 
     Args:
         db: Database session
@@ -39,53 +40,57 @@ def _calculate_overall_trend(db: Session) -> str:
     Returns:
         Trend string: "+X.X (last 10 evaluations)" or "No data yet"
     """
-    # Get last 20 evaluations ordered by created_at
-    recent_evals = db.query(JudgeEvaluation)\
-        .order_by(JudgeEvaluation.created_at.desc())\
-        .limit(20)\
-        .all()
+    # Last 20 evaluations ranked newest first
+    recent = select(
+        JudgeEvaluation.weighted_gap,
+        func.row_number().over(
+            order_by=JudgeEvaluation.created_at.desc()
+        ).label("rn")
+    ).order_by(JudgeEvaluation.created_at.desc()).limit(20).subquery()
+
+    row = db.execute(
+        select(
+            func.avg(recent.c.weighted_gap).filter(recent.c.rn <= 10).label("last_avg"),
+            func.avg(recent.c.weighted_gap).filter(recent.c.rn > 10).label("prev_avg"),
+            func.count().label("window_count")
+        )
+    ).one()
 
-    if len(recent_evals) < 10:
+    if row.window_count < 10:
         return "Insufficient data (need at least 10 evaluations)"
 
-    last_10 = recent_evals[:10]
-    prev_10 = recent_evals[10:20] if len(recent_evals) > 10 else []
-
-    # Calculate average weighted gap for last 10
-    last_avg_gap = sum(e.weighted_gap for e in last_10) / len(last_10)
+    last_avg_gap = float(row.last_avg)
 
-    if prev_10:
-        prev_avg_gap = sum(e.weighted_gap for e in prev_10) / len(prev_10)
-        diff = prev_avg_gap - last_avg_gap
+    if row.prev_avg is not None:
+        diff = float(row.prev_avg) - last_avg_gap
         direction = "+" if diff >= 0 else ""
         return f"{direction}{diff:.2f} (last 10 evaluations)"
     else:
         return f"{last_avg_gap:.2f} (current avg)"
 
 
-def _calculate_metric_trend(evaluations: list) -> str:
+def _calculate_metric_trend(
+    last_avg_gap: float,
+    prev_avg_gap: Optional[float],
+    window_count: int
+) -> str:
     """
     Calculate trend for a specific metric.
 
     Args:
-        evaluations: List of JudgeEvaluation objects for this metric
+        last_avg_gap: Average primary_metric_gap of the 10 most recent evaluations
+        prev_avg_gap: Average of the previous 10 (None if there are none)
+        window_count: Number of evaluations in the 20-row window
 
     Returns:
         Trend string: "improving", "stable", or "declining"
     """
-    if len(evaluations) < 2:
+    if window_count < 2:
         return "insufficient_data"
 
-    # First 10 (most recent) vs next 10 (previous)
-    last_10 = evaluations[:10]
-    prev_10 = evaluations[10:20] if len(evaluations) > 10 else []
-
-    if not prev_10:
+    if prev_avg_gap is None:
         return "stable"
 
-    last_avg_gap = sum(e.primary_metric_gap for e in last_10) / len(last_10)
-    prev_avg_gap = sum(e.primary_metric_gap for e in prev_10) / len(prev_10)
-
     # Threshold of 0.2 for meaningful change
     if last_avg_gap < prev_avg_gap - 0.2:
         return "improving"
@@ -95,6 +100,47 @@ def _calculate_metric_trend(evaluations: list) -> str:
         return "stable"
 
 
+def _fetch_metric_windows(db: Session) -> dict:
+    """
+    Fetch last-10 / previous-10 gap averages for every metric in one query.
+
+    Ranks evaluations per primary_metric with ROW_NUMBER() and aggregates
+    the two windows with FILTER clauses. Only EVALUATION_METRICS are ranked,
+    so rows for unknown metrics never enter the window sort.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dict mapping primary_metric to its aggregate row
+        (last_avg, prev_avg, last_count, window_count)
+    """
+    ranked = select(
+        JudgeEvaluation.primary_metric,
+        JudgeEvaluation.primary_metric_gap,
+        func.row_number().over(
+            partition_by=JudgeEvaluation.primary_metric,
+            order_by=JudgeEvaluation.created_at.desc()
+        ).label("rn")
+    ).where(
+        JudgeEvaluation.primary_metric.in_(EVALUATION_METRICS)
+    ).subquery()
+
+    rows = db.execute(
+        select(
+            ranked.c.primary_metric,
+            func.avg(ranked.c.primary_metric_gap).filter(ranked.c.rn <= 10).label("last_avg"),
+            func.avg(ranked.c.primary_metric_gap).filter(ranked.c.rn > 10).label("prev_avg"),
+            func.count().filter(ranked.c.rn <= 10).label("last_count"),
+            func.count().label("window_count")
+        )
+        .where(ranked.c.rn <= 20)
+        .group_by(ranked.c.primary_metric)
+    ).all()
+
+    return {row.primary_metric: row for row in rows}
+
+
 @router.get("/overview", response_model=StatsOverview)
 async def get_stats_overview(db: Session = Depends(get_db)) -> StatsOverview:
     """
@@ -111,43 +157,39 @@ async def get_stats_overview(db: Session = Depends(get_db)) -> StatsOverview:
     - Declining: last avg gap > prev avg gap + 0.2
     - Stable: within 0.2 threshold
     """
-    # 1. Total evaluations
-    total_evaluations = db.query(JudgeEvaluation).count()
-
-    # 2. Average meta score
-    avg_meta_score = db.query(func.avg(JudgeEvaluation.judge_meta_score)).scalar() or 0.0
+    # 1. & 2. Total evaluations and average meta score (columns only, no ORM rows)
+    total_evaluations, avg_meta_score = db.query(JudgeEvaluation).with_entities(
+        func.count(JudgeEvaluation.id),
+        func.avg(JudgeEvaluation.judge_meta_score)
+    ).one()
+    avg_meta_score = avg_meta_score or 0.0
 
     # 3. Per-metric performance
     metrics_performance = {}
 
+    metric_windows = _fetch_metric_windows(db)
+
     for metric in EVALUATION_METRICS:
-        # Get recent evaluations for this metric (last 20)
-        recent = db.query(JudgeEvaluation)\
-            .filter(JudgeEvaluation.primary_metric == metric)\
-            .order_by(JudgeEvaluation.created_at.desc())\
-            .limit(20)\
-            .all()
-
-        if not recent:
+        window = metric_windows.get(metric)
+        if window is None:
             continue
 
-        # Calculate average gap from available evaluations
-        last_evals = recent[:10]
-        avg_gap = sum(e.primary_metric_gap for e in last_evals) / len(last_evals)
-
-        # Calculate trend
-        trend = _calculate_metric_trend(recent)
+        last_avg_gap = float(window.last_avg)
+        prev_avg_gap = float(window.prev_avg) if window.prev_avg is not None else None
 
         metrics_performance[metric] = MetricPerformance(
-            avg_gap=round(avg_gap, 2),
-            count=len(last_evals),
-            trend=trend
+            avg_gap=round(last_avg_gap, 2),
+            count=window.last_count,
+            trend=_calculate_metric_trend(last_avg_gap, prev_avg_gap, window.window_count)
         )
 
     # 4. Overall improvement trend
     improvement_trend = _calculate_overall_trend(db)
 
-    logger.info(f"Stats overview: {total_evaluations} evaluations, avg meta score: {avg_meta_score:.1f}")
+    logger.info(
+        "Stats overview: %d evaluations, avg meta score: %.1f",
+        total_evaluations, avg_meta_score
+    )
 
     return StatsOverview(
         total_evaluations=total_evaluations,
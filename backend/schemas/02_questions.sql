@@ -57,5 +57,15 @@ CREATE INDEX idx_questions_times_used
 CREATE INDEX idx_questions_pool_selection
     ON questions (primary_metric, difficulty, times_used ASC);
 
+-- Pool selection by metric: ORDER BY times_used, created_at DESC LIMIT 1
+-- is read straight off the index (no sort)
+CREATE INDEX idx_questions_metric_usage
+    ON questions (primary_metric, times_used ASC, created_at DESC);
+
+-- Covering index for pool stats aggregates (index-only scan for GROUPING SETS)
+CREATE INDEX idx_questions_stats_covering
+    ON questions (primary_metric, category, difficulty)
+    INCLUDE (times_used);
+
 COMMENT ON TABLE questions IS
     'Generated questions from Claude. Denormalized primary_metric and bonus_metrics for query performance.';
@@ -8,8 +8,11 @@ DROP TABLE IF EXISTS user_evaluations CASCADE;
 
 CREATE TABLE user_evaluations (
     -- Primary Key (custom format)
-    id TEXT PRIMARY KEY,
-        -- Format: eval_YYYYMMDD_HHMMSS_randomhex
+    id TEXT PRIMARY KEY DEFAULT (
+        'eval_' || to_char(clock_timestamp(), 'YYYYMMDD_HH24MISS')
+        || '_' || substr(replace(gen_random_uuid()::text, '-', ''), 1, 6)
+    ),
+        -- Format: eval_YYYYMMDD_HHMMSS_randomhex (generated by the database)
 
     -- Foreign key to model response
     response_id TEXT NOT NULL REFERENCES model_responses(id) ON DELETE CASCADE,
@@ -69,13 +69,19 @@ CREATE INDEX idx_judge_evaluations_meta_score
 CREATE INDEX idx_judge_evaluations_primary_metric
     ON judge_evaluations (primary_metric);
 
--- Time-based index (newest first)
+-- Time-based index (newest first); covers the overall stats trend window
 CREATE INDEX idx_judge_evaluations_created_at_desc
-    ON judge_evaluations (created_at DESC);
+    ON judge_evaluations (created_at DESC)
+    INCLUDE (weighted_gap);
 
 -- Composite index for statistics queries
 CREATE INDEX idx_judge_evaluations_metric_score
     ON judge_evaluations (primary_metric, judge_meta_score);
 
+-- Covering index for per-metric trend windows (newest first per metric)
+CREATE INDEX idx_judge_evaluations_metric_created
+    ON judge_evaluations (primary_metric, created_at DESC)
+    INCLUDE (primary_metric_gap);
+
 COMMENT ON TABLE judge_evaluations IS
     'GPT-4o two-stage evaluation: (1) Independent blind scoring, (2) Mentoring comparison with user scores. Includes ChromaDB-retrieved past mistakes.';
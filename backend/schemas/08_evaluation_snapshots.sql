@@ -118,6 +118,16 @@ CREATE INDEX idx_snapshots_active_metric
     ON evaluation_snapshots (primary_metric, created_at DESC)
     WHERE status = 'active' AND deleted_at IS NULL;
 
+-- Snapshot list pagination (non-deleted, newest first)
+CREATE INDEX idx_snapshots_active_created
+    ON evaluation_snapshots (created_at DESC, id DESC)
+    WHERE deleted_at IS NULL;
+
+-- Snapshot list pagination filtered by status
+CREATE INDEX idx_snapshots_active_status
+    ON evaluation_snapshots (status, created_at DESC, id DESC)
+    WHERE deleted_at IS NULL;
+
 -- =====================================================
 -- Comments
 -- =====================================================
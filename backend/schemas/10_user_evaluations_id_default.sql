@@ -0,0 +1,15 @@
+-- =====================================================
+-- MentorMind - Server-side Evaluation IDs
+-- Task: Generate user_evaluations.id in the database
+-- Description: Existing databases get the same DEFAULT as 04_user_evaluations.sql
+-- =====================================================
+
+-- Same format as the former Python generator: eval_YYYYMMDD_HHMMSS_randomhex
+ALTER TABLE user_evaluations
+    ALTER COLUMN id SET DEFAULT (
+        'eval_' || to_char(clock_timestamp(), 'YYYYMMDD_HH24MISS')
+        || '_' || substr(replace(gen_random_uuid()::text, '-', ''), 1, 6)
+    );
+
+COMMENT ON COLUMN user_evaluations.id IS
+    'Generated by the database on INSERT (eval_YYYYMMDD_HHMMSS_randomhex)';
@@ -18,10 +18,13 @@ from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
 from backend.config.settings import settings
-from backend.models.database import engine
+from backend.models.database import create_script_engine
 
 logger = logging.getLogger(__name__)
 
+# Unpooled engine: schema setup is a one-shot CLI run
+engine = create_script_engine()
+
 # =====================================================
 # SQL Schema Files (in execution order)
 # =====================================================
@@ -37,6 +40,7 @@ SCHEMA_FILES = [
     "07_add_question_type_to_questions.sql",
     "08_evaluation_snapshots.sql",
     "09_chat_messages.sql",
+    "10_user_evaluations_id_default.sql",
 ]
 """SQL schema files to execute in order"""
 
@@ -94,17 +98,25 @@ def execute_schema_file(filename: str) -> bool:
 
 def execute_all_schemas() -> bool:
     """
-    Execute all schema files in order.
+    Execute all schema files in order inside a single transaction.
+
+    Either every file is applied or none are (one commit instead of one
+    per file).
 
     Returns:
         True if all successful, False otherwise
     """
-    success = True
-    for filename in SCHEMA_FILES:
-        if not execute_schema_file(filename):
-            success = False
-            break
-    return success
+    current = None
+    try:
+        with engine.begin() as conn:
+            for filename in SCHEMA_FILES:
+                current = filename
+                conn.exec_driver_sql(read_schema_file(filename))
+                logger.info(f"✓ Executed: {filename}")
+        return True
+    except (SQLAlchemyError, FileNotFoundError) as e:
+        logger.error(f"✗ Failed: {current} - {e} (transaction rolled back)")
+        return False
 
 
 # =====================================================
@@ -172,11 +184,13 @@ def verify_tables() -> bool:
 
     try:
         with engine.connect() as conn:
+            # Static catalog queries go straight to the driver; only the
+            # first column of each row is read, no typed result needed.
             # Verify tables
-            result = conn.execute(text("""
+            result = conn.exec_driver_sql("""
                 SELECT tablename FROM pg_tables
                 WHERE schemaname = 'public'
-            """))
+            """)
             actual_tables = {row[0] for row in result}
 
             missing_tables = expected_tables - actual_tables
@@ -189,12 +203,12 @@ def verify_tables() -> bool:
                 logger.info(f"  - {table}")
 
             # Verify ENUM types
-            result = conn.execute(text("""
+            result = conn.exec_driver_sql("""
                 SELECT typname FROM pg_type
                 WHERE typtype = 'e' AND typnamespace = (
                     SELECT oid FROM pg_namespace WHERE nspname = 'public'
                 )
-            """))
+            """)
             actual_enums = {row[0] for row in result}
 
             missing_enums = expected_enums - actual_enums
@@ -207,13 +221,13 @@ def verify_tables() -> bool:
                 logger.info(f"  - {enum_type}")
 
             # Verify triggers
-            result = conn.execute(text("""
+            result = conn.exec_driver_sql("""
                 SELECT tgname FROM pg_trigger
                 JOIN pg_class ON pg_trigger.tgrelid = pg_class.oid
                 JOIN pg_namespace ON pg_class.relnamespace = pg_namespace.oid
                 WHERE pg_namespace.nspname = 'public'
-                AND pg_trigger.tgname LIKE '%updated_at%'
-            """))
+                AND pg_trigger.tgname ~ 'updated_at'
+            """)
             actual_triggers = {row[0] for row in result}
 
             missing_triggers = expected_triggers - actual_triggers
@@ -28,16 +28,31 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from sqlalchemy import text
-from backend.models.database import engine
+from backend.models.database import create_script_engine
 from sqlalchemy.exc import SQLAlchemyError
 
+# Unpooled engine: this is a one-shot CLI run
+engine = create_script_engine()
 
-def migrate_category_hints(dry_run: bool = True) -> dict:
+
+BATCH_SIZE = 5000
+"""Rows updated per committed batch"""
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write buffered report lines to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def migrate_category_hints(dry_run: bool = True, batch_size: int = BATCH_SIZE) -> dict:
     """
     Migrate category_hints from []/NULL to ["any"].
 
     Args:
         dry_run: If True, show changes without applying them
+        batch_size: Rows updated per committed batch
 
     Returns:
         dict: Migration statistics
@@ -50,56 +65,53 @@ def migrate_category_hints(dry_run: bool = True) -> dict:
         "updated": 0
     }
 
+    # Output is buffered and written once at the end instead of one
+    # blocking stdout write per line
+    lines: list[str] = []
+    say = lines.append
+
     try:
         with engine.connect() as conn:
             # Start transaction
             trans = conn.begin()
 
             try:
-                # Count total records
-                result = conn.execute(text(
-                    "SELECT COUNT(*) FROM question_prompts"
-                ))
-                stats["total_records"] = result.scalar()
-
-                print(f"📊 Toplam kayıt: {stats['total_records']}")
-                print("-" * 50)
-
-                # Check empty arrays []
-                result = conn.execute(text(
-                    "SELECT COUNT(*) FROM question_prompts WHERE category_hints = '[]'::jsonb"
-                ))
-                stats["empty_arrays"] = result.scalar()
-                print(f"🔍 Boş dizi ([]): {stats['empty_arrays']}")
-
-                # Check NULL values
-                result = conn.execute(text(
-                    "SELECT COUNT(*) FROM question_prompts WHERE category_hints IS NULL"
-                ))
-                stats["null_values"] = result.scalar()
-                print(f"🔍 NULL değerler: {stats['null_values']}")
-
-                # Count valid records
-                result = conn.execute(text(
-                    "SELECT COUNT(*) FROM question_prompts "
-                    "WHERE category_hints != '[]'::jsonb AND category_hints IS NOT NULL"
-                ))
-                stats["already_valid"] = result.scalar()
-                print(f"✅ Zaten geçerli: {stats['already_valid']}")
+                # Count all buckets in a single scan
+                result = conn.execute(text("""
+                    SELECT
+                        COUNT(*) AS total_records,
+                        COUNT(*) FILTER (WHERE category_hints = '[]'::jsonb) AS empty_arrays,
+                        COUNT(*) FILTER (WHERE category_hints IS NULL) AS null_values,
+                        COUNT(*) FILTER (
+                            WHERE category_hints IS NOT NULL AND category_hints != '[]'::jsonb
+                        ) AS already_valid
+                    FROM question_prompts
+                """))
+                counts = result.mappings().one()
+                stats["total_records"] = counts["total_records"]
+                stats["empty_arrays"] = counts["empty_arrays"]
+                stats["null_values"] = counts["null_values"]
+                stats["already_valid"] = counts["already_valid"]
+
+                say(f"📊 Toplam kayıt: {stats['total_records']}")
+                say("-" * 50)
+                say(f"🔍 Boş dizi ([]): {stats['empty_arrays']}")
+                say(f"🔍 NULL değerler: {stats['null_values']}")
+                say(f"✅ Zaten geçerli: {stats['already_valid']}")
 
                 # Calculate total updates needed
                 stats["updated"] = stats["empty_arrays"] + stats["null_values"]
 
                 if stats["updated"] == 0:
-                    print("\n✅ Migration gerekli değil! Tüm kayıtlar zaten geçerli.")
+                    say("\n✅ Migration gerekli değil! Tüm kayıtlar zaten geçerli.")
                     return stats
 
-                print(f"\n🔧 Güncellenecek kayıt: {stats['updated']}")
-                print("-" * 50)
+                say(f"\n🔧 Güncellenecek kayıt: {stats['updated']}")
+                say("-" * 50)
 
                 if dry_run:
-                    print("⚠️  DRY RUN MODU - Değişiklikler uygulanmayacak")
-                    print("\nÖrnek güncellenecek kayıtlar:")
+                    say("⚠️  DRY RUN MODU - Değişiklikler uygulanmayacak")
+                    say("\nÖrnek güncellenecek kayıtlar:")
 
                     # Show sample records that would be updated
                     result = conn.execute(text("""
@@ -109,62 +121,106 @@ def migrate_category_hints(dry_run: bool = True) -> dict:
                         LIMIT 3
                     """))
 
-                    for row in result:
-                        print(f"  - ID: {row[0]}, Metric: {row[1]}, Hints: {row[2]}")
+                    lines.extend(
+                        f"  - ID: {row[0]}, Metric: {row[1]}, Hints: {row[2]}"
+                        for row in result.fetchall()
+                    )
 
                     # Rollback since it's dry run
                     trans.rollback()
-                    print("\n✅ Dry run tamamlandı. Gerçek migration için --apply kullanın.")
+                    say("\n✅ Dry run tamamlandı. Gerçek migration için --apply kullanın.")
 
                 else:
-                    print("🚀 Migration başlıyor...")
-
-                    # Update empty arrays to ["any"]
-                    if stats["empty_arrays"] > 0:
-                        result = conn.execute(text("""
-                            UPDATE question_prompts
-                            SET category_hints = '["any"]'::jsonb
-                            WHERE category_hints = '[]'::jsonb
-                        """))
-                        print(f"  ✅ {stats['empty_arrays']} boş dizi güncellendi")
-
-                    # Update NULL values to ["any"]
-                    if stats["null_values"] > 0:
-                        result = conn.execute(text("""
-                            UPDATE question_prompts
-                            SET category_hints = '["any"]'::jsonb
-                            WHERE category_hints IS NULL
-                        """))
-                        print(f"  ✅ {stats['null_values']} NULL değer güncellendi")
-
-                    # Commit transaction
-                    trans.commit()
-                    print("\n✅ Migration başarıyla tamamlandı!")
-
-                    # Verify all records now have valid category_hints
-                    result = conn.execute(text("""
-                        SELECT COUNT(*) FROM question_prompts
-                        WHERE category_hints = '[]'::jsonb OR category_hints IS NULL
+                    say("🚀 Migration başlıyor...")
+
+                    # Transient partial index covering only rows that need fixing,
+                    # so each batch's predicate is an index scan over dirty rows.
+                    # (Plain CREATE INDEX: CONCURRENTLY cannot run in a transaction.)
+                    conn.execute(text("""
+                        CREATE INDEX IF NOT EXISTS ix_qp_hints_migrate
+                        ON question_prompts (id)
+                        WHERE category_hints IS NULL OR category_hints = '[]'::jsonb
                     """))
-                    invalid_count = result.scalar()
+                    trans.commit()
 
-                    if invalid_count == 0:
-                        print("✅ Doğrulama başarılı! Tüm kayıtlar geçerli.")
+                    # Update empty arrays and NULL values to ["any"] in bounded
+                    # batches, committing each one so no single statement (or
+                    # lock set) grows with the table size.
+                    # The statement object is built once and reused for every
+                    # batch; RETURNING reports which bucket each row came from.
+                    batch_update = text("""
+                        WITH batch AS (
+                            SELECT id, category_hints IS NULL AS was_null
+                            FROM question_prompts
+                            WHERE category_hints = '[]'::jsonb OR category_hints IS NULL
+                            LIMIT :batch_size
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        UPDATE question_prompts qp
+                        SET category_hints = '["any"]'::jsonb
+                        FROM batch
+                        WHERE qp.id = batch.id
+                        RETURNING batch.was_null
+                    """)
+                    updated_nulls = 0
+                    updated_empty = 0
+                    try:
+                        while True:
+                            trans = conn.begin()
+                            returned = conn.execute(batch_update, {"batch_size": batch_size}).scalars().all()
+                            trans.commit()
+                            if not returned:
+                                break
+                            batch_nulls = sum(returned)
+                            updated_nulls += batch_nulls
+                            updated_empty += len(returned) - batch_nulls
+                    finally:
+                        # Drop the transient index even when a batch fails
+                        if conn.in_transaction():
+                            conn.rollback()
+                        trans = conn.begin()
+                        conn.execute(text("DROP INDEX IF EXISTS ix_qp_hints_migrate"))
+                        trans.commit()
+
+                    expected_updates = stats["updated"]
+
+                    # Report what was actually changed (rows may have moved
+                    # between the initial count and the UPDATE)
+                    stats["null_values"] = updated_nulls
+                    stats["empty_arrays"] = updated_empty
+                    stats["updated"] = updated_nulls + updated_empty
+                    say(
+                        f"  ✅ {stats['updated']} kayıt güncellendi "
+                        f"({updated_empty} boş dizi, {updated_nulls} NULL)"
+                    )
+
+                    say("\n✅ Migration başarıyla tamamlandı!")
+
+                    # Verify from the RETURNING tally instead of re-scanning:
+                    # every row counted up front must have been updated
+                    # (SKIP LOCKED can leave rows held by another session).
+                    if stats["updated"] >= expected_updates:
+                        say("✅ Doğrulama başarılı! Tüm kayıtlar geçerli.")
                     else:
-                        print(f"⚠️  Uyarı: {invalid_count} geçersiz kayıt hala mevcut!")
+                        say(
+                            f"⚠️  Uyarı: {expected_updates - stats['updated']} "
+                            f"geçersiz kayıt hala mevcut olabilir!"
+                        )
 
             except Exception as e:
                 # Rollback on error
                 trans.rollback()
-                print(f"❌ Hata: {e}")
+                say(f"❌ Hata: {e}")
                 raise
 
     except SQLAlchemyError as e:
-        print(f"❌ Veritabanı hatası: {e}")
+        say(f"❌ Veritabanı hatası: {e}")
         raise
     except Exception as e:
-        print(f"❌ Beklenmeyen hata: {e}")
+        say(f"❌ Beklenmeyen hata: {e}")
         raise
+    finally:
+        _write_lines(lines)
 
     return stats
 
@@ -181,6 +237,12 @@ def main():
         action="store_true",
         help="Migration'i uygula (varsayılan: dry-run)"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"Batch başına güncellenecek kayıt sayısı (varsayılan: {BATCH_SIZE})"
+    )
     parser.add_argument(
         "--force",
         action="store_true",
@@ -202,7 +264,7 @@ def main():
     # Check if database is accessible
     try:
         with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+            conn.exec_driver_sql("SELECT 1")
         print("✅ Veritabanı bağlantısı başarılı")
         print()
     except Exception as e:
@@ -211,7 +273,7 @@ def main():
 
     # Run migration
     try:
-        stats = migrate_category_hints(dry_run=not args.apply)
+        stats = migrate_category_hints(dry_run=not args.apply, batch_size=args.batch_size)
 
         print()
         print("=" * 60)
@@ -234,6 +296,9 @@ def main():
         print(f"❌ Migration başarısız: {e}")
         sys.exit(1)
 
+    finally:
+        engine.dispose()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,138 @@
+"""
+Migration script to copy the legacy ChromaDB memory collection
+
+The evaluation memory moved from the cosine "evaluation_memory" collection
+to an inner-product collection of L2-normalized vectors
+(settings.chroma_collection_name, "evaluation_memory_ip" by default).
+This script copies the legacy records into the current collection.
+
+- Stored embeddings are re-normalized and upserted as-is (no re-embedding)
+- Records are upserted by id, page by page until the source is exhausted,
+  so an interrupted run is resumed by simply running it again
+- Legacy vectors are 384-d MiniLM embeddings, so the copy only runs when
+  settings.embedding_backend is "minilm" (same dimension)
+
+Usage:
+    python backend/scripts/migrate_memory_collection.py            # dry run
+    python backend/scripts/migrate_memory_collection.py --apply
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.config.settings import settings
+from backend.services.chromadb_service import chromadb_service
+from backend.services.embeddings import normalize_embeddings
+
+
+LEGACY_COLLECTION_NAME = "evaluation_memory"
+"""Pre-"ip" cosine collection (MiniLM, 384-d)"""
+
+BATCH_SIZE = 512
+"""Records per get/upsert page"""
+
+
+def migrate_memory_collection(dry_run: bool = True, batch_size: int = BATCH_SIZE) -> dict:
+    """
+    Copy the legacy cosine collection into the current inner-product collection.
+
+    Args:
+        dry_run: If True, only report what would be copied
+        batch_size: Records per get/upsert page
+
+    Returns:
+        dict: Migration statistics
+    """
+    stats = {"legacy_records": 0, "target_records_before": 0, "copied": 0}
+
+    if settings.embedding_backend != "minilm":
+        print(
+            f"❌ embedding_backend='{settings.embedding_backend}': legacy MiniLM vectors "
+            f"do not match this collection's dimension, nothing copied"
+        )
+        return stats
+
+    if chromadb_service.collection_name == LEGACY_COLLECTION_NAME:
+        print(f"✅ Collection is already '{LEGACY_COLLECTION_NAME}', nothing to migrate")
+        return stats
+
+    client = chromadb_service._get_client()
+    try:
+        legacy = client.get_collection(name=LEGACY_COLLECTION_NAME)
+    except Exception:
+        print(f"✅ No '{LEGACY_COLLECTION_NAME}' collection found, nothing to migrate")
+        return stats
+
+    target = chromadb_service.get_collection()
+    stats["legacy_records"] = legacy.count()
+    stats["target_records_before"] = target.count()
+
+    print(f"📊 {LEGACY_COLLECTION_NAME}: {stats['legacy_records']} kayıt")
+    print(f"📊 {chromadb_service.collection_name}: {stats['target_records_before']} kayıt")
+
+    if dry_run:
+        print("\n✅ Dry run tamamlandı. Gerçek migration için --apply kullanın.")
+        return stats
+
+    offset = 0
+    while True:
+        page = legacy.get(
+            include=["embeddings", "documents", "metadatas"],
+            limit=batch_size,
+            offset=offset
+        )
+        if not page["ids"]:
+            break
+        target.upsert(
+            ids=page["ids"],
+            embeddings=normalize_embeddings(page["embeddings"]),
+            documents=page["documents"],
+            metadatas=page["metadatas"]
+        )
+        offset += len(page["ids"])
+        stats["copied"] = offset
+        print(f"  ✅ {offset} kayıt kopyalandı")
+
+    print(f"\n✅ Migration tamamlandı: {stats['copied']} kayıt → {chromadb_service.collection_name}")
+    return stats
+
+
+def main():
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Copy the legacy ChromaDB memory collection into the current one"
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Migration'i uygula (varsayılan: dry-run)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"Sayfa başına kopyalanacak kayıt sayısı (varsayılan: {BATCH_SIZE})"
+    )
+
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🔧 Memory Collection Migration Script")
+    print("=" * 60)
+    print()
+
+    try:
+        migrate_memory_collection(dry_run=not args.apply, batch_size=args.batch_size)
+    except Exception as e:
+        print(f"❌ Hata: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
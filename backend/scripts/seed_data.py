@@ -18,10 +18,12 @@ from pathlib import Path
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from sqlalchemy import delete, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from backend.models.database import SessionLocal
+from backend.models.database import SessionLocal, create_script_engine
 from backend.models.question_prompt import QuestionPrompt
 from backend.prompts.master_prompts import (
     METRICS,
@@ -40,8 +42,21 @@ logger = logging.getLogger(__name__)
 CATEGORIES = ["Math", "Coding", "Medical", "General"]
 """Valid categories for questions"""
 
+_PROMPT_ROWS = tuple(
+    (
+        metric,
+        question_type,
+        BONUS_METRIC_MAPPINGS.get(metric, []),
+        MASTER_PROMPTS[metric]["user_prompt_template"],
+        get_golden_example(metric, question_type),
+    )
+    for metric in METRICS
+    for question_type in QUESTION_TYPES.get(metric, ())
+)
+"""Flattened (metric, question_type, bonus_metrics, user_prompt, golden_example) rows"""
+
 # Expected count: 8 metrics × 3 question_types = 24 prompts
-EXPECTED_COUNT = sum(len(qt_list) for qt_list in QUESTION_TYPES.values())
+EXPECTED_COUNT = len(_PROMPT_ROWS)
 """Total number of question prompts after Task 2.1 implementation"""
 
 
@@ -58,6 +73,9 @@ def seed_question_prompts(db: Session) -> int:
     - All with difficulty='medium' (as per Task 2.1 spec)
     - Each question_type has 1 golden example
 
+    Idempotent: prompts that already exist (same primary_metric and
+    question_type) are skipped, so re-seeding does not need --reset.
+
     Args:
         db: SQLAlchemy database session
 
@@ -72,37 +90,38 @@ def seed_question_prompts(db: Session) -> int:
     logger.info(f"    - All with difficulty='medium'")
     logger.info("")
 
-    count = 0
-
-    for metric in METRICS:
-        question_types = QUESTION_TYPES.get(metric, [])
-        logger.info(f"  Processing {metric}... ({len(question_types)} types)")
-
-        for question_type in question_types:
-            # Get golden example for this metric-type combination
-            golden_example = get_golden_example(metric, question_type)
-
-            if not golden_example:
-                logger.warning(f"    Warning: No golden example for {metric}:{question_type}")
-
-            # Create QuestionPrompt record
-            prompt = QuestionPrompt(
-                primary_metric=metric,
-                bonus_metrics=BONUS_METRIC_MAPPINGS.get(metric, []),
-                question_type=question_type,
-                user_prompt=MASTER_PROMPTS[metric]["user_prompt_template"],
-                golden_examples=[golden_example] if golden_example else [],
-                difficulty="medium",  # Fixed to medium for all prompts
-                category_hints=["any"],  # Default: any category
-                is_active=True
-            )
-            db.add(prompt)
-            count += 1
+    for metric, question_type, _, _, golden_example in _PROMPT_ROWS:
+        if not golden_example:
+            logger.warning(f"    Warning: No golden example for {metric}:{question_type}")
+
+    # Plain dicts straight from the precomputed tuples (no ORM __init__)
+    rows = [
+        {
+            "primary_metric": metric,
+            "bonus_metrics": bonus_metrics,
+            "question_type": question_type,
+            "user_prompt": user_prompt,
+            "golden_examples": [golden_example] if golden_example else [],
+            "difficulty": "medium",  # Fixed to medium for all prompts
+            "category_hints": ["any"],  # Default: any category
+            "is_active": True,
+        }
+        for metric, question_type, bonus_metrics, user_prompt, golden_example in _PROMPT_ROWS
+    ]
+
+    # Single multi-row INSERT; existing (metric, question_type) pairs are
+    # left untouched via idx_question_prompts_unique_metric_type
+    stmt = pg_insert(QuestionPrompt).values(rows).on_conflict_do_nothing(
+        index_elements=["primary_metric", "question_type"]
+    )
 
     try:
+        count = db.execute(stmt).rowcount
         db.commit()
         logger.info("")
         logger.info(f"✓ Seeded {count} question prompts")
+        if count < len(rows):
+            logger.info(f"  Skipped {len(rows) - count} existing prompts")
 
         # Log breakdown by metric
         logger.info("")
@@ -138,24 +157,30 @@ def verify_prompts(db: Session) -> dict:
         - by_difficulty: Dict of difficulty -> count
         - is_complete: True if all 24 prompts exist
     """
-    total_count = db.query(QuestionPrompt).count()
+    # Single aggregate instead of one COUNT per metric and per question type
+    rows = db.query(
+        QuestionPrompt.primary_metric,
+        QuestionPrompt.question_type,
+        func.count()
+    ).group_by(
+        QuestionPrompt.primary_metric,
+        QuestionPrompt.question_type
+    ).all()
+
+    grouped = {(metric, qt): count for metric, qt, count in rows}
+    total_count = sum(grouped.values())
 
     # Count by primary metric
-    metric_counts = {}
-    for metric in METRICS:
-        count = db.query(QuestionPrompt).filter_by(primary_metric=metric).count()
-        metric_counts[metric] = count
+    metric_counts = {metric: 0 for metric in METRICS}
+    for (metric, _), count in grouped.items():
+        if metric in metric_counts:
+            metric_counts[metric] += count
 
     # Count by question type
-    type_counts = {}
-    for metric in METRICS:
-        for qt in QUESTION_TYPES.get(metric, []):
-            key = f"{metric}:{qt}"
-            count = db.query(QuestionPrompt).filter_by(
-                primary_metric=metric,
-                question_type=qt
-            ).count()
-            type_counts[key] = count
+    type_counts = {
+        f"{metric}:{qt}": grouped.get((metric, qt), 0)
+        for metric, qt, *_ in _PROMPT_ROWS
+    }
 
     return {
         "count": total_count,
@@ -176,6 +201,11 @@ def reset_prompts(db: Session) -> bool:
 
     DESTRUCTIVE OPERATION: This will delete all question prompts.
 
+    Uses a set-based DELETE rather than TRUNCATE: questions.question_prompt_id
+    references this table, so TRUNCATE would need CASCADE and wipe the whole
+    question → response → evaluation chain. The id sequence is restarted so
+    a re-seed numbers prompts from 1 again (the RESTART IDENTITY part).
+
     Args:
         db: SQLAlchemy database session
 
@@ -183,7 +213,10 @@ def reset_prompts(db: Session) -> bool:
         True if successful, False otherwise
     """
     try:
-        deleted = db.query(QuestionPrompt).delete()
+        deleted = db.execute(delete(QuestionPrompt)).rowcount
+        db.execute(text(
+            "SELECT setval(pg_get_serial_sequence('question_prompts', 'id'), 1, false)"
+        ))
         db.commit()
         logger.warning(f"Deleted {deleted} question prompts")
         return True
@@ -272,8 +305,11 @@ Examples:
     logger.info("=" * 50)
     logger.info("-" * 50)
 
-    # Create database session
-    db = SessionLocal()
+    # Create database session on an unpooled, one-shot engine. Seeding and
+    # reset only run bulk statements, so pin autoflush/expire_on_commit off
+    # here rather than relying on the shared factory's defaults.
+    script_engine = create_script_engine()
+    db = SessionLocal(bind=script_engine, autoflush=False, expire_on_commit=False)
 
     try:
         # Verify mode
@@ -290,16 +326,15 @@ Examples:
             logger.info("By Metric:")
             for metric in METRICS:
                 count = results['by_metric'][metric]
-                status = "✓" if count == len(DIFFICULTIES) else "✗"
+                status = "✓" if count == len(QUESTION_TYPES.get(metric, [])) else "✗"
                 logger.info(f"  {status} {metric}: {count}")
             logger.info("")
             logger.info("By Question Type:")
-            for metric in METRICS:
-                for qt in QUESTION_TYPES.get(metric, []):
-                    key = f"{metric}:{qt}"
-                    count = results['by_question_type'].get(key, 0)
-                    status = "✓" if count == 1 else "✗"
-                    logger.info(f"  {status} {key}: {count}")
+            for metric, qt, *_ in _PROMPT_ROWS:
+                key = f"{metric}:{qt}"
+                count = results['by_question_type'].get(key, 0)
+                status = "✓" if count == 1 else "✗"
+                logger.info(f"  {status} {key}: {count}")
 
             logger.info("-" * 50)
             return 0 if results['is_complete'] else 1
@@ -343,6 +378,7 @@ Examples:
 
     finally:
         db.close()
+        script_engine.dispose()
 
 
 if __name__ == "__main__":
@@ -7,7 +7,8 @@ Usage: docker-compose exec backend python scripts/test_db_connection.py
 import sys
 import time
 from sqlalchemy import text
-from backend.models.database import engine, test_database_connection
+from sqlalchemy.exc import SQLAlchemyError
+from backend.models.database import engine
 from backend.config.settings import settings
 
 
@@ -20,24 +21,26 @@ def main():
     print(f"User: {settings.postgres_user}")
     print("-" * 60)
 
-    # Test connection latency
-    start_time = time.time()
-    if test_database_connection():
-        db_latency = (time.time() - start_time) * 1000
+    # One checkout covers the latency probe, pool info and table listing
+    try:
+        with engine.connect() as conn:
+            # Test connection latency
+            start_time = time.perf_counter()
+            conn.execute(text("SELECT 1"))
+            db_latency = (time.perf_counter() - start_time) * 1000
 
-        print(f"\nSUCCESS: Database is reachable")
-        print(f"   Latency: {db_latency:.2f}ms")
+            print(f"\nSUCCESS: Database is reachable")
+            print(f"   Latency: {db_latency:.2f}ms")
 
-        # Pool info
-        pool = engine.pool
-        print(f"\nConnection Pool:")
-        print(f"  Pool Size: {pool.size()}")
-        print(f"  Max Overflow: {pool._max_overflow}")
-        print(f"  Checked Out: {pool.checkedout()}")
+            # Pool info
+            pool = engine.pool
+            print(f"\nConnection Pool:")
+            print(f"  Pool Size: {pool.size()}")
+            print(f"  Max Overflow: {pool._max_overflow}")
+            print(f"  Checked Out: {pool.checkedout()}")
 
-        # List tables
-        try:
-            with engine.connect() as conn:
+            # List tables
+            try:
                 result = conn.execute(text("""
                     SELECT tablename FROM pg_tables
                     WHERE schemaname = 'public'
@@ -49,12 +52,12 @@ def main():
                         print(f"  - {table}")
                 else:
                     print("  (No tables yet)")
-        except Exception as e:
-            print(f"\nWARNING: Could not list tables: {e}")
+            except Exception as e:
+                print(f"\nWARNING: Could not list tables: {e}")
 
         return 0
-    else:
-        print("\nFAILURE: Database is not reachable")
+    except SQLAlchemyError as e:
+        print(f"\nFAILURE: Database is not reachable ({e})")
         print("\nTroubleshooting:")
         print("  1. docker-compose ps postgres")
         print("  2. docker-compose logs postgres")
@@ -2,57 +2,97 @@
 MentorMind - Business Logic Services Package
 
 This package contains service layer for business logic.
+
+Exports are resolved lazily (PEP 562): importing one submodule, e.g.
+``backend.services.chromadb_service``, no longer loads every other
+service (and its SDK client) through this package.
+
+Singleton instances share their submodule's name (``claude_service``,
+``chromadb_service``, ``llm_logger``, ...). The import system binds each
+imported submodule as a package attribute, so the package rebinds those
+names to the instance, as the former eager imports did:
+``from backend.services import chromadb_service`` returns the instance.
 """
 
-# =====================================================
-# Claude AI Service
-# =====================================================
-from backend.services.claude_service import (
-    ClaudeService,
-    claude_service,
-    generate_question,
-    select_category,
-)
+import importlib
+import sys
+import types
+from typing import Any
 
 # =====================================================
-# Model Service (K Models via OpenRouter)
+# Lazy Export Table (attribute -> submodule)
 # =====================================================
-from backend.services.model_service import (
-    ModelService,
-    model_service,
-    select_model,
-    answer_question,
+
+_EXPORTS = {
+    # Claude AI Service
+    "ClaudeService": "claude_service",
+    "claude_service": "claude_service",
+    "get_claude_service": "claude_service",
+    "generate_question": "claude_service",
+    "select_category": "claude_service",
+    # Model Service (K Models via OpenRouter)
+    "ModelService": "model_service",
+    "model_service": "model_service",
+    "select_model": "model_service",
+    "answer_question": "model_service",
+    # LLM Logger Service
+    "llm_logger": "llm_logger",
+    "log_llm_call": "llm_logger",
+    # Judge Service (GPT-4o)
+    "JudgeService": "judge_service",
+    "judge_service": "judge_service",
+    # ChromaDB Vector Memory Service
+    "ChromaDBService": "chromadb_service",
+    "chromadb_service": "chromadb_service",
+    "get_chromadb_service": "chromadb_service",
+    # Evidence Service (Stage 1 Parser)
+    "parse_evidence_from_stage1": "evidence_service",
+    "_validate_evidence_list": "evidence_service",
+    "_is_valid_evidence_item": "evidence_service",
+    "convert_to_evidence_by_metric": "evidence_service",
+}
+
+
+# Singleton instances named after their own submodule
+_INSTANCE_EXPORTS = frozenset(
+    name for name, module_name in _EXPORTS.items() if name == module_name
 )
 
-# =====================================================
-# LLM Logger Service
-# =====================================================
-from backend.services.llm_logger import llm_logger, log_llm_call
 
-# =====================================================
-# Judge Service (GPT-4o)
-# =====================================================
-from backend.services.judge_service import JudgeService, judge_service
+def __getattr__(name: str) -> Any:
+    """Import the owning submodule on first access and cache the attribute."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# =====================================================
-# ChromaDB Vector Memory Service
-# =====================================================
-from backend.services.chromadb_service import ChromaDBService, chromadb_service
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+class _ServicesPackage(types.ModuleType):
+    """Package module that keeps singleton instances over same-named submodules."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # The import system sets each loaded submodule as a package
+        # attribute; bind the submodule's singleton instead
+        if name in _INSTANCE_EXPORTS and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _ServicesPackage
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
 
-# =====================================================
-# Evidence Service (Stage 1 Parser)
-# =====================================================
-from backend.services.evidence_service import (
-    parse_evidence_from_stage1,
-    _validate_evidence_list,
-    _is_valid_evidence_item,
-    convert_to_evidence_by_metric,
-)
 
 __all__ = [
     # Claude Service
     "ClaudeService",
     "claude_service",
+    "get_claude_service",
     "generate_question",
     "select_category",
     # Model Service
@@ -69,6 +109,7 @@ __all__ = [
     # ChromaDB Service
     "ChromaDBService",
     "chromadb_service",
+    "get_chromadb_service",
     # Evidence Service
     "parse_evidence_from_stage1",
     "_validate_evidence_list",
@@ -19,20 +19,115 @@ Usage:
 
     # Query past mistakes (Task 4.3)
     results = chromadb_service.query_past_mistakes("Truthfulness", "Math", n=5)
+
+    # Async health checks (AsyncHttpClient) for event-loop callers
+    count = await chromadb_service.aget_collection_count()
 """
 
-import json
+import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Optional, Any
 
 import chromadb
+from chromadb.api import AsyncClientAPI
 from chromadb.config import Settings
-import chromadb.utils.embedding_functions as embedding_functions
+import numpy as np
+import orjson
+from sqlalchemy import and_, select
 
 from backend.config.settings import settings
+from backend.services.embeddings import (
+    CachingEmbeddingFunction,
+    create_embedding_function,
+)
 
 logger = logging.getLogger(__name__)
 
+COLLECTION_METADATA = {
+    "description": "User evaluation patterns and past mistakes",
+    "hnsw:space": "ip"  # Inner product on L2-normalized vectors (= cosine ranking)
+}
+"""Metadata used when creating the evaluation memory collection"""
+
+
+def _mmr_select(
+    embeddings: np.ndarray,
+    query_similarity: np.ndarray,
+    k: int,
+    lambda_mult: float
+) -> list[int]:
+    """
+    Pick k diverse candidates by Maximal Marginal Relevance.
+
+    All pairwise similarities are computed once with a single matmul on
+    L2-normalized embeddings; each step then only updates a running max
+    of similarity to the already-selected rows.
+
+    Args:
+        embeddings: Candidate embeddings, shape (m, d)
+        query_similarity: Cosine similarity of each candidate to the query, shape (m,)
+        k: Number of candidates to select
+        lambda_mult: Relevance weight (1.0 = pure relevance, 0.0 = pure diversity)
+
+    Returns:
+        Selected candidate indices in selection order
+    """
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings = embeddings / np.where(norms == 0, 1, norms)
+    similarity = embeddings @ embeddings.T
+
+    selected = [int(np.argmax(query_similarity))]
+    max_similarity = similarity[selected[0]].copy()
+    available = np.ones(len(embeddings), dtype=bool)
+    available[selected[0]] = False
+
+    while len(selected) < min(k, len(embeddings)):
+        scores = lambda_mult * query_similarity - (1 - lambda_mult) * max_similarity
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        np.maximum(max_similarity, similarity[best], out=max_similarity)
+
+    return selected
+
+
+def _classify_verdict(verdict: str) -> str:
+    """Map a verdict string to its mistake-pattern suffix ("" if none)."""
+    if 'significantly_over' in verdict or 'over_estimated' in verdict:
+        return "over"
+    if 'significantly_under' in verdict or 'under_estimated' in verdict:
+        return "under"
+    if 'significantly_off' in verdict:
+        return "off"
+    return ""
+
+
+def _scores_json(scores: dict) -> str:
+    """Serialize a score dict for document text; empty dicts skip the encoder."""
+    if not scores:
+        return "{}"
+    return orjson.dumps(scores).decode()
+
+
+_VERDICT_SUFFIX: dict[str, str] = {
+    verdict: _classify_verdict(verdict)
+    for verdict in (
+        "aligned",
+        "not_applicable",
+        *(
+            f"{degree}_{direction}_estimated"
+            for degree in ("slightly", "moderately", "significantly")
+            for direction in ("over", "under")
+        ),
+    )
+}
+"""Known verdict → pattern suffix; other verdicts fall back to _classify_verdict"""
+
 
 # =====================================================
 # ChromaDB Service Class
@@ -48,8 +143,8 @@ class ChromaDBService:
     - Embedding function configuration (OpenAI)
     - Connection health testing
 
-    Future (Tasks 4.2, 4.3):
-    - add_to_memory() - Store evaluations as embeddings
+    Memory (Tasks 4.2, 4.3):
+    - add_to_memory() / add_to_memory_bulk() - Store evaluations as embeddings
     - query_past_mistakes() - Retrieve similar past evaluations
     """
 
@@ -60,24 +155,71 @@ class ChromaDBService:
         self.collection_name: str = settings.chroma_collection_name
         self.api_key: Optional[str] = settings.openai_api_key  # For embeddings
 
-        # ChromaDB client (initialized lazily)
+        # ChromaDB clients (initialized lazily)
         self._client: Optional[chromadb.Client] = None
+        self._async_client: Optional[AsyncClientAPI] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
 
-        # Embedding function (OpenAI text-embedding-3-small)
-        self._embedding_function = embedding_functions.OpenAIEmbeddingFunction(
-            api_key=self.api_key,
-            model_name=settings.embedding_model
-        )
+        # Collection handles (cached after first get_or_create round-trip)
+        self._collection = None
+        self._collection_lock = threading.Lock()
+        self._async_collection = None
+
+        # query_past_mistakes TTL-LRU: (metric, category, n) -> (expires_at, result)
+        self._query_cache: OrderedDict[tuple[str, str, int], tuple[float, dict]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
+        # Embedding function (settings.embedding_backend), built on first use
+        self._embedding_function: Optional[CachingEmbeddingFunction] = None
 
         logger.info(
             f"ChromaDBService initialized: host={self.host}, "
             f"port={self.port}, collection={self.collection_name}"
         )
 
+    @property
+    def embedding_function(self) -> CachingEmbeddingFunction:
+        """
+        Collection embedding function, created lazily.
+
+        Backend comes from settings.embedding_backend: local MiniLM
+        (default) or batched OpenAI. Deferred so importing this module
+        (which builds the global service instance) loads no model and
+        constructs no OpenAI client. Wrapped in the shared embedding
+        cache, so repeat texts are not re-embedded.
+
+        Returns:
+            Cached CachingEmbeddingFunction instance
+        """
+        if self._embedding_function is None:
+            self._embedding_function = create_embedding_function(
+                settings.embedding_backend,
+                api_key=self.api_key
+            )
+        return self._embedding_function
+
     # =====================================================
     # Connection Management
     # =====================================================
 
+    def _client_settings(self) -> Settings:
+        """
+        Build ChromaDB client settings shared by the sync and async clients.
+
+        Keep-alive and pool limits are tuned so repeated add/query calls
+        reuse warm connections instead of the client's small defaults.
+
+        Returns:
+            ChromaDB Settings instance
+        """
+        return Settings(
+            anonymized_telemetry=False,
+            allow_reset=True,
+            chroma_http_keepalive_secs=settings.chroma_http_keepalive_seconds,
+            chroma_http_max_connections=settings.chroma_http_max_connections,
+            chroma_http_max_keepalive_connections=settings.chroma_http_max_keepalive_connections,
+        )
+
     def _get_client(self) -> chromadb.Client:
         """
         Get or create ChromaDB HTTP client.
@@ -97,10 +239,7 @@ class ChromaDBService:
                 self._client = chromadb.HttpClient(
                     host=self.host,
                     port=self.port,
-                    settings=Settings(
-                        anonymized_telemetry=False,
-                        allow_reset=True
-                    )
+                    settings=self._client_settings()
                 )
                 logger.info(f"Connected to ChromaDB at {self.host}:{self.port}")
             except Exception as e:
@@ -111,6 +250,41 @@ class ChromaDBService:
 
         return self._client
 
+    async def _get_async_client(self) -> AsyncClientAPI:
+        """
+        Get or create ChromaDB async HTTP client for the running event loop.
+
+        Async counterpart of _get_client() used by the a*-prefixed
+        methods so Chroma I/O does not block the event loop. The client's
+        connection pool is bound to the loop it was created on, so a call
+        from a different loop (e.g. asyncio.run in a worker thread) gets a
+        fresh client instead of reusing one from a foreign loop.
+
+        Returns:
+            ChromaDB async HTTP client instance
+
+        Raises:
+            RuntimeError: If connection to ChromaDB fails
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            try:
+                self._async_client = await chromadb.AsyncHttpClient(
+                    host=self.host,
+                    port=self.port,
+                    settings=self._client_settings()
+                )
+                self._async_loop = loop
+                self._async_collection = None
+                logger.info(f"Connected to ChromaDB (async) at {self.host}:{self.port}")
+            except Exception as e:
+                logger.error(f"Failed to connect to ChromaDB (async): {e}")
+                raise RuntimeError(
+                    f"ChromaDB connection failed: {e}"
+                )
+
+        return self._async_client
+
     def test_connection(self) -> bool:
         """
         Test connection to ChromaDB server.
@@ -131,6 +305,34 @@ class ChromaDBService:
             logger.warning(f"ChromaDB connection test: FAILED - {e}")
             return False
 
+    async def atest_connection(self) -> bool:
+        """
+        Async variant of test_connection() (does not block the event loop).
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            client = await self._get_async_client()
+            await client.heartbeat()
+            logger.debug("ChromaDB connection test (async): SUCCESS")
+            return True
+        except Exception as e:
+            logger.warning(f"ChromaDB connection test (async): FAILED - {e}")
+            return False
+
+    def close(self) -> None:
+        """
+        Drop the cached ChromaDB clients and collection handles.
+
+        Called from the app lifespan on shutdown. ChromaDB's client
+        wrappers expose no public close(), so the pooled connections are
+        released with the client objects (or at process exit); the next
+        call after close() reconnects.
+        """
+        self.invalidate_collection()
+        logger.info("ChromaDB clients released")
+
     # =====================================================
     # Collection Management
     # =====================================================
@@ -142,36 +344,91 @@ class ChromaDBService:
         The collection stores evaluation embeddings with metadata
         for similarity search and pattern recognition.
 
-        Collection name: "evaluation_memory" (from settings)
-        Embedding function: OpenAI text-embedding-3-small
-        Similarity metric: cosine (default)
+        Collection name: "evaluation_memory_ip" (from settings)
+        Embedding function: settings.embedding_backend (MiniLM by default)
+        Similarity metric: inner product on L2-normalized vectors
+
+        The handle is cached after the first call; invalidate_collection()
+        drops it (and the client) after a connection error. Records from
+        the legacy cosine collection are copied by
+        scripts/migrate_memory_collection.py.
 
         Returns:
             ChromaDB collection object
 
+        Raises:
+            RuntimeError: If collection retrieval/creation fails
+        """
+        collection = self._collection
+        if collection is not None:
+            return collection
+
+        # One thread creates the collection; concurrent first callers wait
+        # and reuse its handle
+        with self._collection_lock:
+            if self._collection is not None:
+                return self._collection
+
+            try:
+                client = self._get_client()
+
+                collection = client.get_or_create_collection(
+                    name=self.collection_name,
+                    metadata=COLLECTION_METADATA,
+                    embedding_function=self.embedding_function
+                )
+
+                logger.debug(f"Retrieved collection: {self.collection_name}")
+                self._collection = collection
+                return collection
+
+            except Exception as e:
+                logger.error(f"Failed to get collection: {e}")
+                raise RuntimeError(f"Collection retrieval failed: {e}")
+
+    async def aget_collection(self):
+        """
+        Async variant of get_collection().
+
+        Returns:
+            ChromaDB async collection object
+
         Raises:
             RuntimeError: If collection retrieval/creation fails
         """
         try:
-            client = self._get_client()
+            # Resolve the client first: it drops the cached collection when
+            # called from a different event loop
+            client = await self._get_async_client()
+            if self._async_collection is not None:
+                return self._async_collection
 
-            # Get or create collection without embedding function (API compatibility)
-            # We'll use the embedding function directly when adding/querying documents
-            collection = client.get_or_create_collection(
+            collection = await client.get_or_create_collection(
                 name=self.collection_name,
-                metadata={
-                    "description": "User evaluation patterns and past mistakes",
-                    "hnsw:space": "cosine"  # Similarity metric
-                }
+                metadata=COLLECTION_METADATA,
+                embedding_function=self.embedding_function
             )
-
-            logger.debug(f"Retrieved collection: {self.collection_name}")
+            logger.debug(f"Retrieved collection (async): {self.collection_name}")
+            self._async_collection = collection
             return collection
 
         except Exception as e:
             logger.error(f"Failed to get collection: {e}")
             raise RuntimeError(f"Collection retrieval failed: {e}")
 
+    def invalidate_collection(self) -> None:
+        """
+        Drop cached clients and collection handles.
+
+        Called after a failed ChromaDB operation so the next call
+        reconnects instead of reusing a possibly dead connection.
+        """
+        self._client = None
+        self._collection = None
+        self._async_client = None
+        self._async_loop = None
+        self._async_collection = None
+
     def get_collection_count(self) -> int:
         """
         Get the number of documents in the collection.
@@ -193,6 +450,22 @@ class ChromaDBService:
             logger.error(f"Failed to get collection count: {e}")
             return 0
 
+    async def aget_collection_count(self) -> int:
+        """
+        Async variant of get_collection_count().
+
+        Returns:
+            Number of documents in collection (0 if empty or on failure)
+        """
+        try:
+            collection = await self.aget_collection()
+            count = await collection.count()
+            logger.debug(f"Collection count: {count}")
+            return count
+        except Exception as e:
+            logger.error(f"Failed to get collection count: {e}")
+            return 0
+
     # =====================================================
     # Memory Operations (Tasks 4.2 & 4.3)
     # =====================================================
@@ -210,6 +483,9 @@ class ChromaDBService:
         balanced detail level (~500 chars), and stores as embedding for
         pattern recognition in future judge evaluations.
 
+        Thin wrapper around add_to_memory_bulk() for a single evaluation.
+        Writes are upserts, so re-adding an evaluation replaces its document.
+
         Args:
             db_session: SQLAlchemy database session (dependency injection)
             user_eval_id: User evaluation ID (format: eval_YYYYMMDD_...)
@@ -219,69 +495,165 @@ class ChromaDBService:
             ValueError: If evaluation data not found
             RuntimeError: If ChromaDB operation fails
         """
-        from backend.models.user_evaluation import UserEvaluation
-        from backend.models.judge_evaluation import JudgeEvaluation
-        from backend.models.model_response import ModelResponse
-        from backend.models.question import Question
+        self.add_to_memory_bulk(db_session, [(user_eval_id, judge_eval_id)])
 
-        # Fetch evaluation data (4-table join via manual queries)
-        user_eval = db_session.query(UserEvaluation).filter_by(id=user_eval_id).first()
-        if not user_eval:
-            raise ValueError(f"User evaluation {user_eval_id} not found")
-
-        judge_eval = db_session.query(JudgeEvaluation).filter_by(id=judge_eval_id).first()
-        if not judge_eval:
-            raise ValueError(f"Judge evaluation {judge_eval_id} not found")
-
-        model_response = db_session.query(ModelResponse).filter_by(id=user_eval.response_id).first()
-        if not model_response:
-            raise ValueError(f"Model response {user_eval.response_id} not found")
-
-        question = db_session.query(Question).filter_by(id=model_response.question_id).first()
-        if not question:
-            raise ValueError(f"Question {model_response.question_id} not found")
-
-        # Determine primary metric
-        primary_metric = judge_eval.primary_metric
-        bonus_metrics = question.bonus_metrics or []
-
-        # Create balanced document text (~500 chars)
-        document_text = self._create_document_text(
-            user_eval=user_eval,
-            judge_eval=judge_eval,
-            question=question,
-            model_response=model_response,
-            primary_metric=primary_metric
-        )
+    def add_to_memory_bulk(
+        self,
+        db_session: Any,
+        pairs: list[tuple[str, str]],
+        batch_size: int = 128
+    ) -> int:
+        """
+        Store multiple evaluations in ChromaDB vector memory.
 
-        # Create metadata for filtering
-        metadata = {
-            "evaluation_id": user_eval_id,
-            "judge_id": judge_eval_id,
-            "category": question.category,
-            "primary_metric": primary_metric,
-            "difficulty": question.difficulty,
-            "judge_meta_score": judge_eval.judge_meta_score,
-            "primary_metric_gap": judge_eval.primary_metric_gap,
-            "weighted_gap": judge_eval.weighted_gap,
-            "model_name": model_response.model_name,
-            "timestamp": judge_eval.created_at.isoformat(),
-            "mistake_pattern": self._extract_mistake_pattern(judge_eval.alignment_analysis)
-        }
+        Related rows are fetched with a single joined query, and documents
+        are written with one collection.upsert() per batch_size records
+        instead of one call per evaluation.
+
+        Args:
+            db_session: SQLAlchemy database session (dependency injection)
+            pairs: (user_eval_id, judge_eval_id) tuples to store
+            batch_size: Records per collection.upsert() call (default: 128)
+
+        Returns:
+            Number of evaluations stored (low-signal ones are skipped)
+
+        Raises:
+            ValueError: If evaluation data not found for any pair
+            RuntimeError: If ChromaDB operation fails
+        """
+        if not pairs:
+            return 0
+
+        ids, documents, metadatas = self._build_memory_records(db_session, pairs)
+        if not ids:
+            return 0
 
-        # Add to ChromaDB collection
+        # Add to ChromaDB collection in batches
         try:
             collection = self.get_collection()
-            collection.add(
-                ids=[user_eval_id],  # Use user_eval_id as document ID
-                documents=[document_text],
-                metadatas=[metadata]
-            )
-            logger.info(f"Added evaluation {user_eval_id} to ChromaDB memory")
+            for start in range(0, len(ids), batch_size):
+                end = start + batch_size
+                collection.upsert(
+                    ids=ids[start:end],
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end]
+                )
+            self._invalidate_cached_queries(metadatas)
+            logger.info(f"Added {len(ids)} evaluation(s) to ChromaDB memory")
+            return len(ids)
         except Exception as e:
             logger.error(f"Failed to add to ChromaDB: {e}")
+            self.invalidate_collection()
             raise RuntimeError(f"ChromaDB add failed: {e}")
 
+    def _build_memory_records(
+        self,
+        db_session: Any,
+        pairs: list[tuple[str, str]]
+    ) -> tuple[list[str], list[str], list[dict]]:
+        """
+        Fetch evaluation data and build Chroma ids, documents and metadatas.
+
+        Args:
+            db_session: SQLAlchemy database session
+            pairs: (user_eval_id, judge_eval_id) tuples to store
+
+        Low-signal evaluations (see _is_low_signal) are left out.
+
+        Returns:
+            (ids, documents, metadatas) lists in pair order
+
+        Raises:
+            ValueError: If evaluation data not found for any pair
+        """
+        from backend.models.user_evaluation import UserEvaluation
+        from backend.models.judge_evaluation import JudgeEvaluation
+        from backend.models.model_response import ModelResponse
+        from backend.models.question import Question
+
+        # Fetch evaluation data in a single round-trip: one outer-joined
+        # SELECT for all pairs, so missing rows still surface as None below
+        stmt = (
+            select(UserEvaluation, JudgeEvaluation, ModelResponse, Question)
+            .outerjoin(
+                JudgeEvaluation,
+                and_(
+                    JudgeEvaluation.user_evaluation_id == UserEvaluation.id,
+                    JudgeEvaluation.id.in_({judge_eval_id for _, judge_eval_id in pairs})
+                )
+            )
+            .outerjoin(ModelResponse, ModelResponse.id == UserEvaluation.response_id)
+            .outerjoin(Question, Question.id == ModelResponse.question_id)
+            .where(UserEvaluation.id.in_({user_eval_id for user_eval_id, _ in pairs}))
+        )
+
+        user_rows = {}
+        judge_evals = {}
+        for user_eval, judge_eval, model_response, question in db_session.execute(stmt):
+            user_rows[user_eval.id] = (user_eval, model_response, question)
+            if judge_eval is not None:
+                judge_evals[judge_eval.id] = judge_eval
+
+        ids = []
+        documents = []
+        metadatas = []
+
+        for user_eval_id, judge_eval_id in pairs:
+            user_row = user_rows.get(user_eval_id)
+            if not user_row:
+                raise ValueError(f"User evaluation {user_eval_id} not found")
+            user_eval, model_response, question = user_row
+
+            judge_eval = judge_evals.get(judge_eval_id)
+            if not judge_eval:
+                raise ValueError(f"Judge evaluation {judge_eval_id} not found")
+
+            if not model_response:
+                raise ValueError(f"Model response {user_eval.response_id} not found")
+
+            if not question:
+                raise ValueError(f"Question {model_response.question_id} not found")
+
+            # Skip low-signal evaluations: a high meta score with a near-zero
+            # primary gap adds nothing to past-mistake pattern recall
+            if self._is_low_signal(judge_eval):
+                logger.debug(f"Skipping low-signal evaluation {user_eval_id} for memory")
+                continue
+
+            # Determine primary metric
+            primary_metric = judge_eval.primary_metric
+
+            ids.append(user_eval_id)  # Use user_eval_id as document ID
+
+            # Create balanced document text (~500 chars)
+            documents.append(self._create_document_text(
+                user_eval=user_eval,
+                judge_eval=judge_eval,
+                question=question,
+                model_response=model_response,
+                primary_metric=primary_metric
+            ))
+
+            # Create metadata for filtering
+            metadatas.append({
+                "evaluation_id": user_eval_id,
+                "judge_id": judge_eval_id,
+                "category": question.category,
+                "primary_metric": primary_metric,
+                "difficulty": question.difficulty,
+                "judge_meta_score": judge_eval.judge_meta_score,
+                "primary_metric_gap": judge_eval.primary_metric_gap,
+                "weighted_gap": judge_eval.weighted_gap,
+                "model_name": model_response.model_name,
+                # Epoch seconds for numeric range filters; ISO copy for display
+                "timestamp": int(judge_eval.created_at.timestamp()),
+                "timestamp_iso": judge_eval.created_at.isoformat(),
+                "mistake_pattern": self._extract_mistake_pattern(judge_eval.alignment_analysis)
+            })
+
+        return ids, documents, metadatas
+
     def query_past_mistakes(
         self,
         primary_metric: str,
@@ -293,6 +665,9 @@ class ChromaDBService:
 
         Searches for evaluations matching the same primary_metric and category
         to find patterns in user mistakes for context in Stage 2 feedback.
+        Results are cached per (primary_metric, category, n) for
+        settings.chroma_query_cache_ttl_seconds and dropped when a matching
+        evaluation is added.
 
         Args:
             primary_metric: Metric being evaluated (e.g., "Truthfulness")
@@ -309,7 +684,8 @@ class ChromaDBService:
                         "primary_gap": 1.2,
                         "feedback": "Overestimated minor errors...",
                         "mistake_pattern": "Truthfulness_bias",
-                        "timestamp": "2025-01-30T14:30:00Z"
+                        "timestamp": "2025-01-30T14:30:00Z",
+                        "timestamp_epoch": 1738247400
                     },
                     ...
                 ]
@@ -318,56 +694,224 @@ class ChromaDBService:
         Raises:
             RuntimeError: If ChromaDB query fails
         """
+        cache_key = (primary_metric, category, n)
+        cached = self._get_cached_query(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             collection = self.get_collection()
-
-            # Query text for embedding
-            query_text = f"User evaluating {primary_metric} in {category} category"
-
-            # Query with metadata filter (ChromaDB 1.x syntax)
-            results = collection.query(
-                query_texts=[query_text],
-                n_results=n,
-                where={"$and": [
-                    {"primary_metric": primary_metric},
-                    {"category": category}
-                ]}
-            )
-
-            # Handle empty results
-            if not results or not results['ids'] or not results['ids'][0]:
-                logger.info(f"No past mistakes found for {primary_metric} in {category}")
-                return {"evaluations": []}
-
-            # Format results into simplified structure
-            evaluations = []
-            for i, doc_id in enumerate(results['ids'][0]):
-                metadata = results['metadatas'][0][i]
-                # Extract feedback from document if available
-                feedback = self._extract_feedback_from_doc(
-                    results.get('documents', [[]])[0][i] if results.get('documents') else ""
-                )
-                evaluations.append({
-                    "evaluation_id": metadata.get('evaluation_id', doc_id),
-                    "category": metadata.get('category', ''),
-                    "judge_meta_score": metadata.get('judge_meta_score', 0),
-                    "primary_gap": metadata.get('primary_metric_gap', 0.0),
-                    "feedback": feedback,
-                    "mistake_pattern": metadata.get('mistake_pattern', ''),
-                    "timestamp": metadata.get('timestamp', '')
-                })
-
-            logger.info(f"Found {len(evaluations)} past mistakes for {primary_metric} in {category}")
-            return {"evaluations": evaluations}
+            results = collection.query(**self._past_mistakes_query(primary_metric, category, n))
+            results = self._rerank_past_mistakes(results, n)
+            formatted = self._format_past_mistakes(results, primary_metric, category)
+            self._store_cached_query(cache_key, formatted)
+            return formatted
 
         except Exception as e:
             logger.error(f"Failed to query ChromaDB: {e}")
+            self.invalidate_collection()
             raise RuntimeError(f"ChromaDB query failed: {e}")
 
+    # =====================================================
+    # Query Cache
+    # =====================================================
+
+    def _get_cached_query(self, key: tuple[str, str, int]) -> Optional[dict]:
+        """
+        Return a cached query_past_mistakes result if present and fresh.
+
+        Args:
+            key: (primary_metric, category, n)
+
+        Returns:
+            Copy of the cached result, or None on miss/expiry
+        """
+        with self._query_cache_lock:
+            entry = self._query_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._query_cache[key]
+                return None
+            self._query_cache.move_to_end(key)
+
+        # Fresh list so callers cannot mutate the cached entry
+        return {"evaluations": list(result["evaluations"])}
+
+    def _store_cached_query(self, key: tuple[str, str, int], result: dict) -> None:
+        """
+        Cache a query_past_mistakes result, evicting the least recently used.
+
+        Args:
+            key: (primary_metric, category, n)
+            result: Formatted query result
+        """
+        with self._query_cache_lock:
+            self._query_cache[key] = (
+                time.monotonic() + settings.chroma_query_cache_ttl_seconds,
+                {"evaluations": list(result["evaluations"])}
+            )
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > settings.chroma_query_cache_maxsize:
+                self._query_cache.popitem(last=False)
+
+    def _invalidate_cached_queries(self, metadatas: list[dict]) -> None:
+        """
+        Drop cached results for every (primary_metric, category) just written.
+
+        Args:
+            metadatas: Metadata dicts of the documents added to the collection
+        """
+        touched = {(m["primary_metric"], m["category"]) for m in metadatas}
+        with self._query_cache_lock:
+            for key in [k for k in self._query_cache if k[:2] in touched]:
+                del self._query_cache[key]
+
+    def clear_query_cache(self) -> None:
+        """Drop all cached query_past_mistakes results."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
     # =====================================================
     # Helper Methods
     # =====================================================
 
+    def _past_mistakes_query(self, primary_metric: str, category: str, n: int) -> dict:
+        """
+        Build collection.query() arguments for query_past_mistakes().
+
+        Args:
+            primary_metric: Metric being evaluated
+            category: Question category
+            n: Number of results to return
+
+        Returns:
+            Keyword arguments for collection.query()
+        """
+        return {
+            # Query text for embedding
+            "query_texts": [f"User evaluating {primary_metric} in {category} category"],
+            # Over-fetch so MMR can pick n distinct patterns from the pool
+            "n_results": n * settings.memory_mmr_fetch_factor,
+            "include": ["embeddings", "documents", "metadatas", "distances"],
+            # Metadata filter (ChromaDB 1.x syntax)
+            "where": {"$and": [
+                {"primary_metric": primary_metric},
+                {"category": category}
+            ]}
+        }
+
+    def _rerank_past_mistakes(self, results: Any, n: int) -> Any:
+        """
+        Reduce over-fetched query results to n diverse hits with MMR.
+
+        Similarity to the query comes from the returned distances (ip
+        distance is 1 - dot product on unit vectors), so the query text is
+        not embedded a second time.
+
+        Args:
+            results: Raw collection.query() results (single query)
+            n: Number of results to keep
+
+        Returns:
+            Results with each per-query list reordered and cut to n
+        """
+        if not results or not results['ids'] or len(results['ids'][0]) <= n:
+            return results
+
+        embeddings = results.get('embeddings')
+        if embeddings is None or len(embeddings[0]) == 0:
+            order = list(range(n))
+        else:
+            order = _mmr_select(
+                np.asarray(embeddings[0], dtype=np.float32),
+                1.0 - np.asarray(results['distances'][0], dtype=np.float32),
+                n,
+                settings.memory_mmr_lambda
+            )
+
+        reranked = dict(results)
+        for field in ('ids', 'documents', 'metadatas', 'distances'):
+            if results.get(field):
+                reranked[field] = [[results[field][0][i] for i in order]]
+        reranked['embeddings'] = None
+        return reranked
+
+    def _format_past_mistakes(self, results: Any, primary_metric: str, category: str) -> dict:
+        """
+        Format raw collection.query() results into the past-mistakes shape.
+
+        Args:
+            results: Raw ChromaDB query results
+            primary_metric: Metric that was queried (for logging)
+            category: Category that was queried (for logging)
+
+        Returns:
+            {"evaluations": [...]} (see query_past_mistakes)
+        """
+        # Handle empty results
+        if not results or not results['ids'] or not results['ids'][0]:
+            logger.info(f"No past mistakes found for {primary_metric} in {category}")
+            return {"evaluations": []}
+
+        # Format results into simplified structure
+        evaluations = []
+        for i, doc_id in enumerate(results['ids'][0]):
+            metadata = results['metadatas'][0][i]
+            # Extract feedback from document if available
+            feedback = self._extract_feedback_from_doc(
+                results.get('documents', [[]])[0][i] if results.get('documents') else ""
+            )
+            evaluations.append({
+                "evaluation_id": metadata.get('evaluation_id', doc_id),
+                "category": metadata.get('category', ''),
+                "judge_meta_score": metadata.get('judge_meta_score', 0),
+                "primary_gap": metadata.get('primary_metric_gap', 0.0),
+                "feedback": feedback,
+                "mistake_pattern": metadata.get('mistake_pattern', ''),
+                **self._format_timestamps(metadata.get('timestamp'), metadata.get('timestamp_iso'))
+            })
+
+        logger.info(f"Found {len(evaluations)} past mistakes for {primary_metric} in {category}")
+        return {"evaluations": evaluations}
+
+    def _is_low_signal(self, judge_eval: Any) -> bool:
+        """
+        Check whether an evaluation is too uneventful to store in memory.
+
+        Thresholds come from settings; set memory_skip_min_meta_score
+        above 5 to store every evaluation.
+
+        Args:
+            judge_eval: JudgeEvaluation ORM object
+
+        Returns:
+            True if meta score is high and the primary gap is small
+        """
+        return (
+            judge_eval.judge_meta_score >= settings.memory_skip_min_meta_score
+            and abs(judge_eval.primary_metric_gap or 0.0) < settings.memory_skip_max_primary_gap
+        )
+
+    def _format_timestamps(self, timestamp: Any, timestamp_iso: Optional[str]) -> dict:
+        """
+        Normalize stored timestamp metadata for query results.
+
+        New documents store epoch seconds in "timestamp" plus "timestamp_iso";
+        older documents stored only an ISO string in "timestamp".
+
+        Args:
+            timestamp: Stored "timestamp" metadata (epoch int or legacy ISO str)
+            timestamp_iso: Stored "timestamp_iso" metadata, if any
+
+        Returns:
+            {"timestamp": ISO string, "timestamp_epoch": int or None}
+        """
+        if isinstance(timestamp, (int, float)):
+            return {"timestamp": timestamp_iso or "", "timestamp_epoch": int(timestamp)}
+        return {"timestamp": timestamp or timestamp_iso or "", "timestamp_epoch": None}
+
     def _create_document_text(
         self,
         user_eval: Any,
@@ -395,36 +939,32 @@ class ChromaDBService:
         # Extract user scores (only non-null scores)
         user_scores = {
             k: v['score']
-            for k, v in user_eval.evaluations.items()
+            for k, v in (user_eval.evaluations or {}).items()
             if v.get('score') is not None
         }
 
         # Extract judge scores
         judge_scores = {
             k: v['score']
-            for k, v in judge_eval.independent_scores.items()
+            for k, v in (judge_eval.independent_scores or {}).items()
         }
 
-        # Build document text
-        doc = (
-            f"User evaluated {model_response.model_name} on {question.category} question. "
-            f"Primary metric: {primary_metric}. "
-            f"User scores: {json.dumps(user_scores)}. "
-            f"Judge scores: {json.dumps(judge_scores)}. "
-            f"Meta score: {judge_eval.judge_meta_score}/5. "
-            f"Primary gap: {judge_eval.primary_metric_gap}. "
-        )
-
         # Truncate feedback if needed (keep first 150 chars)
         feedback = judge_eval.overall_feedback or ""
         if len(feedback) > 150:
             feedback = feedback[:147] + "..."
-        doc += f"Feedback: {feedback}"
-
-        # Add timestamp
-        doc += f". Timestamp: {judge_eval.created_at.strftime('%Y-%m-%d %H:%M')}"
 
-        return doc
+        # Build document text in one pass
+        return (
+            f"User evaluated {model_response.model_name} on {question.category} question. "
+            f"Primary metric: {primary_metric}. "
+            f"User scores: {_scores_json(user_scores)}. "
+            f"Judge scores: {_scores_json(judge_scores)}. "
+            f"Meta score: {judge_eval.judge_meta_score}/5. "
+            f"Primary gap: {judge_eval.primary_metric_gap}. "
+            f"Feedback: {feedback}. "
+            f"Timestamp: {judge_eval.created_at:%Y-%m-%d %H:%M}"
+        )
 
     def _extract_mistake_pattern(self, alignment_analysis: dict) -> str:
         """
@@ -442,13 +982,12 @@ class ChromaDBService:
         patterns = []
         for metric, data in alignment_analysis.items():
             if isinstance(data, dict):
-                verdict = data.get('verdict', '')
-                if 'significantly_over' in verdict or 'over_estimated' in verdict:
-                    patterns.append(f"{metric}_over")
-                elif 'significantly_under' in verdict or 'under_estimated' in verdict:
-                    patterns.append(f"{metric}_under")
-                elif 'significantly_off' in verdict:
-                    patterns.append(f"{metric}_off")
+                verdict = data.get('verdict') or ''
+                suffix = _VERDICT_SUFFIX.get(verdict)
+                if suffix is None:
+                    suffix = _classify_verdict(verdict)
+                if suffix:
+                    patterns.append(f"{metric}_{suffix}")
 
         return "_".join(patterns) if patterns else "no_clear_pattern"
 
@@ -465,16 +1004,12 @@ class ChromaDBService:
         if not document:
             return ""
 
-        # Find "Feedback: " in document
-        if "Feedback: " in document:
-            try:
-                feedback_start = document.index("Feedback: ") + len("Feedback: ")
-                feedback_end = document.find(".", feedback_start)
-                if feedback_end > feedback_start:
-                    feedback = document[feedback_start:feedback_end]
-                    return feedback[:200] if len(feedback) > 200 else feedback
-            except (ValueError, IndexError):
-                pass
+        # Split once on the marker, then once on the sentence end
+        _, marker, tail = document.partition("Feedback: ")
+        if marker:
+            feedback, period, _ = tail.partition(".")
+            if period and feedback:
+                return feedback[:200]
 
         # Fallback: return last 200 chars of document
         return document[-200:] if len(document) > 200 else document
@@ -484,4 +1019,18 @@ class ChromaDBService:
 # Global Service Instance
 # =====================================================
 
-chromadb_service = ChromaDBService()
+@lru_cache(maxsize=1)
+def get_chromadb_service() -> ChromaDBService:
+    """
+    Get the process-wide ChromaDBService (FastAPI dependency).
+
+    Async clients are bound per event loop inside the service, so one
+    instance is safe to share across loops.
+
+    Returns:
+        Shared ChromaDBService instance
+    """
+    return ChromaDBService()
+
+
+chromadb_service = get_chromadb_service()
@@ -11,12 +11,15 @@ Usage:
 
 import logging
 import random
-import secrets
+import re
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 import anthropic
+import orjson
 from sqlalchemy.orm import Session
 
 from backend.config.settings import settings
@@ -24,16 +27,21 @@ from backend.models.database import SessionLocal
 from backend.models.question import Question
 from backend.models.question_prompt import QuestionPrompt
 from backend.prompts.master_prompts import (
+    QUESTION_TYPES,
     get_golden_example,
     get_question_type_description,
-    get_question_types,
     render_user_prompt,
     validate_metric,
 )
+from backend.services.http_client import get_http_client
+from backend.services.ids import generate_id
 from backend.services.llm_logger import log_llm_call, LLMProvider
 
 logger = logging.getLogger(__name__)
 
+_CODE_FENCE_RE = re.compile(r"```(?:json)?(.*?)```", re.DOTALL)
+"""Markdown code block (optionally tagged json) around a JSON response"""
+
 
 # =====================================================
 # Category Pool (18 categories for 'any' selection)
@@ -75,6 +83,86 @@ LEGACY_CATEGORY_MAP = {
     "General": "Business"
 }
 
+# Immutable copies for the hot path: index with randrange instead of
+# rebuilding or re-looking-up lists on every generated question
+_DEFAULT_CATEGORY_POOL = tuple(DEFAULT_CATEGORY_POOL)
+_QUESTION_TYPES_BY_METRIC: dict[str, tuple[str, ...]] = {
+    metric: tuple(types) for metric, types in QUESTION_TYPES.items()
+}
+
+# Keys every generated question must contain
+_REQUIRED_FIELDS = frozenset(("question", "reference_answer", "expected_behavior", "rubric_breakdown"))
+_REQUIRED_RUBRIC_SCORES = frozenset("12345")
+
+_thread_local = threading.local()
+
+
+def _rng() -> random.Random:
+    """Return this thread's Random instance (no shared global RNG state)."""
+    rng = getattr(_thread_local, "rng", None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random()
+    return rng
+
+
+# =====================================================
+# Streamed JSON Object Scanner
+# =====================================================
+
+class _JsonObjectScanner:
+    """
+    Find where the first top-level JSON object ends in streamed text.
+
+    Tracks brace depth (ignoring braces inside strings) chunk by chunk, so
+    the end of the object is known the moment its closing brace arrives,
+    whether or not it is wrapped in a markdown code block.
+    """
+
+    def __init__(self):
+        self.start = -1
+        self.end = -1
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, text: str) -> bool:
+        """
+        Scan the next chunk of streamed text.
+
+        Args:
+            text: Next text delta
+
+        Returns:
+            True once the first object is complete (start/end are set)
+        """
+        for ch in text:
+            i = self._pos
+            self._pos += 1
+
+            if self.start < 0:
+                if ch == "{":
+                    self.start = i
+                    self._depth = 1
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = i + 1
+                    return True
+
+        return False
+
 
 # =====================================================
 # Claude Service Class
@@ -103,11 +191,29 @@ class ClaudeService:
         self.timeout = timeout
         self.model = settings.claude_question_model
 
-        # Initialize Anthropic client
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        # Anthropic client (shared connection pool), built on first use
+        self._client: anthropic.Anthropic | None = None
 
         logger.info(f"ClaudeService initialized with model={self.model}, timeout={timeout}s")
 
+    @property
+    def client(self) -> anthropic.Anthropic:
+        """
+        Anthropic client, created lazily.
+
+        Deferred so importing this module (which builds the global
+        service instance) creates no SDK or HTTP client.
+
+        Returns:
+            Cached Anthropic client instance
+        """
+        if self._client is None:
+            self._client = anthropic.Anthropic(
+                api_key=self.api_key,
+                http_client=get_http_client()
+            )
+        return self._client
+
     # =====================================================
     # Category Selection
     # =====================================================
@@ -138,16 +244,12 @@ class ClaudeService:
         """
         if not category_hints or category_hints == ["any"]:
             # Random selection from DEFAULT_CATEGORY_POOL
-            return random.choice(DEFAULT_CATEGORY_POOL)
-
-        # Map legacy categories if needed
-        mapped_hints = []
-        for hint in category_hints:
-            mapped = LEGACY_CATEGORY_MAP.get(hint, hint)
-            mapped_hints.append(mapped)
+            return _DEFAULT_CATEGORY_POOL[_rng().randrange(len(_DEFAULT_CATEGORY_POOL))]
 
-        # Random selection from provided hints
-        return random.choice(mapped_hints)
+        # Random selection from provided hints; only the picked hint needs
+        # its legacy name mapped
+        hint = category_hints[_rng().randrange(len(category_hints))]
+        return LEGACY_CATEGORY_MAP.get(hint, hint)
 
     # =====================================================
     # Question Generation (Pool Selection)
@@ -161,6 +263,11 @@ class ClaudeService:
         - Filter by primary_metric
         - Order by times_used ASC (least used first)
         - If tie, random among those with same times_used
+        - Questions with buffered (unflushed) selections are skipped, since
+          their times_used is not yet incremented; if every question is
+          pending, all of them are candidates again
+        - Rows locked by a concurrent selection are skipped; if all of them
+          are locked, wait for one instead of failing
 
         Args:
             primary_metric: The metric to filter by
@@ -172,25 +279,46 @@ class ClaudeService:
         Raises:
             ValueError: If no questions found for metric
         """
-        question = db.query(Question).filter(
+        from backend.tasks.pool_usage import pool_usage_buffer, record_pool_usage
+
+        # SKIP LOCKED: concurrent callers each take a different least-used
+        # row instead of queueing on the same one (served by
+        # idx_questions_metric_usage)
+        pool_query = db.query(Question).filter(
             Question.primary_metric == primary_metric
         ).order_by(
             Question.times_used.asc(),
             Question.created_at.desc()  # Newer questions first for ties
-        ).first()
+        )
+        question = None
+        pending_ids = pool_usage_buffer.pending_ids()
+        if pending_ids:
+            question = pool_query.filter(
+                Question.id.notin_(pending_ids)
+            ).with_for_update(skip_locked=True).first()
+
+        if not question:
+            question = pool_query.with_for_update(skip_locked=True).first()
+
+        if not question:
+            # Every matching row may be locked by concurrent selections;
+            # wait for a lock instead of reporting an empty pool
+            question = pool_query.with_for_update().first()
 
         if not question:
             raise ValueError(f"No questions found in pool for metric: {primary_metric}")
 
-        # Update usage tracking
-        question.times_used += 1
+        # Update usage tracking (batched by the background flusher when it
+        # runs; the commit then only ends the read and releases the row lock)
         now = datetime.now()
-        if question.first_used_at is None:
-            question.first_used_at = now
-        question.last_used_at = now
+        if not record_pool_usage(question.id, now):
+            question.times_used += 1
+            if question.first_used_at is None:
+                question.first_used_at = now
+            question.last_used_at = now
         db.commit()
 
-        logger.info(f"Selected question from pool: {question.id} (times_used={question.times_used})")
+        logger.info(f"Selected question from pool: {question.id}")
         return question
 
     # =====================================================
@@ -229,8 +357,8 @@ class ClaudeService:
             raise ValueError(f"Invalid metric: {primary_metric}")
 
         # 1. Get available question types for this metric
-        question_types = get_question_types(primary_metric)
-        question_type = random.choice(question_types)
+        question_types = _QUESTION_TYPES_BY_METRIC[primary_metric]
+        question_type = question_types[_rng().randrange(len(question_types))]
 
         # 2. Get prompt from database
         prompt = db.query(QuestionPrompt).filter(
@@ -253,10 +381,12 @@ class ClaudeService:
             difficulty=difficulty
         )
 
-        # 6. Call Claude API
-        start_time = time.time()
+        # 6. Call Claude API (streamed; stop once the JSON object closes)
+        start_ns = time.monotonic_ns()
+        scanner = _JsonObjectScanner()
+        chunks = []
         try:
-            response = self.client.messages.create(
+            with self.client.messages.stream(
                 model=self.model,
                 max_tokens=2000,
                 temperature=0.7,
@@ -267,26 +397,30 @@ class ClaudeService:
                     }
                 ],
                 timeout=self.timeout
-            )
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    if scanner.feed(text):
+                        break
+                usage = stream.current_message_snapshot.usage
 
-            # Extract content
-            content = response.content[0].text
-            duration = time.time() - start_time
+            content = "".join(chunks)
+            duration = (time.monotonic_ns() - start_ns) / 1e9
 
             # Log LLM call
             log_llm_call(
                 provider="anthropic",
                 model=self.model,
                 purpose="question_generation",
-                prompt_tokens=response.usage.input_tokens,
-                completion_tokens=response.usage.output_tokens,
-                total_tokens=response.usage.input_tokens + response.usage.output_tokens,
+                prompt_tokens=usage.input_tokens,
+                completion_tokens=usage.output_tokens,
+                total_tokens=usage.input_tokens + usage.output_tokens,
                 duration_seconds=duration,
                 success=True
             )
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = (time.monotonic_ns() - start_ns) / 1e9
             log_llm_call(
                 provider="anthropic",
                 model=self.model,
@@ -297,25 +431,36 @@ class ClaudeService:
             )
             raise ValueError(f"Claude API call failed: {e}")
 
-        # 7. Parse JSON response
-        question_data = self._parse_claude_response(content)
+        # 7. Parse JSON response (the scanner already located the object)
+        if scanner.end > 0:
+            try:
+                question_data = self._parse_json(content[scanner.start:scanner.end])
+            except ValueError:
+                raise ValueError(f"Failed to parse Claude response as JSON: {content[:200]}")
+        else:
+            question_data = self._parse_claude_response(content)
 
         # 8. Validate response structure
-        required_fields = ["question", "reference_answer", "expected_behavior", "rubric_breakdown"]
-        for field in required_fields:
-            if field not in question_data:
-                raise ValueError(f"Missing required field in Claude response: {field}")
+        if not isinstance(question_data, dict):
+            raise ValueError("Claude response is not a JSON object")
+        missing_fields = _REQUIRED_FIELDS - question_data.keys()
+        if missing_fields:
+            raise ValueError(
+                f"Missing required field in Claude response: {', '.join(sorted(missing_fields))}"
+            )
 
         # 9. Validate rubric_breakdown has scores 1-5
         rubric = question_data["rubric_breakdown"]
-        for score in ["1", "2", "3", "4", "5"]:
-            if str(score) not in rubric:
-                raise ValueError(f"Missing rubric score '{score}' in response")
+        if not isinstance(rubric, dict):
+            raise ValueError("rubric_breakdown in Claude response is not an object")
+        missing_scores = _REQUIRED_RUBRIC_SCORES - rubric.keys()
+        if missing_scores:
+            raise ValueError(
+                f"Missing rubric score {', '.join(repr(s) for s in sorted(missing_scores))} in response"
+            )
 
         # 10. Generate Question ID
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        random_hex = secrets.token_hex(3)
-        question_id = f"q_{timestamp}_{random_hex}"
+        question_id = generate_id("q", 3)
 
         # 11. Create Question object
         question = Question(
@@ -333,10 +478,10 @@ class ClaudeService:
             times_used=0
         )
 
-        # 12. Save to database
+        # 12. Save to database (every column default is client-side and the
+        # session keeps objects loaded after commit, so no refresh SELECT)
         db.add(question)
         db.commit()
-        db.refresh(question)
 
         logger.info(f"Generated new question: {question_id} for metric={primary_metric}, type={question_type}")
         return question
@@ -354,32 +499,18 @@ class ClaudeService:
         Raises:
             ValueError: If JSON parsing fails
         """
-        # Try direct JSON parse
+        # Bare JSON is parsed as-is (its strings may contain ``` fences);
+        # otherwise take the first fenced block in a single regex scan
+        candidate = content.strip()
+        if not candidate.startswith("{"):
+            match = _CODE_FENCE_RE.search(content)
+            if match:
+                candidate = match.group(1).strip()
+
         try:
-            return self._parse_json(content)
+            return self._parse_json(candidate)
         except ValueError:
-            pass
-
-        # Try to extract JSON from markdown code block
-        if "```json" in content:
-            json_start = content.find("```json") + 7
-            json_end = content.find("```", json_start)
-            if json_end > json_start:
-                try:
-                    return self._parse_json(content[json_start:json_end].strip())
-                except ValueError:
-                    pass
-        elif "```" in content:
-            json_start = content.find("```") + 3
-            json_end = content.find("```", json_start)
-            if json_end > json_start:
-                try:
-                    return self._parse_json(content[json_start:json_end].strip())
-                except ValueError:
-                    pass
-
-        # If all attempts fail
-        raise ValueError(f"Failed to parse Claude response as JSON: {content[:200]}")
+            raise ValueError(f"Failed to parse Claude response as JSON: {content[:200]}")
 
     @staticmethod
     def _parse_json(text: str) -> dict[str, Any]:
@@ -395,10 +526,9 @@ class ClaudeService:
         Raises:
             ValueError: If text is not valid JSON
         """
-        import json
         try:
-            return json.loads(text)
-        except json.JSONDecodeError as e:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON: {e}")
 
     # =====================================================
@@ -452,7 +582,20 @@ class ClaudeService:
 # Global Service Instance
 # =====================================================
 
-claude_service = ClaudeService()
+@lru_cache(maxsize=1)
+def get_claude_service() -> ClaudeService:
+    """
+    Get the process-wide ClaudeService (FastAPI dependency).
+
+    Override in tests with ``app.dependency_overrides[get_claude_service]``.
+
+    Returns:
+        Shared ClaudeService instance
+    """
+    return ClaudeService()
+
+
+claude_service = get_claude_service()
 
 
 # =====================================================
@@ -7,27 +7,37 @@ Provides SSE streaming responses, chat history management, and idempotent init g
 Reference: Task 14.2 - Coach Chat Service Implementation
 """
 
-import json
+import asyncio
 import logging
-import secrets
+import threading
 import time
-from datetime import datetime
-from typing import Any, AsyncGenerator
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, AsyncGenerator, Callable
 
+import httpx
 import openai
+import orjson
+from sqlalchemy import and_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from backend.config.settings import settings
+from backend.constants.metrics import VALID_METRIC_SLUGS
 from backend.models.chat_message import ChatMessage
 from backend.models.evaluation_snapshot import EvaluationSnapshot
 from backend.prompts.coach_prompts import (
     COACH_SYSTEM_PROMPT,
     COACH_MAX_HISTORY_WINDOW,
     render_coach_init_greeting,
-    render_coach_user_prompt,
+    render_coach_static_context,
+    render_coach_user_prompt_with_context,
 )
 from backend.services.snapshot_service import SnapshotNotFoundError, get_snapshot
+from backend.services.http_client import get_async_http_client
+from backend.services.ids import generate_id
 from backend.services.llm_logger import log_llm_call
+from backend.services.tokens import count_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +61,230 @@ class InvalidSelectedMetricsError(Exception):
     pass
 
 
+def validate_selected_metrics(selected_metrics: list[str]) -> None:
+    """
+    Check that every selected metric is a known slug.
+
+    Args:
+        selected_metrics: Metric slugs chosen by the user
+
+    Raises:
+        InvalidSelectedMetricsError: If any entry is not a valid slug
+    """
+    if not all(isinstance(metric, str) for metric in selected_metrics):
+        raise InvalidSelectedMetricsError("Metric slugs must be strings")
+    invalid = set(selected_metrics) - VALID_METRIC_SLUGS
+    if invalid:
+        raise InvalidSelectedMetricsError(f"Invalid metric slugs: {sorted(invalid)}")
+
+
+# =====================================================
+# SSE Framing
+# =====================================================
+
+SSE_DATA_PREFIX = b"data: "
+SSE_FRAME_SUFFIX = b"\n\n"
+SSE_DONE_FRAME = b"data: [DONE]\n\n"
+
+
+def sse_frame(payload: dict) -> bytes:
+    """
+    Encode a payload as a UTF-8 SSE "data:" frame.
+
+    Starlette writes bytes chunks as-is, so frames skip the str → bytes
+    re-encode on every token.
+
+    Args:
+        payload: JSON-serializable dict (e.g. {"content": "..."})
+
+    Returns:
+        Encoded SSE frame
+    """
+    return SSE_DATA_PREFIX + orjson.dumps(payload) + SSE_FRAME_SUFFIX
+
+
+async def coalesce_deltas(response) -> AsyncGenerator[str, None]:
+    """
+    Merge streamed completion deltas into larger text batches.
+
+    A batch is emitted once it holds ``coach_stream_batch_size`` tokens or
+    ``coach_stream_max_wait_ms`` has passed since the last emit, and any
+    remainder is emitted when the stream ends. One SSE frame per batch
+    instead of per 1-4 character token cuts JSON encodes and socket writes.
+
+    Args:
+        response: Async iterable of chat completion chunks
+
+    Yields:
+        Concatenated delta text
+    """
+    batch_size = settings.coach_stream_batch_size
+    max_wait = settings.coach_stream_max_wait_ms / 1000
+
+    buffer: list[str] = []
+    last_flush = time.monotonic()
+
+    async for chunk in response:
+        if chunk.choices and chunk.choices[0].delta.content:
+            buffer.append(chunk.choices[0].delta.content)
+            if len(buffer) >= batch_size or time.monotonic() - last_flush > max_wait:
+                yield "".join(buffer)
+                buffer.clear()
+                last_flush = time.monotonic()
+
+    if buffer:
+        yield "".join(buffer)
+
+
+# =====================================================
+# Snapshot Render Caches
+# =====================================================
+
+SNAPSHOT_RENDER_CACHE_MAXSIZE = 512
+
+
+def _snapshot_fingerprint(snapshot: EvaluationSnapshot) -> int:
+    """
+    Hash the snapshot fields that prompt renders are built from.
+
+    Args:
+        snapshot: Snapshot to fingerprint
+
+    Returns:
+        Hash of question, answer, scores and evidence
+    """
+    return hash((
+        snapshot.question,
+        snapshot.model_answer,
+        orjson.dumps(snapshot.user_scores_json, option=orjson.OPT_SORT_KEYS),
+        orjson.dumps(snapshot.judge_scores_json, option=orjson.OPT_SORT_KEYS),
+        orjson.dumps(snapshot.evidence_json, option=orjson.OPT_SORT_KEYS),
+    ))
+
+
+class SnapshotRenderCache:
+    """
+    Thread-safe LRU of prompt renders per snapshot content and metrics.
+
+    Renders derived only from a snapshot and the selected metrics are
+    deterministic, so they are keyed by (snapshot id, metrics, content
+    fingerprint). The fingerprint covers only the rendered fields:
+    updated_at is bumped by a trigger on every chat turn increment and
+    must not invalidate the entry, while edited scores or evidence must.
+    """
+
+    def __init__(self, maxsize: int = SNAPSHOT_RENDER_CACHE_MAXSIZE):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached renders
+        """
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+
+    def get_or_render(
+        self,
+        snapshot: EvaluationSnapshot,
+        selected_metrics: list[str],
+        render: Callable[[], Any]
+    ) -> Any:
+        """
+        Return the cached render or compute and store it.
+
+        Args:
+            snapshot: Snapshot the render is derived from
+            selected_metrics: Metric slugs user selected (order is kept)
+            render: Zero-argument function producing the render on a miss
+
+        Returns:
+            Cached or freshly rendered value
+        """
+        key = (snapshot.id, tuple(selected_metrics), _snapshot_fingerprint(snapshot))
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+
+        rendered = render()
+
+        with self._lock:
+            self._entries[key] = rendered
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return rendered
+
+    def clear(self) -> None:
+        """Drop all cached renders."""
+        with self._lock:
+            self._entries.clear()
+
+
+init_greeting_cache = SnapshotRenderCache()
+coach_context_cache = SnapshotRenderCache()
+
+
+def render_init_greeting_cached(snapshot: EvaluationSnapshot, selected_metrics: list[str]) -> str:
+    """
+    Render the init greeting prompt, reusing earlier renders.
+
+    Reloads and reconnects skip re-formatting the scores and evidence JSON.
+
+    Args:
+        snapshot: Snapshot to render the greeting for
+        selected_metrics: Metric slugs user selected
+
+    Returns:
+        Rendered greeting prompt
+    """
+    return init_greeting_cache.get_or_render(
+        snapshot,
+        selected_metrics,
+        lambda: render_coach_init_greeting(
+            question=snapshot.question,
+            model_answer=snapshot.model_answer,
+            user_scores=snapshot.user_scores_json,
+            judge_scores=snapshot.judge_scores_json,
+            evidence_json=snapshot.evidence_json,
+            selected_metrics=selected_metrics
+        )
+    )
+
+
+def render_coach_context_cached(
+    snapshot: EvaluationSnapshot,
+    selected_metrics: list[str]
+) -> dict[str, str]:
+    """
+    Format the snapshot-invariant part of the coach user prompt once per session.
+
+    Only chat history and the user message change between turns, so the
+    question, answer, scores and evidence sections are formatted once.
+
+    Args:
+        snapshot: Snapshot the conversation is about
+        selected_metrics: Metric slugs user selected
+
+    Returns:
+        Static template fields for render_coach_user_prompt_with_context()
+    """
+    return coach_context_cache.get_or_render(
+        snapshot,
+        selected_metrics,
+        lambda: render_coach_static_context(
+            question=snapshot.question,
+            model_answer=snapshot.model_answer,
+            user_scores=snapshot.user_scores_json,
+            judge_scores=snapshot.judge_scores_json,
+            evidence_json=snapshot.evidence_json,
+            selected_metrics=selected_metrics
+        )
+    )
+
+
 # =====================================================
 # Message ID Generation
 # =====================================================
@@ -65,9 +299,7 @@ def generate_message_id() -> str:
     Returns:
         Unique message ID string
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    random_hex = secrets.token_hex(6)
-    return f"msg_{timestamp}_{random_hex}"
+    return generate_id("msg", 6)
 
 
 # =====================================================
@@ -109,15 +341,35 @@ class CoachService:
         self.timeout = timeout
         self.model = settings.coach_model  # "openai/gpt-4o-mini"
 
-        # Initialize OpenAI client with OpenRouter base URL
-        self.client = openai.OpenAI(
-            api_key=self.api_key,
-            base_url=settings.openrouter_base_url,
-            timeout=self.timeout
-        )
+        self._client: openai.AsyncOpenAI | None = None
+        self._http_client: httpx.AsyncClient | None = None
 
         logger.info(f"CoachService initialized with model={self.model}, timeout={timeout}s")
 
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        """
+        Async OpenAI client with OpenRouter base URL, created lazily.
+
+        Token reads yield to the event loop instead of blocking it for the
+        whole stream. The client is rebuilt whenever the shared async pool
+        changes (another event loop, or closed on shutdown), so the module
+        singleton never streams through a dead pool.
+
+        Returns:
+            AsyncOpenAI client bound to the running loop's shared pool
+        """
+        http_client = get_async_http_client()
+        if self._client is None or self._http_client is not http_client:
+            self._client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=settings.openrouter_base_url,
+                timeout=self.timeout,
+                http_client=http_client
+            )
+            self._http_client = http_client
+        return self._client
+
     # =====================================================
     # Snapshot Context
     # =====================================================
@@ -146,23 +398,67 @@ class CoachService:
         if not snapshot:
             raise SnapshotNotFoundError(f"Snapshot not found: {snapshot_id}")
 
-        # Check if chat is available
-        if not snapshot.is_chat_available:
-            if snapshot.chat_turn_count >= snapshot.max_chat_turns:
-                raise MaxTurnsExceededError(
-                    f"Maximum chat turns exceeded ({snapshot.chat_turn_count}/{snapshot.max_chat_turns})"
-                )
-            elif snapshot.status != "active":
-                raise ChatNotAvailableError(
-                    f"Snapshot status is '{snapshot.status}', chat not available"
-                )
-            else:
-                raise ChatNotAvailableError(
-                    f"Chat not available for snapshot {snapshot_id}"
-                )
-
+        self._check_chat_state(
+            snapshot_id, snapshot.status, snapshot.chat_turn_count, snapshot.max_chat_turns
+        )
         return snapshot
 
+    def check_chat_available(
+        self,
+        db: Session,
+        snapshot_id: str
+    ) -> None:
+        """
+        Validate chat availability without loading the full snapshot.
+
+        Selects only status and turn counters, so preflight checks skip
+        the question, answer and scores/evidence JSON columns.
+
+        Args:
+            db: Database session
+            snapshot_id: Snapshot ID to check
+
+        Raises:
+            SnapshotNotFoundError: If snapshot not found or soft deleted
+            ChatNotAvailableError: If chat is not available (status/turn count)
+        """
+        state = db.query(
+            EvaluationSnapshot.status,
+            EvaluationSnapshot.chat_turn_count,
+            EvaluationSnapshot.max_chat_turns,
+        ).filter(
+            EvaluationSnapshot.id == snapshot_id,
+            EvaluationSnapshot.deleted_at.is_(None)
+        ).first()
+
+        if state is None:
+            raise SnapshotNotFoundError(f"Snapshot not found: {snapshot_id}")
+
+        self._check_chat_state(snapshot_id, *state)
+
+    @staticmethod
+    def _check_chat_state(
+        snapshot_id: str,
+        status: str,
+        chat_turn_count: int,
+        max_chat_turns: int
+    ) -> None:
+        """
+        Raise if a (non-deleted) snapshot's state does not allow chatting.
+
+        Raises:
+            MaxTurnsExceededError: If the turn limit is reached
+            ChatNotAvailableError: If the snapshot is not active
+        """
+        if chat_turn_count >= max_chat_turns:
+            raise MaxTurnsExceededError(
+                f"Maximum chat turns exceeded ({chat_turn_count}/{max_chat_turns})"
+            )
+        if status != "active":
+            raise ChatNotAvailableError(
+                f"Snapshot status is '{status}', chat not available"
+            )
+
     # =====================================================
     # Chat History Management
     # =====================================================
@@ -174,7 +470,7 @@ class CoachService:
         limit: int | None = None
     ) -> list[dict[str, Any]]:
         """
-        Fetch chat history for a snapshot.
+        Fetch the most recent chat history for a snapshot (AD-4).
 
         Args:
             db: Database session
@@ -182,36 +478,93 @@ class CoachService:
             limit: Max messages to return (defaults to settings.chat_history_window)
 
         Returns:
-            List of message dicts with 'role' and 'content'
+            Last `limit` message dicts, oldest first
         """
         if limit is None:
             limit = settings.chat_history_window  # AD-4: Default 6
 
-        messages = db.query(ChatMessage).filter(
+        # Column projection: plain Rows, no ORM instances or identity map
+        rows = db.query(
+            ChatMessage.id,
+            ChatMessage.snapshot_id,
+            ChatMessage.client_message_id,
+            ChatMessage.role,
+            ChatMessage.content,
+            ChatMessage.is_complete,
+            ChatMessage.selected_metrics,
+            ChatMessage.token_count,
+            ChatMessage.created_at,
+        ).filter(
             ChatMessage.snapshot_id == snapshot_id
         ).order_by(
-            ChatMessage.created_at.asc()
+            ChatMessage.created_at.desc()
         ).limit(limit).all()
 
-        return [
-            {
-                "id": msg.id,
-                "snapshot_id": msg.snapshot_id,
-                "client_message_id": msg.client_message_id,
-                "role": msg.role,
-                "content": msg.content,
-                "is_complete": msg.is_complete,
-                "selected_metrics": msg.selected_metrics,
-                "token_count": msg.token_count,
-                "created_at": msg.created_at
-            }
-            for msg in messages
-        ]
+        # Newest N via backward index scan, returned oldest-first
+        return [row._asdict() for row in reversed(rows)]
+
+    def get_chat_history_for_prompt(
+        self,
+        db: Session,
+        snapshot_id: str,
+        limit: int | None = None,
+        max_tokens: int | None = None,
+        exclude_reply_to: str | None = None
+    ) -> list[dict[str, str]]:
+        """
+        Fetch role and content of the most recent messages for prompt rendering.
+
+        Messages are taken newest first until `limit` messages or the
+        `max_tokens` budget (summed stored token_count) is reached; the
+        newest message is always kept.
+
+        Args:
+            db: Database session
+            snapshot_id: Snapshot ID
+            limit: Max messages to return (defaults to settings.chat_history_window)
+            max_tokens: Token budget (defaults to settings.chat_history_max_tokens)
+            exclude_reply_to: Turn ID whose assistant reply (the one being
+                generated) is left out
+
+        Returns:
+            List of message dicts with 'role' and 'content', oldest first
+        """
+        if limit is None:
+            limit = settings.chat_history_window  # AD-4: Default 6
+        if max_tokens is None:
+            max_tokens = settings.chat_history_max_tokens
+
+        query = db.query(ChatMessage.role, ChatMessage.content, ChatMessage.token_count).filter(
+            ChatMessage.snapshot_id == snapshot_id
+        )
+        if exclude_reply_to is not None:
+            query = query.filter(
+                ~and_(
+                    ChatMessage.client_message_id == exclude_reply_to,
+                    ChatMessage.role == "assistant"
+                )
+            )
+
+        rows = query.order_by(
+            ChatMessage.created_at.desc()
+        ).limit(limit).all()
+
+        history = []
+        used_tokens = 0
+        for role, content, token_count in rows:
+            used_tokens += token_count or 0
+            if history and used_tokens > max_tokens:
+                break
+            history.append({"role": role, "content": content})
+
+        history.reverse()
+        return history
 
     def increment_chat_turn(
         self,
         db: Session,
-        snapshot_id: str
+        snapshot_id: str,
+        commit: bool = True
     ) -> bool:
         """
         Increment chat turn count atomically.
@@ -222,12 +575,11 @@ class CoachService:
         Args:
             db: Database session
             snapshot_id: Snapshot ID
+            commit: Commit immediately (False leaves it to the caller's transaction)
 
         Returns:
             True if incremented successfully, False if limit reached or not found
         """
-        from sqlalchemy import update
-
         # Atomic update with turn limit check
         stmt = (
             update(EvaluationSnapshot)
@@ -238,7 +590,8 @@ class CoachService:
         )
 
         result = db.execute(stmt)
-        db.commit()
+        if commit:
+            db.commit()
 
         success = result.rowcount > 0
         if success:
@@ -283,7 +636,8 @@ class CoachService:
         snapshot_id: str,
         content: str,
         selected_metrics: list[str],
-        client_message_id: str
+        client_message_id: str,
+        commit: bool = True
     ) -> ChatMessage:
         """
         Save a user message to database.
@@ -294,6 +648,7 @@ class CoachService:
             content: Message content
             selected_metrics: List of metric slugs user selected
             client_message_id: Client-generated UUID for idempotency
+            commit: Commit immediately (False only flushes)
 
         Returns:
             Created ChatMessage object
@@ -308,12 +663,15 @@ class CoachService:
             content=content,
             selected_metrics=selected_metrics,
             is_complete=True,
-            token_count=0  # TODO: Calculate actual token count
+            token_count=count_tokens(content, self.model)
         )
 
         db.add(message)
-        db.commit()
-        db.refresh(message)
+        if commit:
+            db.commit()
+            db.refresh(message)
+        else:
+            db.flush()
 
         logger.debug(f"User message saved: {message_id} for snapshot {snapshot_id}")
         return message
@@ -324,7 +682,8 @@ class CoachService:
         snapshot_id: str,
         content: str,
         client_message_id: str,
-        is_complete: bool = True
+        is_complete: bool = True,
+        commit: bool = True
     ) -> ChatMessage:
         """
         Save or update an assistant message (Update-In-Place for AD-4).
@@ -338,6 +697,7 @@ class CoachService:
             content: Message content
             client_message_id: Shared Turn ID
             is_complete: True if fully delivered, False if streaming
+            commit: Commit immediately (False only flushes)
 
         Returns:
             Created or updated ChatMessage object
@@ -347,6 +707,7 @@ class CoachService:
 
         if existing:
             existing.content = content
+            existing.token_count = count_tokens(content, self.model)
             existing.is_complete = is_complete
             existing.updated_at = datetime.now()
             message = existing
@@ -362,15 +723,104 @@ class CoachService:
                 content=content,
                 selected_metrics=None,
                 is_complete=is_complete,
-                token_count=0
+                token_count=count_tokens(content, self.model)
             )
             db.add(message)
             logger.debug(f"New assistant message saved: {message_id}")
 
-        db.commit()
-        db.refresh(message)
+        if commit:
+            db.commit()
+            db.refresh(message)
+        else:
+            db.flush()
         return message
 
+    def begin_turn(
+        self,
+        db: Session,
+        snapshot_id: str,
+        user_message: str,
+        selected_metrics: list[str],
+        client_message_id: str,
+        history_limit: int,
+        is_new_turn: bool
+    ) -> list[dict[str, str]]:
+        """
+        Record the start of a chat turn in a single transaction.
+
+        Increments the turn count (new turns only), inserts the user message
+        and the incomplete assistant placeholder with one multi-row INSERT,
+        reads the prompt history, then commits once.
+
+        Args:
+            db: Database session
+            snapshot_id: Snapshot ID
+            user_message: User message content
+            selected_metrics: List of metric slugs user selected
+            client_message_id: Shared Turn ID
+            history_limit: Max history messages for the prompt
+            is_new_turn: False on reconnect (turn and placeholder already exist)
+
+        Returns:
+            Prompt chat history (includes the new user message)
+
+        Raises:
+            MaxTurnsExceededError: If the atomic turn increment hits the limit
+        """
+        # Explicit, strictly increasing timestamps keep the user message
+        # ordered before its reply in the history window
+        now = datetime.now()
+        rows = [
+            {
+                "id": generate_message_id(),
+                "client_message_id": client_message_id,
+                "snapshot_id": snapshot_id,
+                "role": "user",
+                "content": user_message,
+                "selected_metrics": selected_metrics,
+                "is_complete": True,
+                "token_count": count_tokens(user_message, self.model),
+                "created_at": now,
+            }
+        ]
+        if is_new_turn:
+            rows.append({
+                "id": generate_message_id(),
+                "client_message_id": client_message_id,
+                "snapshot_id": snapshot_id,
+                "role": "assistant",
+                "content": "",
+                "selected_metrics": None,
+                "is_complete": False,
+                "token_count": 0,
+                "created_at": now + timedelta(microseconds=1),
+            })
+
+        # ON CONFLICT on the idempotency index (snapshot, turn, role): a user
+        # message already saved by an earlier attempt (reconnect) is skipped
+        stmt = pg_insert(ChatMessage).on_conflict_do_nothing(
+            index_elements=["snapshot_id", "client_message_id", "role"]
+        )
+
+        try:
+            if is_new_turn and not self.increment_chat_turn(db, snapshot_id, commit=False):
+                # This should have been caught by get_snapshot_context,
+                # but atomic check is the final authority.
+                raise MaxTurnsExceededError(f"Turn limit reached for snapshot {snapshot_id}")
+
+            db.execute(stmt, rows)
+
+            chat_history = self.get_chat_history_for_prompt(
+                db, snapshot_id, limit=history_limit, exclude_reply_to=client_message_id
+            )
+
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        return chat_history
+
     def get_remaining_turns(
         self,
         db: Session,
@@ -402,7 +852,7 @@ class CoachService:
         db: Session,
         snapshot_id: str,
         selected_metrics: list[str]
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """
         Handle initial greeting with idempotency and streaming (AD-4).
 
@@ -411,31 +861,27 @@ class CoachService:
         3. If not: Generate via LLM (streaming), save to DB.
         4. Does NOT increment chat turn count (bonus message).
         """
+        validate_selected_metrics(selected_metrics)
         client_message_id = f"init_{snapshot_id}"
         
         # 1. Check for existing cached greeting
-        existing = self.get_existing_assistant_message(db, snapshot_id, client_message_id)
+        # (sync Session work runs in a worker thread to keep the loop free)
+        existing = await asyncio.to_thread(
+            self.get_existing_assistant_message, db, snapshot_id, client_message_id
+        )
         
         if existing and existing.is_complete:
             logger.info(f"Returning cached init greeting for snapshot {snapshot_id}")
-            sse_chunk = json.dumps({"content": existing.content})
-            yield f"data: {sse_chunk}\n\n"
-            yield "data: [DONE]\n\n"
+            yield sse_frame({"content": existing.content})
+            yield SSE_DONE_FRAME
             return
 
         # 2. Get snapshot context
-        snapshot = self.get_snapshot_context(db, snapshot_id)
+        snapshot = await asyncio.to_thread(self.get_snapshot_context, db, snapshot_id)
 
         # 3. Build Prompt Context
         # Note: Init greeting uses render_coach_init_greeting template
-        prompt_content = render_coach_init_greeting(
-            question=snapshot.question,
-            model_answer=snapshot.model_answer,
-            user_scores=snapshot.user_scores_json,
-            judge_scores=snapshot.judge_scores_json,
-            evidence_json=snapshot.evidence_json,
-            selected_metrics=selected_metrics
-        )
+        prompt_content = render_init_greeting_cached(snapshot, selected_metrics)
 
         messages = [
             {"role": "system", "content": COACH_SYSTEM_PROMPT},
@@ -448,7 +894,8 @@ class CoachService:
         try:
             # Initialize partial record if not exists
             if not existing:
-                self.save_assistant_message(
+                await asyncio.to_thread(
+                    self.save_assistant_message,
                     db=db,
                     snapshot_id=snapshot_id,
                     content="",
@@ -457,23 +904,22 @@ class CoachService:
                 )
 
             # 4. Stream from LLM
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 stream=True,
                 timeout=self.timeout
             )
 
-            for chunk in response:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    content = chunk.choices[0].delta.content
-                    full_response += content
-                    yield f"data: {json.dumps({'content': content})}\n\n"
+            async for content in coalesce_deltas(response):
+                full_response += content
+                yield sse_frame({"content": content})
 
-            yield "data: [DONE]\n\n"
+            yield SSE_DONE_FRAME
 
             # 5. Final Save (Complete)
-            self.save_assistant_message(
+            await asyncio.to_thread(
+                self.save_assistant_message,
                 db=db,
                 snapshot_id=snapshot_id,
                 content=full_response,
@@ -504,7 +950,7 @@ class CoachService:
         user_message: str,
         selected_metrics: list[str],
         client_message_id: str
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """
         Stream coach response using SSE format with full logic (AD-4, AD-9).
 
@@ -514,54 +960,43 @@ class CoachService:
         4. LLM Generation: Stream from OpenRouter.
         5. Persistence: Update-In-Place DB record.
         """
+        validate_selected_metrics(selected_metrics)
+
         # 1. & 2. Idempotency and Reconnect Logic
-        existing_assistant = self.get_existing_assistant_message(db, snapshot_id, client_message_id)
+        # (sync Session work runs in a worker thread to keep the loop free)
+        existing_assistant = await asyncio.to_thread(
+            self.get_existing_assistant_message, db, snapshot_id, client_message_id
+        )
         
         if existing_assistant and existing_assistant.is_complete:
             logger.info(f"Duplicate request detected for {client_message_id}, returning existing response.")
-            sse_chunk = json.dumps({"content": existing_assistant.content})
-            yield f"data: {sse_chunk}\n\n"
-            yield "data: [DONE]\n\n"
+            yield sse_frame({"content": existing_assistant.content})
+            yield SSE_DONE_FRAME
             return
 
         # 3. Get and validate snapshot
-        snapshot = self.get_snapshot_context(db, snapshot_id)
-
-        # 4. Atomic Turn Increment (only for new messages, not for reconnects)
-        if not existing_assistant:
-            success = self.increment_chat_turn(db, snapshot_id)
-            if not success:
-                # This should have been caught by get_snapshot_context, 
-                # but atomic check is the final authority.
-                raise MaxTurnsExceededError(f"Turn limit reached for snapshot {snapshot_id}")
-
-        # 5. Save/Verify User Message
-        try:
-            self.save_user_message(
-                db=db,
-                snapshot_id=snapshot_id,
-                content=user_message,
-                selected_metrics=selected_metrics,
-                client_message_id=client_message_id
-            )
-        except Exception:
-            # UNIQUE index prevents duplicates, we can safely continue
-            pass
+        snapshot = await asyncio.to_thread(self.get_snapshot_context, db, snapshot_id)
 
-        # 6. Build LLM Context
+        # 4.-6. One transaction: atomic turn increment (new messages only,
+        # not reconnects), user message, prompt history, incomplete
+        # assistant placeholder
         history_limit = min(settings.chat_history_window, snapshot.chat_turn_count + 1)
-        chat_history = self.get_chat_history(db, snapshot_id, limit=history_limit)
-        
+        chat_history = await asyncio.to_thread(
+            self.begin_turn,
+            db=db,
+            snapshot_id=snapshot_id,
+            user_message=user_message,
+            selected_metrics=selected_metrics,
+            client_message_id=client_message_id,
+            history_limit=history_limit,
+            is_new_turn=existing_assistant is None
+        )
+
         system_prompt = COACH_SYSTEM_PROMPT
-        user_prompt = render_coach_user_prompt(
-            question=snapshot.question,
-            model_answer=snapshot.model_answer,
-            user_scores=snapshot.user_scores_json,
-            judge_scores=snapshot.judge_scores_json,
-            evidence_json=snapshot.evidence_json,
+        user_prompt = render_coach_user_prompt_with_context(
+            render_coach_context_cached(snapshot, selected_metrics),
             chat_history=chat_history,
             user_message=user_message,
-            selected_metrics=selected_metrics,
             history_window=settings.chat_history_window
         )
 
@@ -575,17 +1010,7 @@ class CoachService:
         start_time = time.time()
 
         try:
-            # Initialize record as incomplete if it doesn't exist
-            if not existing_assistant:
-                self.save_assistant_message(
-                    db=db,
-                    snapshot_id=snapshot_id,
-                    content="",
-                    client_message_id=client_message_id,
-                    is_complete=False
-                )
-
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 stream=True,
@@ -596,16 +1021,15 @@ class CoachService:
                 }
             )
 
-            for chunk in response:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    content = chunk.choices[0].delta.content
-                    full_response += content
-                    yield f"data: {json.dumps({'content': content})}\n\n"
+            async for content in coalesce_deltas(response):
+                full_response += content
+                yield sse_frame({"content": content})
 
-            yield "data: [DONE]\n\n"
+            yield SSE_DONE_FRAME
 
             # 8. Final Save (Complete)
-            self.save_assistant_message(
+            await asyncio.to_thread(
+                self.save_assistant_message,
                 db=db,
                 snapshot_id=snapshot_id,
                 content=full_response,
@@ -719,7 +1143,7 @@ async def handle_init_greeting(
     db: Session,
     snapshot_id: str,
     selected_metrics: list[str]
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Handle init greeting using global service instance.
 
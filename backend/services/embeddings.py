@@ -0,0 +1,326 @@
+"""
+MentorMind - Embedding Functions
+
+Embedding functions used by the vector memory service: the local MiniLM
+model (default) or batched OpenAI embeddings, behind a process-wide LRU
+cache of text embeddings.
+
+Usage:
+    from backend.services.embeddings import (
+        BatchingOpenAIEmbeddingFunction,
+        CachingEmbeddingFunction,
+        create_embedding_function,
+    )
+
+    ef = create_embedding_function("minilm")  # cached all-MiniLM-L6-v2
+
+    ef = BatchingOpenAIEmbeddingFunction(api_key=..., model_name="text-embedding-3-small")
+    vectors = ef(["doc one", "doc two", ...])  # ceil(N / batch_size) API calls
+
+    cached = CachingEmbeddingFunction(ef, model_name="text-embedding-3-small")
+    vectors = cached(["Truthfulness Math"])  # repeat texts never hit the API
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import chromadb.utils.embedding_functions as embedding_functions
+import numpy as np
+
+from backend.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+# =====================================================
+# Batching Embedding Function
+# =====================================================
+
+EMBEDDING_BATCH_SIZE = 96
+"""Inputs per embeddings request (well under OpenAI's 2048-input cap)"""
+
+
+class BatchingOpenAIEmbeddingFunction(embedding_functions.OpenAIEmbeddingFunction):
+    """
+    OpenAIEmbeddingFunction that sends inputs in fixed-size chunks.
+
+    Large document lists are split into slices of ``batch_size`` and each
+    slice is one embeddings request, so N texts cost ceil(N / batch_size)
+    round-trips and no single request exceeds the API's input limits.
+    """
+
+    def __init__(self, *args, batch_size: int = EMBEDDING_BATCH_SIZE, **kwargs):
+        """
+        Initialize the wrapped OpenAI embedding function.
+
+        Args:
+            *args: Positional arguments for OpenAIEmbeddingFunction
+            batch_size: Maximum inputs per embeddings request
+            **kwargs: Keyword arguments for OpenAIEmbeddingFunction
+        """
+        super().__init__(*args, **kwargs)
+        self.batch_size = batch_size
+
+    def __call__(self, input):
+        """
+        Embed texts, one embeddings request per batch_size inputs.
+
+        Args:
+            input: List of texts to embed
+
+        Returns:
+            Embeddings in input order
+        """
+        if len(input) <= self.batch_size:
+            return super().__call__(input)
+
+        embeddings = []
+        for start in range(0, len(input), self.batch_size):
+            embeddings.extend(super().__call__(input[start:start + self.batch_size]))
+
+        logger.debug(
+            f"Embedded {len(input)} texts in "
+            f"{-(-len(input) // self.batch_size)} requests"
+        )
+        return embeddings
+
+
+# =====================================================
+# Normalizing Embedding Function
+# =====================================================
+
+def normalize_embeddings(embeddings) -> np.ndarray:
+    """
+    L2-normalize a batch of embeddings (zero vectors are left as-is).
+
+    Args:
+        embeddings: Vectors, shape (n, d)
+
+    Returns:
+        float32 array of unit-length rows
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+class NormalizingEmbeddingFunction:
+    """
+    Embedding function proxy that returns unit-length vectors.
+
+    With normalized vectors the collection can use the "ip" space: inner
+    product ranks exactly like cosine without per-comparison norms.
+    """
+
+    def __init__(self, embedding_function):
+        """
+        Wrap an embedding function.
+
+        Args:
+            embedding_function: Underlying embedder (list of texts -> vectors)
+        """
+        self.embedding_function = embedding_function
+
+    def __call__(self, input):
+        """
+        Embed texts and L2-normalize the batch in one vectorized pass.
+
+        Args:
+            input: List of texts to embed
+
+        Returns:
+            Unit-length embeddings in input order
+        """
+        return list(normalize_embeddings(self.embedding_function(input)))
+
+    def __getattr__(self, name: str):
+        # Forward everything else (name(), get_config(), ...) to the embedder
+        return getattr(self.embedding_function, name)
+
+
+# =====================================================
+# Embedding Cache
+# =====================================================
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU cache of text embeddings.
+
+    Keys are SHA-256 digests of ``model_name + "\x00" + text``, so vectors
+    from different embedding models never collide and long texts cost a
+    fixed 64-char key.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of embeddings kept (least recent evicted)
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> str:
+        """
+        Build the cache key for one text.
+
+        Args:
+            model_name: Embedding model name
+            text: Text being embedded
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        return hashlib.sha256(f"{model_name}\x00{text}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[list[float]]:
+        """
+        Return a cached embedding and mark it most recently used.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Embedding, or None on a miss
+        """
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+            return embedding
+
+    def put(self, key: str, embedding: list[float]) -> None:
+        """
+        Store an embedding, evicting the least recently used entry if full.
+
+        Args:
+            key: Key from make_key()
+            embedding: Embedding vector
+        """
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached embeddings."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+embedding_cache = EmbeddingCache(settings.embedding_cache_maxsize)
+"""Process-wide embedding cache shared by every CachingEmbeddingFunction"""
+
+
+class CachingEmbeddingFunction:
+    """
+    Embedding function proxy that serves repeat texts from EmbeddingCache.
+
+    Only cache misses are sent to the wrapped function (in one call), and
+    results are returned in input order.
+    """
+
+    def __init__(
+        self,
+        embedding_function: Callable,
+        model_name: str,
+        cache: Optional[EmbeddingCache] = None
+    ):
+        """
+        Wrap an embedding function.
+
+        Args:
+            embedding_function: Underlying embedder (list of texts -> vectors)
+            model_name: Model name, part of the cache key
+            cache: Cache to use (default: module-level embedding_cache)
+        """
+        self.embedding_function = embedding_function
+        self.model_name = model_name
+        self.cache = cache if cache is not None else embedding_cache
+
+    def __call__(self, input):
+        """
+        Embed texts, calling the wrapped function for cache misses only.
+
+        Args:
+            input: List of texts to embed
+
+        Returns:
+            Embeddings in input order
+        """
+        keys = [self.cache.make_key(self.model_name, text) for text in input]
+        embeddings = [self.cache.get(key) for key in keys]
+
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if misses:
+            computed = self.embedding_function([input[i] for i in misses])
+            for i, embedding in zip(misses, computed):
+                embedding = list(embedding)
+                self.cache.put(keys[i], embedding)
+                embeddings[i] = embedding
+
+        return embeddings
+
+    def embed_documents(self, input):
+        """Embed documents through the cache (Chroma add/upsert path)."""
+        return self(input)
+
+    def embed_query(self, input):
+        """Embed query texts through the cache (Chroma query path)."""
+        return self(input)
+
+    def __getattr__(self, name: str):
+        # Forward everything else (name(), get_config(), ...) to the embedder
+        return getattr(self.embedding_function, name)
+
+
+# =====================================================
+# Backend Factory
+# =====================================================
+
+MINILM_MODEL_NAME = "all-MiniLM-L6-v2"
+"""Local model behind Chroma's default (ONNX) embedding function"""
+
+
+def create_embedding_function(
+    backend: str,
+    api_key: Optional[str] = None
+) -> CachingEmbeddingFunction:
+    """
+    Build the cached embedding function for a backend.
+
+    Args:
+        backend: "minilm" (local all-MiniLM-L6-v2, 384-d) or "openai"
+        api_key: OpenAI API key (openai backend only)
+
+    Returns:
+        CachingEmbeddingFunction wrapping the backend's (normalized) embedder
+    """
+    if backend == "openai":
+        return CachingEmbeddingFunction(
+            NormalizingEmbeddingFunction(
+                BatchingOpenAIEmbeddingFunction(
+                    api_key=api_key,
+                    model_name=settings.embedding_model
+                )
+            ),
+            model_name=settings.embedding_model
+        )
+
+    # Chroma's default function is all-MiniLM-L6-v2 on ONNX Runtime: no
+    # torch/sentence-transformers dependency and the same vectors that
+    # existing collections were built with
+    return CachingEmbeddingFunction(
+        NormalizingEmbeddingFunction(embedding_functions.DefaultEmbeddingFunction()),
+        model_name=MINILM_MODEL_NAME
+    )
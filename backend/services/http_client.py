@@ -0,0 +1,145 @@
+"""
+MentorMind - Shared HTTP Client
+
+Single pooled httpx client shared by the Anthropic and OpenRouter SDK
+clients, so keep-alive connections (and their TLS sessions) are reused
+across services instead of each SDK opening its own pool. Async SDK
+clients (coach streaming) share a pooled httpx.AsyncClient the same way.
+
+The sync client lives for the whole process: service singletons capture
+it when they build their SDK client, so it is never closed on shutdown
+(the OS releases the sockets at exit).
+
+Usage:
+    from backend.services.http_client import get_http_client
+    client = anthropic.Anthropic(api_key=..., http_client=get_http_client())
+
+    from backend.services.http_client import get_async_http_client
+    client = openai.AsyncOpenAI(api_key=..., http_client=get_async_http_client())
+"""
+
+import asyncio
+import logging
+import threading
+
+import httpx
+
+from backend.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+# =====================================================
+# Shared Client
+# =====================================================
+
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get (or lazily create) the shared HTTP client.
+
+    Per-request timeouts are still passed by the SDK calls; the client-level
+    timeout only applies to calls that do not set one.
+
+    Returns:
+        Shared httpx.Client instance
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        with _http_client_lock:
+            if _http_client is None or _http_client.is_closed:
+                _http_client = httpx.Client(
+                    timeout=settings.http_timeout_seconds,
+                    limits=httpx.Limits(
+                        max_connections=settings.http_max_connections,
+                        max_keepalive_connections=settings.http_max_keepalive_connections,
+                    ),
+                )
+                logger.info(
+                    f"Shared HTTP client created "
+                    f"(max_connections={settings.http_max_connections}, "
+                    f"max_keepalive={settings.http_max_keepalive_connections})"
+                )
+
+    return _http_client
+
+
+# =====================================================
+# Shared Async Client
+# =====================================================
+
+_async_http_client: httpx.AsyncClient | None = None
+_async_http_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    """Return the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get (or lazily create) the shared async HTTP client.
+
+    Uses the same pool limits as the sync client. Every AsyncOpenAI wrapper
+    built on it reuses the same keep-alive connections, so a coach turn
+    does not pay a new TCP + TLS handshake.
+
+    Pooled connections belong to the event loop that opened them, so the
+    client is rebuilt when called from a different loop (e.g. each
+    TestClient lifespan) or after it was closed. Callers must compare the
+    returned client with the one they built on and rebuild when it changes.
+
+    Returns:
+        Shared httpx.AsyncClient instance for the running loop
+    """
+    global _async_http_client, _async_http_client_loop
+
+    loop = _running_loop()
+    with _http_client_lock:
+        if (
+            _async_http_client is None
+            or _async_http_client.is_closed
+            or _async_http_client_loop is not loop
+        ):
+            # A client left on another loop is dropped, not closed: its
+            # connections can only be closed from the loop that opened them
+            _async_http_client = httpx.AsyncClient(
+                timeout=settings.http_timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=settings.http_max_connections,
+                    max_keepalive_connections=settings.http_max_keepalive_connections,
+                ),
+            )
+            _async_http_client_loop = loop
+            logger.info("Shared async HTTP client created")
+
+        return _async_http_client
+
+
+async def close_async_http_client() -> None:
+    """
+    Close the shared async HTTP client and release pooled connections.
+
+    Only a client created on the running loop is closed; safe to call when
+    the client was never created.
+    """
+    global _async_http_client, _async_http_client_loop
+
+    with _http_client_lock:
+        client = _async_http_client
+        if _async_http_client_loop is not _running_loop():
+            return
+        _async_http_client = None
+        _async_http_client_loop = None
+
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.info("Shared async HTTP client closed")
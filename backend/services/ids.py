@@ -0,0 +1,106 @@
+"""
+MentorMind - Record ID Generation
+
+Builds the ``<prefix>_YYYYMMDD_HHMMSS_<randomhex>`` IDs used for questions,
+model responses, judge evaluations, snapshots and chat messages.
+
+The timestamp string is formatted once per second and reused, and random
+bytes are sliced from a 4 KB os.urandom buffer (one syscall per few
+hundred IDs instead of one per ID).
+
+Usage:
+    from backend.services.ids import generate_id
+
+    question_id = generate_id("q", 3)      # q_20260211_143052_a1b2c3
+    message_id = generate_id("msg", 6)     # msg_20260211_143052_a1b2c3d4e5f6
+"""
+
+import os
+import threading
+import time
+
+# =====================================================
+# Timestamp Prefix Cache
+# =====================================================
+
+_timestamp_cache: tuple[int, str] = (-1, "")
+"""(epoch second, formatted timestamp) of the last ID generated"""
+
+
+def _timestamp() -> str:
+    """
+    Return the local time as YYYYMMDD_HHMMSS, formatted once per second.
+
+    Returns:
+        Formatted timestamp string
+    """
+    global _timestamp_cache
+
+    now = int(time.time())
+    second, formatted = _timestamp_cache
+    if second != now:
+        formatted = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        _timestamp_cache = (now, formatted)
+    return formatted
+
+
+# =====================================================
+# Random Byte Buffer
+# =====================================================
+
+_RANDOM_BUFFER_SIZE = 4096
+
+_random_lock = threading.Lock()
+_random_buffer = b""
+_random_offset = 0
+
+
+def _random_hex(nbytes: int) -> str:
+    """
+    Return nbytes of OS randomness as hex, drawn from a shared buffer.
+
+    Args:
+        nbytes: Number of random bytes (hex string is twice as long)
+
+    Returns:
+        Lowercase hex string
+    """
+    global _random_buffer, _random_offset
+
+    with _random_lock:
+        if _random_offset + nbytes > len(_random_buffer):
+            _random_buffer = os.urandom(max(_RANDOM_BUFFER_SIZE, nbytes))
+            _random_offset = 0
+        chunk = _random_buffer[_random_offset:_random_offset + nbytes]
+        _random_offset += nbytes
+    return chunk.hex()
+
+
+def _reset_random_buffer() -> None:
+    """Discard buffered bytes so a forked child never reuses its parent's."""
+    global _random_buffer, _random_offset
+    _random_buffer = b""
+    _random_offset = 0
+
+
+os.register_at_fork(after_in_child=_reset_random_buffer)
+
+
+# =====================================================
+# Public API
+# =====================================================
+
+def generate_id(prefix: str, nbytes: int) -> str:
+    """
+    Generate a unique record ID.
+
+    Format: <prefix>_YYYYMMDD_HHMMSS_<randomhex>
+
+    Args:
+        prefix: ID prefix (e.g., "q", "resp", "msg")
+        nbytes: Random bytes in the suffix
+
+    Returns:
+        Unique ID string
+    """
+    return f"{prefix}_{_timestamp()}_{_random_hex(nbytes)}"
@@ -33,6 +33,7 @@ from backend.services.evidence_service import (
     process_evidence
 )
 from backend.services.snapshot_service import create_evaluation_snapshot
+from backend.services.ids import generate_id
 from backend.constants.metrics import ALL_METRIC_SLUGS, METRIC_SLUG_MAP
 
 logger = logging.getLogger(__name__)
@@ -1090,7 +1091,7 @@ class JudgeService:
         from backend.models.judge_evaluation import JudgeEvaluation
         from backend.models.user_evaluation import UserEvaluation
         from backend.services.chromadb_service import chromadb_service
-        import secrets
+        from backend.tasks.memory_writer import enqueue_memory_write
 
         try:
             # 1. Fetch evaluation data
@@ -1156,9 +1157,7 @@ class JudgeService:
             )
 
             # 5. Generate judge_eval_id
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            random_hex = secrets.token_hex(6)
-            judge_eval_id = f"judge_{timestamp}_{random_hex}"
+            judge_eval_id = generate_id("judge", 6)
 
             # 5.5. Add judge_evaluation_id to stage2_result for snapshot creation (Task 13.3)
             if isinstance(stage2_result, dict):
@@ -1221,13 +1220,18 @@ class JudgeService:
                 logger.warning(f"Snapshot creation failed (non-fatal): {e}")
 
             # 8. Add to ChromaDB memory (log-only on failure per user preference)
+            # Queued for the background writer when it is running; otherwise
+            # written inline.
             try:
-                chromadb_service.add_to_memory(
-                    db_session=db,
-                    user_eval_id=user_eval_id,
-                    judge_eval_id=judge_eval_id
-                )
-                logger.info(f"Added to ChromaDB memory: {user_eval_id}")
+                if enqueue_memory_write(user_eval_id, judge_eval_id):
+                    logger.info(f"Queued for ChromaDB memory: {user_eval_id}")
+                else:
+                    chromadb_service.add_to_memory(
+                        db_session=db,
+                        user_eval_id=user_eval_id,
+                        judge_eval_id=judge_eval_id
+                    )
+                    logger.info(f"Added to ChromaDB memory: {user_eval_id}")
             except Exception as e:
                 # Non-fatal - log only, don't fail the evaluation
                 logger.warning(f"ChromaDB add failed (non-fatal): {e}")
@@ -11,9 +11,7 @@ Usage:
 
 import logging
 import random
-import secrets
 import time
-from datetime import datetime
 
 import openai
 from sqlalchemy.orm import Session
@@ -21,6 +19,8 @@ from sqlalchemy.orm import Session
 from backend.config.settings import settings
 from backend.models.model_response import ModelResponse, K_MODELS
 from backend.models.question import Question
+from backend.services.http_client import get_http_client
+from backend.services.ids import generate_id
 from backend.services.llm_logger import log_llm_call
 
 logger = logging.getLogger(__name__)
@@ -52,11 +52,12 @@ class ModelService:
         self.api_key = api_key or settings.openrouter_api_key
         self.timeout = timeout
 
-        # Initialize OpenAI client with OpenRouter base URL
+        # Initialize OpenAI client with OpenRouter base URL (shared connection pool)
         self.client = openai.OpenAI(
             api_key=self.api_key,
             base_url=settings.openrouter_base_url,
-            timeout=timeout
+            timeout=timeout,
+            http_client=get_http_client()
         )
 
         logger.info(f"ModelService initialized with timeout={timeout}s")
@@ -233,9 +234,7 @@ class ModelService:
             raise
 
         # Generate response ID
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        random_hex = secrets.token_hex(3)
-        response_id = f"resp_{timestamp}_{random_hex}"
+        response_id = generate_id("resp", 3)
 
         # Create ModelResponse
         model_response = ModelResponse(
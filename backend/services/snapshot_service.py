@@ -9,16 +9,17 @@ Reference: Task 13.1 - Snapshot Service — Create
 """
 
 import logging
-import secrets
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Session
 
 from backend.config.settings import settings
 from backend.constants.metrics import display_name_to_slug
 from backend.models.evaluation_snapshot import EvaluationSnapshot
 from backend.services.evidence_service import process_evidence
+from backend.services.ids import generate_id
 
 logger = logging.getLogger(__name__)
 
@@ -46,9 +47,7 @@ def generate_snapshot_id() -> str:
     Returns:
         Unique snapshot ID string
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    random_hex = secrets.token_hex(6)
-    return f"snap_{timestamp}_{random_hex}"
+    return generate_id("snap", 6)
 
 
 # =====================================================
@@ -306,33 +305,73 @@ def list_snapshots(
     db: Session,
     status: Optional[str] = None,
     limit: int = 50,
-    offset: int = 0
-) -> tuple[list[EvaluationSnapshot], int]:
+    offset: int = 0,
+    before: Optional[datetime] = None,
+    before_id: Optional[str] = None
+) -> tuple[list[EvaluationSnapshot], Optional[int]]:
     """
     List snapshots with optional status filter and pagination.
 
+    Supports keyset pagination: pass the created_at and id of the last item
+    of the previous page as ``before``/``before_id`` to avoid scanning
+    skipped rows with OFFSET. Rows are ordered by (created_at, id) DESC so
+    snapshots sharing a timestamp are neither skipped nor repeated.
+    The total is only computed for offset pages (no cursor); cursor pages
+    return None and callers keep the total from the first page.
+
     Args:
         db: Database session
         status: Filter by status ('active', 'completed', 'archived'), or None for all
         limit: Maximum number of results
-        offset: Pagination offset
+        offset: Pagination offset (ignored when ``before`` is given)
+        before: Only return snapshots that sort after this cursor timestamp
+        before_id: Tiebreak id of the cursor row; without it the cursor
+            matches created_at < before only
 
     Returns:
-        Tuple of (list of snapshots, total count)
+        Tuple of (list of snapshots, total count or None for cursor pages)
     """
-    query = db.query(EvaluationSnapshot).filter(
-        EvaluationSnapshot.deleted_at.is_(None)
-    )
-
+    filters = [EvaluationSnapshot.deleted_at.is_(None)]
     if status:
-        query = query.filter(EvaluationSnapshot.status == status)
+        filters.append(EvaluationSnapshot.status == status)
 
-    total = query.count()
-    snapshots = query.order_by(
-        EvaluationSnapshot.created_at.desc()
-    ).limit(limit).offset(offset).all()
+    if before is not None:
+        # Plain index range scan: WHERE (created_at, id) < (:before, :before_id)
+        if before_id is not None:
+            cursor = tuple_(EvaluationSnapshot.created_at, EvaluationSnapshot.id) < tuple_(
+                before, before_id
+            )
+        else:
+            cursor = EvaluationSnapshot.created_at < before
+        snapshots = db.scalars(
+            select(EvaluationSnapshot)
+            .where(*filters, cursor)
+            .order_by(EvaluationSnapshot.created_at.desc(), EvaluationSnapshot.id.desc())
+            .limit(limit)
+        ).all()
+        return list(snapshots), None
+
+    # Total is computed with COUNT(*) OVER () in the same round-trip
+    rows = db.execute(
+        select(EvaluationSnapshot, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(EvaluationSnapshot.created_at.desc(), EvaluationSnapshot.id.desc())
+        .limit(limit)
+        .offset(offset)
+    ).all()
+
+    if rows:
+        total = rows[0].total
+    elif limit > 0 and not offset:
+        # First page is empty, so nothing matches
+        total = 0
+    else:
+        # Empty page (limit=0 or past the end): no row carries the window total
+        total = db.scalar(
+            select(func.count()).select_from(EvaluationSnapshot).where(*filters)
+        )
 
-    return snapshots, total
+    return [row[0] for row in rows], total
 
 
 # =====================================================
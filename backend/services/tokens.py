@@ -0,0 +1,79 @@
+"""
+MentorMind - Token Counting
+
+Counts prompt tokens for chat messages with tiktoken. Encoders are loaded
+once per model and cached, so a message is tokenized a single time when
+it is saved and the count is reused from the token_count column.
+
+OpenRouter model names ("openai/gpt-4o-mini") are mapped to their bare
+OpenAI name; unknown models fall back to the o200k_base encoding.
+
+Usage:
+    from backend.services.tokens import count_tokens
+
+    token_count = count_tokens("Merhaba!", "openai/gpt-4o-mini")
+"""
+
+import logging
+from functools import lru_cache
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "o200k_base"
+
+
+# =====================================================
+# Encoder Cache
+# =====================================================
+
+@lru_cache(maxsize=16)
+def get_encoding(model: str) -> tiktoken.Encoding | None:
+    """
+    Get the cached tiktoken encoding for a model.
+
+    Args:
+        model: Model name, optionally with an OpenRouter provider prefix
+
+    Returns:
+        Encoding, or None if no encoding could be loaded
+    """
+    name = model.split("/", 1)[-1]
+    try:
+        return tiktoken.encoding_for_model(name)
+    except KeyError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to load tiktoken encoding for {model}: {e}")
+        return None
+
+    try:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(f"Failed to load tiktoken encoding {DEFAULT_ENCODING}: {e}")
+        return None
+
+
+# =====================================================
+# Public API
+# =====================================================
+
+def count_tokens(text: str, model: str) -> int:
+    """
+    Count tokens in a text for the given model.
+
+    Args:
+        text: Text to tokenize
+        model: Model name the text is sent to
+
+    Returns:
+        Token count (0 for empty text or when no encoding is available)
+    """
+    if not text:
+        return 0
+
+    encoding = get_encoding(model)
+    if encoding is None:
+        return 0
+    return len(encoding.encode(text, disallowed_special=()))
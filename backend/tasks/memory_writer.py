@@ -0,0 +1,173 @@
+"""
+MentorMind - ChromaDB Memory Writer (Background)
+
+Batches ChromaDB memory writes off the judge request path. The judge
+enqueues (user_eval_id, judge_eval_id) pairs; a single asyncio task,
+started in the app lifespan, drains up to ``memory_write_batch_size``
+pairs (or whatever arrived within ``memory_write_max_wait_ms``) and stores
+them with one add_to_memory_bulk() call.
+
+When the writer is not running (scripts, tests, no lifespan) enqueue
+returns False and callers fall back to a synchronous add_to_memory().
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Optional
+
+from backend.config.settings import settings
+from backend.models.database import SessionLocal
+from backend.services.chromadb_service import chromadb_service
+
+logger = logging.getLogger(__name__)
+
+# =====================================================
+# Writer State
+# =====================================================
+
+_queue: Optional[asyncio.Queue] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_writer_task: Optional[asyncio.Task] = None
+_stopping = False
+
+# Serializes enqueue against stop, so no pair is scheduled behind _STOP
+_state_lock = threading.Lock()
+
+_STOP = object()
+"""Queue sentinel that ends the writer loop"""
+
+
+# =====================================================
+# Public API
+# =====================================================
+
+def enqueue_memory_write(user_eval_id: str, judge_eval_id: str) -> bool:
+    """
+    Queue an evaluation for ChromaDB memory storage.
+
+    Thread-safe: judge evaluations run in worker threads, so the pair is
+    handed to the writer's event loop with call_soon_threadsafe.
+
+    Args:
+        user_eval_id: User evaluation ID
+        judge_eval_id: Judge evaluation ID
+
+    Returns:
+        True if queued, False if the writer is not running or stopping
+        (the caller then writes synchronously with add_to_memory())
+    """
+    with _state_lock:
+        queue, loop = _queue, _loop
+        if _stopping or queue is None or loop is None or loop.is_closed():
+            return False
+
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, (user_eval_id, judge_eval_id))
+        except RuntimeError:
+            # Loop closed between the check and the call
+            return False
+    return True
+
+
+def start_memory_writer() -> None:
+    """Start the background writer on the running event loop."""
+    global _queue, _loop, _writer_task, _stopping
+
+    with _state_lock:
+        if _writer_task is not None and not _writer_task.done():
+            return
+
+        _queue = asyncio.Queue()
+        _loop = asyncio.get_running_loop()
+        _writer_task = asyncio.create_task(_memory_writer_loop(_queue))
+        _stopping = False
+    logger.info("ChromaDB memory writer started")
+
+
+async def stop_memory_writer() -> None:
+    """Stop the writer after flushing everything already queued."""
+    global _queue, _loop, _writer_task, _stopping
+
+    with _state_lock:
+        queue, task = _queue, _writer_task
+        _stopping = True
+        _queue = None
+        _loop = None
+        _writer_task = None
+
+    if queue is None or task is None:
+        return
+
+    # Every accepted pair was scheduled with call_soon_threadsafe before the
+    # lock above was taken; call_soon appends the sentinel to the same FIFO
+    # of callbacks, so those pairs reach the queue (and are flushed) first
+    asyncio.get_running_loop().call_soon(queue.put_nowait, _STOP)
+    await task
+    logger.info("ChromaDB memory writer stopped")
+
+
+# =====================================================
+# Writer Loop
+# =====================================================
+
+async def _memory_writer_loop(queue: asyncio.Queue) -> None:
+    """
+    Drain the queue in batches and write each batch to ChromaDB.
+
+    Args:
+        queue: Queue of (user_eval_id, judge_eval_id) pairs, ended by _STOP
+    """
+    loop = asyncio.get_running_loop()
+    batch_size = settings.memory_write_batch_size
+    max_wait = settings.memory_write_max_wait_ms / 1000
+    stopping = False
+
+    while not stopping:
+        item = await queue.get()
+        if item is _STOP:
+            return
+
+        batch = [item]
+        deadline = loop.time() + max_wait
+
+        while len(batch) < batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is _STOP:
+                stopping = True
+                break
+            batch.append(item)
+
+        await asyncio.to_thread(_flush_batch, batch)
+
+
+def _flush_batch(pairs: list[tuple[str, str]]) -> None:
+    """
+    Store a batch of evaluations in ChromaDB (log-only on failure).
+
+    A ValueError means one pair's rows are missing; the batch is then
+    retried pair by pair so the others are still stored.
+
+    Args:
+        pairs: (user_eval_id, judge_eval_id) tuples
+    """
+    db = SessionLocal()
+    try:
+        try:
+            chromadb_service.add_to_memory_bulk(db, pairs)
+        except ValueError:
+            for user_eval_id, judge_eval_id in pairs:
+                try:
+                    chromadb_service.add_to_memory(db, user_eval_id, judge_eval_id)
+                except Exception as e:
+                    logger.warning(f"ChromaDB add failed for {user_eval_id} (non-fatal): {e}")
+    except Exception as e:
+        logger.warning(f"ChromaDB batch add failed for {len(pairs)} evaluation(s) (non-fatal): {e}")
+    finally:
+        db.close()
@@ -0,0 +1,255 @@
+"""
+MentorMind - Question Pool Usage Buffer (Background)
+
+Defers the times_used / first_used_at / last_used_at bookkeeping done on
+every pool selection. Selections are recorded in memory and a single
+asyncio task, started in the app lifespan, writes them every
+``pool_usage_flush_interval_ms`` (or once ``pool_usage_flush_max_pending``
+questions are pending) with one multi-row UPDATE.
+
+When the flusher is not running (scripts, tests, no lifespan)
+record_pool_usage() returns False and callers update the row themselves.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import text
+
+from backend.config.settings import settings
+from backend.models.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+# =====================================================
+# Usage Buffer
+# =====================================================
+
+class PoolUsageBuffer:
+    """
+    Thread-safe accumulator of pending question usage.
+
+    Per question it keeps the number of selections plus the first and
+    last selection time since the previous flush.
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+        self._first_used: dict[str, datetime] = {}
+        self._last_used: dict[str, datetime] = {}
+
+    def add(self, question_id: str, used_at: datetime) -> int:
+        """
+        Record one selection of a question.
+
+        Args:
+            question_id: Selected question ID
+            used_at: Selection time
+
+        Returns:
+            Number of distinct questions now pending
+        """
+        with self._lock:
+            self._counts[question_id] += 1
+            self._first_used.setdefault(question_id, used_at)
+            self._last_used[question_id] = used_at
+            return len(self._counts)
+
+    def pending_ids(self) -> frozenset[str]:
+        """
+        Return the IDs of questions with unflushed selections.
+
+        Their times_used column is behind by the pending delta until the
+        next flush.
+
+        Returns:
+            Pending question IDs
+        """
+        with self._lock:
+            return frozenset(self._counts)
+
+    def drain(self) -> list[tuple[str, int, datetime, datetime]]:
+        """
+        Remove and return everything pending.
+
+        Returns:
+            (question_id, delta, first_used_at, last_used_at) tuples
+        """
+        with self._lock:
+            rows = [
+                (question_id, delta, self._first_used[question_id], self._last_used[question_id])
+                for question_id, delta in self._counts.items()
+            ]
+            self._counts.clear()
+            self._first_used.clear()
+            self._last_used.clear()
+        return rows
+
+    def restore(self, rows: list[tuple[str, int, datetime, datetime]]) -> None:
+        """
+        Put drained rows back, merging with anything recorded since.
+
+        Args:
+            rows: (question_id, delta, first_used_at, last_used_at) tuples
+                as returned by drain()
+        """
+        with self._lock:
+            for question_id, delta, first_used_at, last_used_at in rows:
+                self._counts[question_id] += delta
+                self._first_used[question_id] = min(
+                    first_used_at, self._first_used.get(question_id, first_used_at)
+                )
+                self._last_used[question_id] = max(
+                    last_used_at, self._last_used.get(question_id, last_used_at)
+                )
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+
+pool_usage_buffer = PoolUsageBuffer()
+
+
+# =====================================================
+# Flusher State
+# =====================================================
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_wake: Optional[asyncio.Event] = None
+_flusher_task: Optional[asyncio.Task] = None
+
+
+# =====================================================
+# Public API
+# =====================================================
+
+def record_pool_usage(question_id: str, used_at: datetime) -> bool:
+    """
+    Buffer a pool selection for the next batched UPDATE.
+
+    Thread-safe: pool selection runs in worker threads, so an early flush
+    is requested on the flusher's loop with call_soon_threadsafe.
+
+    Args:
+        question_id: Selected question ID
+        used_at: Selection time
+
+    Returns:
+        True if buffered, False if the flusher is not running
+    """
+    loop, wake = _loop, _wake
+    if loop is None or wake is None or loop.is_closed():
+        return False
+
+    pending = pool_usage_buffer.add(question_id, used_at)
+    if pending >= settings.pool_usage_flush_max_pending:
+        loop.call_soon_threadsafe(wake.set)
+    return True
+
+
+def flush_pool_usage() -> int:
+    """
+    Write all buffered usage with one multi-row UPDATE.
+
+    On failure the drained rows are put back into the buffer, so the next
+    flush retries them instead of losing the batch.
+
+    Returns:
+        Number of questions updated
+    """
+    rows = pool_usage_buffer.drain()
+    if not rows:
+        return 0
+
+    values = ", ".join(
+        f"(:id{i}, :delta{i}, CAST(:first{i} AS TIMESTAMP), CAST(:last{i} AS TIMESTAMP))"
+        for i in range(len(rows))
+    )
+    params = {}
+    for i, (question_id, delta, first_used_at, last_used_at) in enumerate(rows):
+        params[f"id{i}"] = question_id
+        params[f"delta{i}"] = delta
+        params[f"first{i}"] = first_used_at
+        params[f"last{i}"] = last_used_at
+
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(f"""
+                UPDATE questions AS q
+                SET times_used = q.times_used + v.delta,
+                    first_used_at = COALESCE(q.first_used_at, v.first_used_at),
+                    last_used_at = GREATEST(q.last_used_at, v.last_used_at)
+                FROM (VALUES {values}) AS v(id, delta, first_used_at, last_used_at)
+                WHERE q.id = v.id
+            """), params)
+    except Exception as e:
+        pool_usage_buffer.restore(rows)
+        logger.warning(f"Pool usage flush failed for {len(rows)} question(s), kept for retry: {e}")
+        return 0
+
+    logger.debug(f"Flushed pool usage for {len(rows)} question(s)")
+    return len(rows)
+
+
+def start_pool_usage_flusher() -> None:
+    """Start the background flusher on the running event loop."""
+    global _loop, _wake, _flusher_task
+
+    if _flusher_task is not None and not _flusher_task.done():
+        return
+
+    _wake = asyncio.Event()
+    _loop = asyncio.get_running_loop()
+    _flusher_task = asyncio.create_task(_pool_usage_flush_loop(_wake))
+    logger.info("Pool usage flusher started")
+
+
+async def stop_pool_usage_flusher() -> None:
+    """Stop the flusher and write whatever is still buffered."""
+    global _loop, _wake, _flusher_task
+
+    task = _flusher_task
+    _loop = None
+    _wake = None
+    _flusher_task = None
+
+    if task is None:
+        return
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+    await asyncio.to_thread(flush_pool_usage)
+    logger.info("Pool usage flusher stopped")
+
+
+# =====================================================
+# Flush Loop
+# =====================================================
+
+async def _pool_usage_flush_loop(wake: asyncio.Event) -> None:
+    """
+    Flush the buffer every interval, or early when woken by a full buffer.
+
+    Args:
+        wake: Event set by record_pool_usage() when the buffer is full
+    """
+    interval = settings.pool_usage_flush_interval_ms / 1000
+
+    while True:
+        try:
+            await asyncio.wait_for(wake.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+        wake.clear()
+        await asyncio.to_thread(flush_pool_usage)
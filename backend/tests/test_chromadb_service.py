@@ -18,8 +18,18 @@ class TestChromaDBService:
         """Test service initializes with correct settings."""
         assert chromadb_service.host is not None
         assert chromadb_service.port == 8000
-        assert chromadb_service.collection_name == "evaluation_memory"
-        assert chromadb_service._embedding_function is not None
+        assert chromadb_service.collection_name == "evaluation_memory_ip"
+        assert chromadb_service.embedding_function is not None
+
+    def test_package_exports_singleton_instance(self):
+        """Test the services package returns the instance, not the same-named submodule."""
+        import importlib
+        from backend.services import chromadb_service as exported
+
+        module = importlib.import_module("backend.services.chromadb_service")
+
+        assert exported is chromadb_service
+        assert module.chromadb_service is chromadb_service
 
     def test_real_connection(self):
         """Test real connection to ChromaDB server."""
@@ -35,7 +45,7 @@ class TestChromaDBService:
         collection = chromadb_service.get_collection()
 
         assert collection is not None
-        assert collection.name == "evaluation_memory"
+        assert collection.name == "evaluation_memory_ip"
         assert collection.count() >= 0  # May have existing documents
 
     def test_get_collection_count_empty(self):
@@ -138,7 +148,7 @@ class TestChromaDBService:
         collection = chromadb_service.get_collection()
 
         # Collection should exist and have correct name
-        assert collection.name == "evaluation_memory"
+        assert collection.name == "evaluation_memory_ip"
 
         # Count should be accessible
         count = collection.count()
@@ -179,7 +189,7 @@ class TestChromaDBService:
 
         # Our collection should be in the list
         collection_names = [c.name for c in collections]
-        assert "evaluation_memory" in collection_names
+        assert "evaluation_memory_ip" in collection_names
 
     def test_delete_documents(self):
         """Test deleting documents from collection."""
@@ -22,6 +22,8 @@ class TestChromaDBTasks:
     def setup_method(self):
         """Set up test database session."""
         self.db = SessionLocal()
+        # Tests write to the collection directly, bypassing cache invalidation
+        chromadb_service.clear_query_cache()
 
     def teardown_method(self):
         """Clean up test data."""
@@ -237,6 +239,18 @@ class TestChromaDBTasks:
             self.db.query(Question).filter_by(id="test_q_missing_judge").delete()
             self.db.commit()
 
+    def test_add_to_memory_bulk_empty_pairs(self):
+        """Test add_to_memory_bulk is a no-op for an empty list."""
+        assert chromadb_service.add_to_memory_bulk(self.db, []) == 0
+
+    def test_add_to_memory_bulk_missing_user_eval(self):
+        """Test add_to_memory_bulk raises ValueError for missing user evaluation."""
+        with pytest.raises(ValueError, match="User evaluation.*not found"):
+            chromadb_service.add_to_memory_bulk(
+                self.db,
+                [("nonexistent_eval_1", "judge_1"), ("nonexistent_eval_2", "judge_2")]
+            )
+
     # =====================================================
     # Task 4.3: query_past_mistakes() Tests
     # =====================================================
@@ -438,3 +452,58 @@ class TestChromaDBTasks:
         assert "Truthfulness" in doc_text
         assert "Math" in doc_text
         assert "Feedback:" in doc_text
+
+    def test_query_cache_roundtrip_and_invalidation(self):
+        """Test cached past-mistake results are returned and dropped on write."""
+        key = ("Clarity", "Coding", 5)
+        result = {"evaluations": [{"evaluation_id": "eval_cached"}]}
+
+        chromadb_service._store_cached_query(key, result)
+        assert chromadb_service._get_cached_query(key) == result
+
+        chromadb_service._invalidate_cached_queries(
+            [{"primary_metric": "Clarity", "category": "Coding"}]
+        )
+        assert chromadb_service._get_cached_query(key) is None
+
+    def test_is_low_signal(self):
+        """Test high-score, low-gap evaluations are flagged as low-signal."""
+        class MockJudgeEval:
+            judge_meta_score = 5
+            primary_metric_gap = 0.0
+
+        assert chromadb_service._is_low_signal(MockJudgeEval()) is True
+
+        MockJudgeEval.primary_metric_gap = 2.0
+        assert chromadb_service._is_low_signal(MockJudgeEval()) is False
+
+        MockJudgeEval.judge_meta_score = 2
+        MockJudgeEval.primary_metric_gap = 0.0
+        assert chromadb_service._is_low_signal(MockJudgeEval()) is False
+
+    def test_caching_embedding_function_only_embeds_misses(self):
+        """Test repeat texts are served from the embedding cache in input order."""
+        from backend.services.embeddings import CachingEmbeddingFunction, EmbeddingCache
+
+        calls = []
+
+        def fake_embed(texts):
+            calls.append(list(texts))
+            return [[float(len(text))] for text in texts]
+
+        ef = CachingEmbeddingFunction(fake_embed, model_name="test-model", cache=EmbeddingCache(2))
+
+        assert ef(["a", "bb"]) == [[1.0], [2.0]]
+        assert ef(["bb", "ccc", "a"]) == [[2.0], [3.0], [1.0]]
+        assert calls == [["a", "bb"], ["ccc"]]
+
+    def test_mmr_select_prefers_diverse_hits(self):
+        """Test MMR skips a near-duplicate of the top hit when diversity is weighted."""
+        import numpy as np
+        from backend.services.chromadb_service import _mmr_select
+
+        embeddings = np.array([[1.0, 0.0], [0.99, 0.1], [0.0, 1.0]], dtype=np.float32)
+        query_similarity = np.array([0.9, 0.89, 0.5], dtype=np.float32)
+
+        assert _mmr_select(embeddings, query_similarity, 2, 1.0) == [0, 1]
+        assert _mmr_select(embeddings, query_similarity, 2, 0.5) == [0, 2]
@@ -10,7 +10,7 @@ import json
 import uuid
 import pytest
 import asyncio
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, PropertyMock, patch
 from sqlalchemy.orm import Session
 
 from backend.services.coach_service import (
@@ -18,12 +18,16 @@ from backend.services.coach_service import (
     ChatNotAvailableError,
     MaxTurnsExceededError,
     InvalidSelectedMetricsError,
+    coalesce_deltas,
     generate_message_id,
     get_snapshot_context,
     get_chat_history,
     handle_init_greeting,
     increment_chat_turn,
     get_remaining_turns,
+    render_coach_context_cached,
+    render_init_greeting_cached,
+    validate_selected_metrics,
     coach_service,
 )
 from backend.models.chat_message import ChatMessage
@@ -35,11 +39,27 @@ from backend.models.chat_message import ChatMessage
 
 @pytest.fixture
 def mock_openai_client():
-    """Mock OpenAI client for testing."""
-    with patch("backend.services.coach_service.openai.OpenAI") as mock:
+    """Mock AsyncOpenAI client for testing."""
+    with patch("backend.services.coach_service.openai.AsyncOpenAI") as mock:
         yield mock
 
 
+class _AsyncStream:
+    """Async iterable standing in for an AsyncOpenAI streaming response."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
 @pytest.fixture
 def mock_settings():
     """Mock settings for testing."""
@@ -48,6 +68,9 @@ def mock_settings():
         mock.openrouter_api_key = "test-key"
         mock.max_chat_turns = 15
         mock.chat_history_window = 6
+        mock.chat_history_max_tokens = 4000
+        mock.coach_stream_batch_size = 4
+        mock.coach_stream_max_wait_ms = 20
         mock.openrouter_base_url = "https://openrouter.ai/api/v1"
         yield mock
 
@@ -98,6 +121,9 @@ class TestCoachServiceInit:
             assert service.api_key == "default-key"
             assert service.model == "openai/gpt-4o-mini"
             assert service.timeout == 60
+            mock_openai_client.assert_not_called()
+
+            assert service.client is service.client
             mock_openai_client.assert_called_once()
 
     def test_init_with_custom_values(self, mock_openai_client):
@@ -107,6 +133,34 @@ class TestCoachServiceInit:
         assert service.api_key == "custom-key"
         assert service.timeout == 120
 
+    def test_instances_share_async_http_pool(self, mock_openai_client):
+        """Every instance's AsyncOpenAI is built on the same httpx pool."""
+        CoachService(api_key="key-a").client
+        CoachService(api_key="key-b").client
+
+        first, second = mock_openai_client.call_args_list
+        assert first.kwargs["http_client"] is second.kwargs["http_client"]
+
+    def test_client_rebuilt_per_event_loop(self, mock_openai_client):
+        """A new event loop gets a new pool, and the client is rebuilt on it."""
+        import asyncio
+
+        from backend.services.http_client import close_async_http_client
+
+        service = CoachService(api_key="key-a")
+
+        async def use_client():
+            service.client
+            await close_async_http_client()
+
+        asyncio.run(use_client())
+        asyncio.run(use_client())
+
+        first, second = mock_openai_client.call_args_list
+        assert first.kwargs["http_client"] is not second.kwargs["http_client"]
+        assert first.kwargs["http_client"].is_closed
+        assert second.kwargs["http_client"].is_closed
+
 
 # =====================================================
 # Test Snapshot Context Retrieval
@@ -149,6 +203,18 @@ class TestGetSnapshotContext:
 
         assert "not available" in str(exc_info.value)
 
+    def test_check_chat_available(self, coach_service_instance, db_session, make_snapshot):
+        """Projected preflight check accepts active snapshots and rejects the rest."""
+        active = make_snapshot(status="active", chat_turn_count=0)
+        exhausted = make_snapshot(status="active", chat_turn_count=15, max_chat_turns=15)
+
+        coach_service_instance.check_chat_available(db_session, active.id)
+
+        with pytest.raises(MaxTurnsExceededError):
+            coach_service_instance.check_chat_available(db_session, exhausted.id)
+        with pytest.raises(Exception, match="Snapshot not found"):
+            coach_service_instance.check_chat_available(db_session, "nonexistent")
+
 
 # =====================================================
 # Test Chat History Management
@@ -169,7 +235,10 @@ class TestGetChatHistory:
         """Test getting chat history with custom limit."""
         snapshot = make_snapshot()
 
+        from datetime import datetime, timedelta
+
         # Create 3 messages
+        base_time = datetime.now()
         for i in range(3):
             msg = ChatMessage(
                 id=f"msg_test_{i}",
@@ -177,7 +246,8 @@ class TestGetChatHistory:
                 snapshot_id=snapshot.id,
                 role="user" if i % 2 == 0 else "assistant",
                 content=f"Message {i}",
-                is_complete=True
+                is_complete=True,
+                created_at=base_time + timedelta(seconds=i)
             )
             db_session.add(msg)
         db_session.flush()
@@ -186,9 +256,11 @@ class TestGetChatHistory:
             db_session, snapshot.id, limit=2
         )
 
+        # Most recent window, oldest first (AD-4)
         assert len(history) == 2
-        assert history[0]["role"] == "user"
-        assert history[0]["content"] == "Message 0"
+        assert history[0]["role"] == "assistant"
+        assert history[0]["content"] == "Message 1"
+        assert history[1]["content"] == "Message 2"
 
     def test_get_chat_history_default_limit(self, coach_service_instance, db_session, make_snapshot):
         """Test that default limit from settings is used."""
@@ -216,6 +288,69 @@ class TestGetChatHistory:
         assert "snapshot_id" in history[0]
         assert "role" in history[0]
 
+    def test_get_chat_history_for_prompt(self, coach_service_instance, db_session, make_snapshot):
+        """Prompt history holds only role and content of the latest messages."""
+        from datetime import datetime, timedelta
+
+        snapshot = make_snapshot()
+
+        base_time = datetime.now()
+        for i in range(3):
+            msg = ChatMessage(
+                id=f"msg_test_{i}",
+                client_message_id=f"client_{i}",
+                snapshot_id=snapshot.id,
+                role="user" if i % 2 == 0 else "assistant",
+                content=f"Message {i}",
+                is_complete=True,
+                created_at=base_time + timedelta(seconds=i)
+            )
+            db_session.add(msg)
+        db_session.flush()
+
+        history = coach_service_instance.get_chat_history_for_prompt(
+            db_session, snapshot.id, limit=2
+        )
+
+        assert history == [
+            {"role": "assistant", "content": "Message 1"},
+            {"role": "user", "content": "Message 2"},
+        ]
+
+
+    def test_chat_history_for_prompt_token_budget(
+        self, coach_service_instance, db_session, make_snapshot
+    ):
+        """Older messages beyond the token budget are dropped; newest is kept."""
+        from datetime import datetime, timedelta
+
+        snapshot = make_snapshot()
+
+        base_time = datetime.now()
+        for i, tokens in enumerate([300, 300, 500]):
+            msg = ChatMessage(
+                id=f"msg_test_{i}",
+                client_message_id=f"client_{i}",
+                snapshot_id=snapshot.id,
+                role="user",
+                content=f"Message {i}",
+                is_complete=True,
+                token_count=tokens,
+                created_at=base_time + timedelta(seconds=i)
+            )
+            db_session.add(msg)
+        db_session.flush()
+
+        history = coach_service_instance.get_chat_history_for_prompt(
+            db_session, snapshot.id, limit=6, max_tokens=850
+        )
+        assert [m["content"] for m in history] == ["Message 1", "Message 2"]
+
+        history = coach_service_instance.get_chat_history_for_prompt(
+            db_session, snapshot.id, limit=6, max_tokens=100
+        )
+        assert [m["content"] for m in history] == ["Message 2"]
+
 
 class TestIncrementChatTurn:
     """Tests for increment_chat_turn method."""
@@ -373,6 +508,59 @@ class TestSaveAssistantMessage:
         assert msg2.is_complete is True
 
 
+class TestBeginTurn:
+    """Tests for begin_turn single-transaction turn setup."""
+
+    def test_begin_new_turn(self, coach_service_instance, db_session, make_snapshot):
+        """New turn increments the count and saves user message and placeholder."""
+        snapshot = make_snapshot(chat_turn_count=0)
+        client_id = str(uuid.uuid4())
+
+        history = coach_service_instance.begin_turn(
+            db=db_session,
+            snapshot_id=snapshot.id,
+            user_message="Hello",
+            selected_metrics=["truthfulness"],
+            client_message_id=client_id,
+            history_limit=6,
+            is_new_turn=True
+        )
+
+        assert history == [{"role": "user", "content": "Hello"}]
+        db_session.refresh(snapshot)
+        assert snapshot.chat_turn_count == 1
+        placeholder = coach_service_instance.get_existing_assistant_message(
+            db_session, snapshot.id, client_id
+        )
+        assert placeholder.is_complete is False
+
+    def test_begin_turn_tolerates_duplicate_user_message(
+        self, coach_service_instance, db_session, make_snapshot
+    ):
+        """Reconnect with an already-saved user message does not fail."""
+        snapshot = make_snapshot(chat_turn_count=1)
+        client_id = str(uuid.uuid4())
+        coach_service_instance.save_user_message(
+            db=db_session,
+            snapshot_id=snapshot.id,
+            content="Hello",
+            selected_metrics=["truthfulness"],
+            client_message_id=client_id
+        )
+
+        history = coach_service_instance.begin_turn(
+            db=db_session,
+            snapshot_id=snapshot.id,
+            user_message="Hello",
+            selected_metrics=["truthfulness"],
+            client_message_id=client_id,
+            history_limit=6,
+            is_new_turn=False
+        )
+
+        assert history == [{"role": "user", "content": "Hello"}]
+
+
 # =====================================================
 # Test Stream Coach Response (Logic Polish)
 # =====================================================
@@ -399,7 +587,8 @@ class TestStreamCoachResponseLogic:
         db_session.commit()
 
         # Mock the client so we can verify it was NOT called
-        with patch.object(coach_service_instance, "client") as mock_client:
+        with patch.object(CoachService, "client", new_callable=PropertyMock) as client_property:
+            mock_client = client_property.return_value
             chunks = []
             async for chunk in coach_service_instance.stream_coach_response(
                 db=db_session,
@@ -411,7 +600,7 @@ class TestStreamCoachResponseLogic:
                 chunks.append(chunk)
 
             # Should return existing content
-            assert any("Existing complete answer" in c for c in chunks)
+            assert any(b"Existing complete answer" in c for c in chunks)
             # Should NOT call LLM
             mock_client.chat.completions.create.assert_not_called()
 
@@ -437,10 +626,9 @@ class TestStreamCoachResponseLogic:
         mock_chunk = Mock()
         mock_chunk.choices = [Mock()]
         mock_chunk.choices[0].delta.content = "Restarted answer"
-        mock_response = Mock()
-        mock_response.__iter__ = Mock(return_value=iter([mock_chunk]))
-        
-        with patch.object(coach_service_instance.client.chat.completions, "create", return_value=mock_response):
+        mock_create = AsyncMock(return_value=_AsyncStream([mock_chunk]))
+
+        with patch.object(coach_service_instance.client.chat.completions, "create", mock_create):
             async for _ in coach_service_instance.stream_coach_response(
                 db=db_session,
                 snapshot_id=snapshot.id,
@@ -456,6 +644,90 @@ class TestStreamCoachResponseLogic:
             assert updated_msg.is_complete is True
 
 
+class TestValidateSelectedMetrics:
+    """Tests for selected metric validation."""
+
+    def test_valid_slugs_pass(self):
+        """Known slugs are accepted."""
+        validate_selected_metrics(["truthfulness", "clarity"])
+
+    def test_invalid_slugs_reported_together(self):
+        """All unknown slugs are reported in one error."""
+        with pytest.raises(InvalidSelectedMetricsError, match=r"\['accuracy', 'speed'\]"):
+            validate_selected_metrics(["speed", "truthfulness", "accuracy"])
+
+
+class TestInitGreetingRenderCache:
+    """Tests for the init greeting render cache."""
+
+    def test_render_reused_until_snapshot_content_changes(self, make_snapshot):
+        """Same snapshot content renders once; changed scores re-render."""
+        snapshot = make_snapshot()
+        with patch(
+            "backend.services.coach_service.render_coach_init_greeting",
+            return_value="greeting",
+        ) as mock_render:
+            render_init_greeting_cached(snapshot, ["truthfulness"])
+            render_init_greeting_cached(snapshot, ["truthfulness"])
+            assert mock_render.call_count == 1
+
+            snapshot.judge_scores_json = {"truthfulness": {"score": 1, "rationale": "Wrong"}}
+            render_init_greeting_cached(snapshot, ["truthfulness"])
+            assert mock_render.call_count == 2
+
+    def test_coach_context_survives_turn_increment(
+        self, coach_service_instance, db_session, make_snapshot
+    ):
+        """A chat turn bumps updated_at (trigger) but must not miss the cache."""
+        snapshot = make_snapshot(chat_turn_count=0)
+        with patch(
+            "backend.services.coach_service.render_coach_static_context",
+            return_value={"question": "q"},
+        ) as mock_render:
+            render_coach_context_cached(snapshot, ["truthfulness"])
+
+            updated_at_before = snapshot.updated_at
+            assert coach_service_instance.increment_chat_turn(db_session, snapshot.id)
+            db_session.refresh(snapshot)
+            assert snapshot.updated_at != updated_at_before
+
+            render_coach_context_cached(snapshot, ["truthfulness"])
+            assert mock_render.call_count == 1
+
+    def test_coach_context_formatted_once_per_metrics(self, make_snapshot):
+        """Static user-prompt context is reused across turns, keyed by metrics."""
+        snapshot = make_snapshot()
+        with patch(
+            "backend.services.coach_service.render_coach_static_context",
+            return_value={"question": "q"},
+        ) as mock_render:
+            first = render_coach_context_cached(snapshot, ["truthfulness"])
+            second = render_coach_context_cached(snapshot, ["truthfulness"])
+            render_coach_context_cached(snapshot, ["clarity"])
+
+            assert first is second
+            assert mock_render.call_count == 2
+
+
+class TestCoalesceDeltas:
+    """Tests for SSE token coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_batches_by_size_and_flushes_remainder(self, mock_settings):
+        """Tokens are grouped by batch size; the tail is flushed at stream end."""
+        mock_settings.coach_stream_max_wait_ms = 60_000
+        chunks = []
+        for token in ["a", "b", None, "c", "d", "e"]:
+            chunk = Mock()
+            chunk.choices = [Mock()]
+            chunk.choices[0].delta.content = token
+            chunks.append(chunk)
+
+        batches = [text async for text in coalesce_deltas(_AsyncStream(chunks))]
+
+        assert batches == ["abcd", "e"]
+
+
 # =====================================================
 # Test Global Service Instance
 # =====================================================
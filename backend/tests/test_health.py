@@ -95,3 +95,19 @@ def test_info_endpoint_development(test_client):
     assert "models" in data
     assert "cors_origins" in data
     assert "logging" in data
+
+
+def test_shutdown_keeps_shared_http_client_open(db_session):
+    """Test that an app shutdown does not close the client captured by service singletons."""
+    from fastapi.testclient import TestClient
+
+    from backend.main import app
+    from backend.services.http_client import get_http_client
+
+    shared = get_http_client()
+
+    with TestClient(app=app):
+        pass
+
+    assert not shared.is_closed
+    assert get_http_client() is shared
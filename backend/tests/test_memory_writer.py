@@ -0,0 +1,64 @@
+"""
+Unit tests for the ChromaDB memory writer (backend.tasks.memory_writer)
+
+Tests are organized by:
+- Enqueue fallback (writer not running, stopping, loop closed)
+- Shutdown flushes every accepted pair
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from backend.tasks import memory_writer
+from backend.tasks.memory_writer import (
+    enqueue_memory_write,
+    start_memory_writer,
+    stop_memory_writer,
+)
+
+
+# =====================================================
+# Enqueue Fallback Tests (Unit)
+# =====================================================
+
+
+def test_enqueue_without_writer_returns_false():
+    """Test enqueue asks for the synchronous fallback when no writer runs"""
+    assert enqueue_memory_write("eval_a", "judge_a") is False
+
+
+def test_enqueue_returns_false_when_loop_closes():
+    """Test a loop closed under the enqueue falls back instead of raising"""
+    loop = MagicMock()
+    loop.is_closed.return_value = False
+    loop.call_soon_threadsafe.side_effect = RuntimeError("Event loop is closed")
+
+    with patch.object(memory_writer, "_queue", asyncio.Queue()), \
+            patch.object(memory_writer, "_loop", loop):
+        assert enqueue_memory_write("eval_a", "judge_a") is False
+
+
+# =====================================================
+# Shutdown Tests (Unit)
+# =====================================================
+
+
+def test_stop_flushes_pairs_queued_from_threads():
+    """Test pairs accepted before stop are written and later ones fall back"""
+    flushed = []
+
+    async def run_writer():
+        start_memory_writer()
+        accepted = await asyncio.gather(*(
+            asyncio.to_thread(enqueue_memory_write, f"eval_{i}", f"judge_{i}")
+            for i in range(3)
+        ))
+        await stop_memory_writer()
+        return accepted
+
+    with patch.object(memory_writer, "_flush_batch", side_effect=flushed.extend):
+        accepted = asyncio.run(run_writer())
+
+    assert accepted == [True, True, True]
+    assert sorted(flushed) == [(f"eval_{i}", f"judge_{i}") for i in range(3)]
+    assert enqueue_memory_write("eval_late", "judge_late") is False
@@ -0,0 +1,80 @@
+"""
+Unit tests for the question pool usage buffer (backend.tasks.pool_usage)
+
+Tests are organized by:
+- PoolUsageBuffer aggregation (unit, no database required)
+- flush_pool_usage failure handling (unit, engine mocked)
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from backend.tasks.pool_usage import PoolUsageBuffer, flush_pool_usage, pool_usage_buffer
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+# =====================================================
+# Fixtures
+# =====================================================
+
+
+@pytest.fixture
+def empty_pool_usage_buffer():
+    """Yield the module-global buffer empty and drain it again afterwards."""
+    pool_usage_buffer.drain()
+    yield pool_usage_buffer
+    pool_usage_buffer.drain()
+
+
+# =====================================================
+# Usage Buffer Tests (Unit)
+# =====================================================
+
+
+def test_pool_usage_buffer_aggregates_selections():
+    """Test buffered pool selections collapse into one row per question"""
+    buffer = PoolUsageBuffer()
+
+    buffer.add("q_a", T0)
+    buffer.add("q_b", T0)
+    assert buffer.add("q_a", T0 + timedelta(seconds=5)) == 2
+
+    rows = sorted(buffer.drain())
+    assert rows == [
+        ("q_a", 2, T0, T0 + timedelta(seconds=5)),
+        ("q_b", 1, T0, T0),
+    ]
+    assert len(buffer) == 0
+
+
+def test_pool_usage_buffer_pending_ids():
+    """Test pending IDs are reported until the buffer is drained"""
+    buffer = PoolUsageBuffer()
+
+    buffer.add("q_a", T0)
+    buffer.add("q_b", T0)
+    assert buffer.pending_ids() == {"q_a", "q_b"}
+
+    buffer.drain()
+    assert buffer.pending_ids() == frozenset()
+
+
+# =====================================================
+# Flush Tests (Unit)
+# =====================================================
+
+
+def test_pool_usage_flush_failure_keeps_batch(empty_pool_usage_buffer):
+    """Test a failed flush puts the drained rows back for the next flush"""
+    empty_pool_usage_buffer.add("q_a", T0)
+
+    with patch("backend.tasks.pool_usage.engine") as mock_engine:
+        mock_engine.begin.side_effect = Exception("connection lost")
+        assert flush_pool_usage() == 0
+
+    # Selections recorded after the failed drain merge with the restored row
+    empty_pool_usage_buffer.add("q_a", T0 + timedelta(seconds=5))
+    assert empty_pool_usage_buffer.drain() == [("q_a", 2, T0, T0 + timedelta(seconds=5))]
@@ -0,0 +1,179 @@
+"""
+Questions Router Tests
+
+Tests for the /api/questions endpoints including:
+- Pool statistics buckets (total, per metric, category, difficulty)
+- Pool statistics cache invalidation after question generation
+
+Uses pytest fixtures from conftest.py for database setup.
+"""
+
+import asyncio
+import secrets
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from backend.models.database import get_async_db, get_db
+from backend.models.question import Question
+from backend.routers.questions import invalidate_pool_stats_cache, router
+from backend.services.claude_service import get_claude_service
+
+
+# =====================================================
+# Fixtures
+# =====================================================
+
+@pytest.fixture(scope="function")
+def questions_test_client(db_session, test_database_url):
+    """
+    Create test client with sync and async database overrides.
+
+    The pool stats endpoint reads through an asyncpg session on the test
+    database, so rows must be committed through db_session to be visible.
+
+    Args:
+        db_session: Database session from conftest.py
+        test_database_url: Test database URL from conftest.py
+
+    Yields:
+        TestClient instance
+    """
+    async_engine = create_async_engine(
+        test_database_url.replace("postgresql://", "postgresql+asyncpg://", 1),
+        poolclass=NullPool
+    )
+    async_session_factory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/questions", tags=["questions"])
+
+    def override_get_db():
+        yield db_session
+
+    async def override_get_async_db():
+        async with async_session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    invalidate_pool_stats_cache()
+    yield TestClient(app)
+    invalidate_pool_stats_cache()
+
+    asyncio.run(async_engine.dispose())
+
+
+@pytest.fixture
+def make_question(db_session):
+    """
+    Create and commit a Question for pool statistics tests.
+
+    Args:
+        db_session: Database session fixture
+
+    Returns:
+        Function that creates Question objects
+    """
+    def _create(**kwargs):
+        data = {
+            "id": f"q_test_{secrets.token_hex(6)}",
+            "question": "Test question?",
+            "category": "Math",
+            "difficulty": "medium",
+            "reference_answer": "Test reference",
+            "expected_behavior": "Test behavior",
+            "rubric_breakdown": {"1": "bad", "5": "excellent"},
+            "primary_metric": "Truthfulness",
+            "bonus_metrics": [],
+            "question_prompt_id": None,
+            "times_used": 0,
+        }
+        data.update(kwargs)
+
+        question = Question(**data)
+        db_session.add(question)
+        db_session.commit()
+        return question
+
+    return _create
+
+
+# =====================================================
+# Test GET /api/questions/pool/stats
+# =====================================================
+
+class TestPoolStats:
+    """Tests for GET /api/questions/pool/stats endpoint."""
+
+    def test_pool_stats_empty(self, questions_test_client):
+        """Empty pool returns zero totals and empty buckets."""
+        response = questions_test_client.get("/api/questions/pool/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_questions"] == 0
+        assert data["by_metric"] == {}
+        assert data["by_category"] == {}
+        assert data["by_difficulty"] == {}
+        assert data["avg_times_used"] == 0.0
+
+    def test_pool_stats_buckets(self, questions_test_client, make_question):
+        """Total and per-metric/category/difficulty buckets come from one aggregation."""
+        make_question(primary_metric="Truthfulness", category="Math", difficulty="easy", times_used=1)
+        make_question(primary_metric="Truthfulness", category="Physics", difficulty="easy", times_used=2)
+        make_question(primary_metric="Clarity", category="Math", difficulty="hard", times_used=6)
+
+        response = questions_test_client.get("/api/questions/pool/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_questions"] == 3
+        assert data["by_metric"] == {"Truthfulness": 2, "Clarity": 1}
+        assert data["by_category"] == {"Math": 2, "Physics": 1}
+        assert data["by_difficulty"] == {"easy": 2, "hard": 1}
+        assert data["avg_times_used"] == pytest.approx(3.0)
+
+    def test_pool_stats_invalidated_after_generation(
+        self,
+        questions_test_client,
+        make_question
+    ):
+        """Cached stats are served until a question is generated, then re-aggregated."""
+        first = make_question()
+
+        response = questions_test_client.get("/api/questions/pool/stats")
+        assert response.json()["total_questions"] == 1
+
+        # A row added behind the cache's back is not visible yet
+        make_question(primary_metric="Clarity")
+        response = questions_test_client.get("/api/questions/pool/stats")
+        assert response.json()["total_questions"] == 1
+
+        claude_service = MagicMock()
+        claude_service.generate_question.return_value = first
+        questions_test_client.app.dependency_overrides[get_claude_service] = lambda: claude_service
+
+        with patch("backend.routers.questions.model_service") as mock_model_service:
+            mock_model_service.select_model.return_value = "openai/gpt-3.5-turbo"
+            mock_model_service.answer_question.return_value = SimpleNamespace(
+                id="resp_test",
+                response_text="Test answer",
+                model_name="openai/gpt-3.5-turbo"
+            )
+            generate_response = questions_test_client.post(
+                "/api/questions/generate",
+                json={"primary_metric": "Truthfulness", "use_pool": True}
+            )
+        assert generate_response.status_code == 200
+
+        response = questions_test_client.get("/api/questions/pool/stats")
+        data = response.json()
+        assert data["total_questions"] == 2
+        assert data["by_metric"] == {"Truthfulness": 1, "Clarity": 1}
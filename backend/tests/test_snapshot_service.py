@@ -591,6 +591,54 @@ class TestGetAndListSnapshots:
         assert total3 == 5
         assert len(snapshots3) == 1
 
+    def test_list_snapshots_keyset_cursor(
+        self,
+        db_session: Session,
+        make_snapshot
+    ):
+        """Test that cursor pages continue after 'before' and skip the total."""
+        from datetime import datetime, timedelta
+
+        base = datetime(2026, 1, 1, 12, 0, 0)
+        for i in range(5):
+            make_snapshot(created_at=base + timedelta(minutes=i))
+
+        first, total = list_snapshots(db_session, limit=2)
+        assert total == 5
+        assert [s.created_at for s in first] == [
+            base + timedelta(minutes=4), base + timedelta(minutes=3)
+        ]
+
+        second, cursor_total = list_snapshots(
+            db_session, limit=2, before=first[-1].created_at
+        )
+        assert cursor_total is None
+        assert [s.created_at for s in second] == [
+            base + timedelta(minutes=2), base + timedelta(minutes=1)
+        ]
+
+    def test_list_snapshots_keyset_cursor_with_tie(
+        self,
+        db_session: Session,
+        make_snapshot
+    ):
+        """Test that snapshots sharing created_at across a page boundary are not skipped."""
+        from datetime import datetime
+
+        tied_at = datetime(2026, 1, 1, 12, 0, 0)
+        ids = ["snap_tie_a", "snap_tie_b", "snap_tie_c"]
+        for snapshot_id in ids:
+            make_snapshot(id=snapshot_id, created_at=tied_at)
+
+        first, total = list_snapshots(db_session, limit=2)
+        assert total == 3
+        assert [s.id for s in first] == ["snap_tie_c", "snap_tie_b"]
+
+        second, _ = list_snapshots(
+            db_session, limit=2, before=first[-1].created_at, before_id=first[-1].id
+        )
+        assert [s.id for s in second] == ["snap_tie_a"]
+
     def test_list_snapshots_excludes_soft_deleted(
         self,
         db_session: Session,
@@ -115,6 +115,34 @@ class TestListSnapshots:
         assert len(data2["items"]) == 2
         assert data2["page"] == 2
 
+    def test_list_snapshots_keyset_cursor_with_tie(self, snapshot_test_client, make_snapshot):
+        """next_before/next_before_id page through snapshots sharing a timestamp."""
+        tied_at = datetime(2026, 1, 1, 12, 0, 0)
+        for snapshot_id in ["snap_tie_a", "snap_tie_b", "snap_tie_c"]:
+            make_snapshot(id=snapshot_id, created_at=tied_at)
+
+        response = snapshot_test_client.get("/api/snapshots/?limit=2")
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == ["snap_tie_c", "snap_tie_b"]
+        assert data["next_before_id"] == "snap_tie_b"
+        assert data["next_before"] is not None
+
+        response2 = snapshot_test_client.get(
+            "/api/snapshots/",
+            params={
+                "limit": 2,
+                "before": data["next_before"],
+                "before_id": data["next_before_id"],
+            }
+        )
+        assert response2.status_code == 200
+        data2 = response2.json()
+        assert [item["id"] for item in data2["items"]] == ["snap_tie_a"]
+        assert data2["total"] is None
+        assert data2["next_before"] is None
+        assert data2["next_before_id"] is None
+
     def test_list_snapshots_limit_validation(self, snapshot_test_client):
         """Limit validation rejects invalid values."""
         # limit < 1